@@ -1,78 +1,430 @@
 import simpy
 import random
+import numpy as np
+import os
+import hashlib
+import math
+import json
+import zipfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from process_generation import generate_processes
+from ready_queue import OrderStatisticReadyQueue
+from event_trace import NULL_TRACE, TRACE_INFO, TRACE_DEBUG, DECISION, COMPLETION
+from simulation_events import ArrivalSignal, arrival_feeder, arrivals_in_order, wait_for_arrival
+from multicore import build_cores, CoreTracer
+
+# -------------------------------
+# State Discretization
+# -------------------------------
+class StateDiscretizer:
+    """
+    Maps the raw queue features (queue length, average remaining time, average waiting time,
+    minimum remaining time) to bucket indices of a fixed-size Q table.
+    The queue length is clipped to max_queue, which is also the number of actions (the agent
+    picks one of the max_queue shortest jobs), so the first index doubles as the number of
+    valid actions. The other features are bucketed with bisect on the given edges.
+    """
+    def __init__(self, max_queue=8,
+                 rem_edges=(2, 3, 4, 5, 6, 7, 8, 9, 10),
+                 wait_edges=(1, 2, 4, 8, 16, 32, 64, 128),
+                 min_rem_edges=(2, 3, 4, 5, 6, 7, 8, 9, 10)):
+        self.max_queue = max_queue
+        self.rem_edges = tuple(rem_edges)
+        self.wait_edges = tuple(wait_edges)
+        self.min_rem_edges = tuple(min_rem_edges)
+        self.shape = (max_queue + 1, len(self.rem_edges) + 1, len(self.wait_edges) + 1, len(self.min_rem_edges) + 1)
+
+    def __call__(self, qlen, avg_rem, avg_wait, min_rem):
+        return (min(qlen, self.max_queue),
+                bisect_right(self.rem_edges, avg_rem),
+                bisect_right(self.wait_edges, avg_wait),
+                bisect_right(self.min_rem_edges, min_rem))
+
+    def batch(self, qlen, avg_rem, avg_wait, min_rem):
+        """
+        Vectorized __call__ over arrays of features; an empty queue (qlen 0) maps to the
+        all-zero state, as in MLSchedulerAgent.get_state.
+        """
+        qlen = np.asarray(qlen)
+        nonempty = qlen > 0
+        return (np.minimum(qlen, self.max_queue),
+                np.searchsorted(self.rem_edges, avg_rem, side="right") * nonempty,
+                np.searchsorted(self.wait_edges, avg_wait, side="right") * nonempty,
+                np.searchsorted(self.min_rem_edges, min_rem, side="right") * nonempty)
+
+# -------------------------------
+# Ready Queue with Running Feature Aggregates
+# -------------------------------
+class MLReadyQueue(OrderStatisticReadyQueue):
+    """
+    Ready queue of the ML scheduler, ordered by remaining time so the agent's k-th shortest
+    job is selected in O(log n). It also maintains the aggregates behind the agent's state
+    features (count, sum of remaining times, sum of arrival times) on every push and remove,
+    so the features are available in constant time regardless of queue depth.
+    """
+    def __init__(self):
+        super().__init__(key=lambda p: p.remaining)
+        self.sum_remaining = 0
+        self.sum_arrival = 0
+
+    def push(self, proc):
+        super().push(proc)
+        self.sum_remaining += proc.remaining
+        self.sum_arrival += proc.arrival
+
+    def remove(self, proc):
+        super().remove(proc)
+        self.sum_remaining -= proc.remaining
+        self.sum_arrival -= proc.arrival
+
+    def min_remaining(self):
+        return self.peek().remaining
 
 # -------------------------------
 # ML Scheduler Agent with Q-Learning
 # -------------------------------
 class MLSchedulerAgent:
     def __init__(self, alpha=0.1, gamma=0.99, epsilon=0.2,
-                 epsilon_decay=0.995, min_epsilon=0.01):
+                 epsilon_decay=0.995, min_epsilon=0.01, discretizer=None, seed=None):
         self.alpha = alpha
         self.gamma = gamma
         self.epsilon = epsilon
         self.epsilon_decay = epsilon_decay
         self.min_epsilon = min_epsilon
-        self.Q = {}
+        self.discretizer = discretizer or StateDiscretizer()
+        self.num_actions = self.discretizer.max_queue
+        # Dense Q table indexed by discretized state + action, so memory is fixed up front
+        self.Q = np.zeros(self.discretizer.shape + (self.num_actions,))
+        # Private exploration stream, reseeded per training episode and saved with the agent
+        self.random = random.Random(seed)
 
     def get_state(self, ready_queue, current_time):
         if not ready_queue:
             return (0, 0, 0, 0)
 
-        rems = [p.remaining for p in ready_queue]
-        arrivals = [p.arrival for p in ready_queue]
-        wait_times = [current_time - p.arrival for p in ready_queue]
-
+        # Constant-time features from the aggregates kept by MLReadyQueue
         qlen = len(ready_queue)
-        avg_rem = sum(rems) / qlen
-        avg_wait = sum(wait_times) / qlen
-        min_rem = min(rems)
-
-        # Return a tuple that uniquely represents this state
-        return (qlen, int(avg_rem), int(avg_wait), min_rem)
-
+        avg_rem = ready_queue.sum_remaining / qlen
+        avg_wait = (qlen * current_time - ready_queue.sum_arrival) / qlen
+        min_rem = ready_queue.min_remaining()
 
+        # Return the bucket indices of this state in the Q table
+        return self.discretizer(qlen, avg_rem, avg_wait, min_rem)
 
     def choose_action(self, state, num_actions):
         if num_actions == 0:
             return None
-        if random.random() < self.epsilon:
-            return random.randrange(num_actions)
-        q_vals = [self.Q.get((state, a), 0.0) for a in range(num_actions)]
-        return q_vals.index(max(q_vals))
-
+        # Only the num_actions shortest jobs are candidates
+        num_actions = min(num_actions, self.num_actions)
+        if self.random.random() < self.epsilon:
+            return self.random.randrange(num_actions)
+        return int(np.argmax(self.Q[state][:num_actions]))
 
     def learn(self, state, action, reward, next_state):
-        old = self.Q.get((state, action), 0.0)
-        num_actions = next_state[0] # Since state = (queue_length, avg_rem, avg_wait, min_rem)
+        num_actions = next_state[0] # Queue length bucket = number of valid actions in next_state
         if num_actions > 0:
-            future = max(self.Q.get((next_state, a), 0.0) for a in range(num_actions))
+            future = self.Q[next_state][:num_actions].max()
         else:
             future = 0.0
-        self.Q[(state, action)] = old + self.alpha*(reward + self.gamma*future - old)
+        index = state + (action,)
+        old = self.Q[index]
+        self.Q[index] = old + self.alpha*(reward + self.gamma*future - old)
 
     def train(self, episodes=500, num_procs=5):
         for ep in range(episodes):
             procs = generate_processes(num_procs, seed=ep)
+            self.random.seed(ep)
             _ = run_simulation_ml(procs, scheduler_ml, self)
             self.epsilon = max(self.min_epsilon, self.epsilon * self.epsilon_decay)
         print("Training completed.")
 
+    def save(self, path):
+        """
+        Saves the Q table, hyperparameters, discretizer and exploration RNG state to path as an
+        uncompressed .npz archive, so load() can memory-map the Q table. The file is written under a temporary
+        name and renamed, so a concurrent reader never sees a partial file.
+        """
+        d = self.discretizer
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, Q=self.Q, alpha=self.alpha, gamma=self.gamma, epsilon=self.epsilon,
+                     epsilon_decay=self.epsilon_decay, min_epsilon=self.min_epsilon, max_queue=d.max_queue,
+                     rem_edges=np.asarray(d.rem_edges), wait_edges=np.asarray(d.wait_edges),
+                     min_rem_edges=np.asarray(d.min_rem_edges),
+                     rng_state=np.asarray(self.random.getstate()[1], dtype=np.int64))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        """
+        Loads an agent written by save(). With mmap_mode ("r" or "c", as for np.load) the Q
+        table is memory-mapped from the archive instead of read into memory; use "c" to keep
+        learning without modifying the file.
+        """
+        with np.load(path) as data:
+            discretizer = StateDiscretizer(int(data["max_queue"]), data["rem_edges"].tolist(),
+                                           data["wait_edges"].tolist(), data["min_rem_edges"].tolist())
+            agent = cls(alpha=float(data["alpha"]), gamma=float(data["gamma"]), epsilon=float(data["epsilon"]),
+                        epsilon_decay=float(data["epsilon_decay"]), min_epsilon=float(data["min_epsilon"]),
+                        discretizer=discretizer)
+            if "rng_state" in data:
+                version, _, gauss_next = agent.random.getstate()
+                agent.random.setstate((version, tuple(data["rng_state"].tolist()), gauss_next))
+            Q = data["Q"] if mmap_mode is None else _memmap_npz_member(path, "Q", mmap_mode)
+        if Q.shape != agent.Q.shape:
+            raise ValueError(f"Q table of shape {Q.shape} does not match the discretizer {agent.Q.shape}")
+        agent.Q = Q
+        return agent
+
+    def freeze(self):
+        """
+        Returns a GreedyPolicy compiled from the current Q table, for evaluation with
+        scheduler_ml_greedy. Later changes to the Q table do not affect the policy.
+        """
+        return GreedyPolicy.from_q_table(self.Q, self.discretizer)
+
+
+# -------------------------------
+# Frozen Greedy Policy
+# -------------------------------
+class GreedyPolicy:
+    """
+    Precomputed greedy action of every discretized state, for inference without exploration
+    or learning. The action of a state is the argmax of its Q values over the valid actions
+    (the first queue-length-bucket ones; ties go to the shorter job), exactly what
+    MLSchedulerAgent.choose_action picks with epsilon = 0. The table is kept as nested lists,
+    which index faster than a NumPy array for a single lookup.
+    """
+    def __init__(self, actions, discretizer):
+        self.actions = np.asarray(actions, dtype=np.int64)
+        self.discretizer = discretizer
+        self._lookup = self.actions.tolist()
+
+    @classmethod
+    def from_q_table(cls, Q, discretizer):
+        actions = np.full(discretizer.shape, -1, dtype=np.int64)
+        # Queue-length bucket k allows the k shortest jobs as actions
+        for k in range(1, discretizer.shape[0]):
+            actions[k] = np.argmax(Q[k, ..., :k], axis=-1)
+        return cls(actions, discretizer)
+
+    def choose(self, ready_queue, current_time):
+        """
+        Returns the index (by remaining time) of the job to run next from a non-empty MLReadyQueue.
+        """
+        qlen = len(ready_queue)
+        d = self.discretizer
+        avg_rem = ready_queue.sum_remaining / qlen
+        avg_wait = (qlen * current_time - ready_queue.sum_arrival) / qlen
+        q, r, w, m = d(qlen, avg_rem, avg_wait, ready_queue.min_remaining())
+        return self._lookup[q][r][w][m]
+
+
+def _memmap_npz_member(path, name, mode):
+    """
+    Memory-maps the array stored as name in the uncompressed .npz archive at path.
+    np.load ignores mmap_mode for archives, but a stored member is a plain .npy file at a
+    fixed offset, so it can be mapped directly.
+    """
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"{name} is compressed in {path} and cannot be memory-mapped")
+    with open(path, "rb") as f:
+        # Local file header: 30 fixed bytes, then the file name and extra field
+        f.seek(info.header_offset + 26)
+        name_len, extra_len = np.frombuffer(f.read(4), dtype="<u2")
+        f.seek(info.header_offset + 30 + int(name_len) + int(extra_len))
+        major, _ = np.lib.format.read_magic(f)
+        read_header = np.lib.format.read_array_header_1_0 if major == 1 else np.lib.format.read_array_header_2_0
+        shape, fortran_order, dtype = read_header(f)
+        offset = f.tell()
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape, offset=offset,
+                     order="F" if fortran_order else "C")
+
 # -------------------------------
-# Arrival Process
+# Experience Replay
 # -------------------------------
-def arrival(env, proc, ready_queue):
-    yield env.timeout(proc.arrival - env.now)
-    ready_queue.append(proc)
-    print(f"Time {env.now}: Process {proc.pid} arrives.")
+class ExperienceReplay:
+    """
+    Fixed-capacity ring buffer of (state, action, reward, next state) transitions held in
+    preallocated NumPy arrays, so mini-batches are sampled and processed without Python loops.
+    Once full, the oldest transitions are overwritten.
+    """
+    def __init__(self, capacity, state_size):
+        self.states = np.zeros((capacity, state_size))
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity)
+        self.next_states = np.zeros((capacity, state_size))
+        self.capacity = capacity
+        self.size = 0
+        self._next = 0
+
+    def add(self, state, action, reward, next_state):
+        self.extend([state], [action], [reward], [next_state])
+
+    def extend(self, states, actions, rewards, next_states):
+        """
+        Adds a block of transitions with one array write per field.
+        """
+        count = len(actions)
+        index = (self._next + np.arange(count)) % self.capacity
+        self.states[index] = states
+        self.actions[index] = actions
+        self.rewards[index] = rewards
+        self.next_states[index] = next_states
+        self._next = (self._next + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def sample(self, rng, batch_size):
+        """
+        Returns (states, actions, rewards, next_states) for batch_size transitions drawn
+        uniformly with replacement.
+        """
+        index = rng.integers(0, self.size, batch_size)
+        return self.states[index], self.actions[index], self.rewards[index], self.next_states[index]
+
+# -------------------------------
+# Linear Q-Function Agent
+# -------------------------------
+def _linear_argmax(rows, state):
+    """
+    Returns the valid action (the first state[0]) with the highest linear Q value, first on ties.
+    rows holds the weights as lists: for 8 actions and 5 weights, plain Python beats a NumPy
+    product on a single state.
+    """
+    _, f1, f2, f3, f4 = state
+    best_action, best = 0, -math.inf
+    for action, (w0, w1, w2, w3, w4) in enumerate(rows[:state[0]]):
+        value = w0 + w1 * f1 + w2 * f2 + w3 * f3 + w4 * f4
+        if value > best:
+            best_action, best = action, value
+    return best_action
+
+
+class LinearQAgent:
+    """
+    Q-learning agent with a linear Q-function over normalized queue features, a drop-in
+    alternative to MLSchedulerAgent for scheduler_ml and run_simulation_ml.
+    The state is (number of valid actions, queue length / max_queue, average remaining time /
+    rem_scale, log(1 + average waiting time) / log(1 + wait_scale), minimum remaining time /
+    rem_scale); Q(s, a) is the dot product of action a's weights with [1, features]. Unlike the
+    Q table, nearby states share what is learned.
+    learn() only appends the transition to a short pending list; every update_every transitions
+    the pending block is written to the replay buffer at once and the weights take one
+    semi-gradient step on a mini-batch of batch_size transitions sampled from it, with TD errors
+    clipped to max_td.
+    """
+    def __init__(self, alpha=0.01, gamma=0.99, epsilon=0.2, epsilon_decay=0.995, min_epsilon=0.01,
+                 max_queue=8, rem_scale=10.0, wait_scale=128.0, batch_size=64, update_every=32,
+                 replay_capacity=50_000, max_td=10.0, seed=None):
+        self.alpha = alpha
+        self.gamma = gamma
+        self.epsilon = epsilon
+        self.epsilon_decay = epsilon_decay
+        self.min_epsilon = min_epsilon
+        self.max_queue = max_queue
+        self.num_actions = max_queue
+        self.rem_scale = rem_scale
+        self.log_wait_scale = math.log1p(wait_scale)
+        self.batch_size = batch_size
+        self.update_every = update_every
+        self.max_td = max_td
+        # Python's generator for the per-decision exploration roll, NumPy's for batch sampling
+        self.random = random.Random(seed)
+        self.rng = np.random.default_rng(seed)
+        # One weight row per action: bias + 4 features
+        self.W = np.zeros((self.num_actions, 5))
+        self._rows = self.W.tolist()
+        self._action_range = np.arange(self.num_actions)
+        self.replay = ExperienceReplay(replay_capacity, 5)
+        self._pending = []
+
+    def get_state(self, ready_queue, current_time):
+        if not ready_queue:
+            return (0, 0.0, 0.0, 0.0, 0.0)
+        qlen = len(ready_queue)
+        avg_rem = ready_queue.sum_remaining / qlen
+        avg_wait = (qlen * current_time - ready_queue.sum_arrival) / qlen
+        return (min(qlen, self.max_queue), min(qlen, self.max_queue) / self.max_queue, avg_rem / self.rem_scale,
+                math.log1p(avg_wait) / self.log_wait_scale, ready_queue.min_remaining() / self.rem_scale)
+
+    def choose_action(self, state, num_actions):
+        if num_actions == 0:
+            return None
+        # Only the num_actions shortest jobs are candidates
+        num_actions = min(num_actions, self.num_actions)
+        if self.random.random() < self.epsilon:
+            return self.random.randrange(num_actions)
+        return _linear_argmax(self._rows, (num_actions,) + state[1:])
+
+    def learn(self, state, action, reward, next_state):
+        self._pending.append((state, action, reward, next_state))
+        if len(self._pending) >= self.update_every:
+            self.replay.extend(*zip(*self._pending))
+            self._pending.clear()
+            if self.replay.size >= self.batch_size:
+                self.update(*self.replay.sample(self.rng, self.batch_size))
+
+    def update(self, states, actions, rewards, next_states):
+        """
+        One vectorized semi-gradient Q-learning step on a batch of transitions.
+        """
+        # Features with the valid-action count replaced by the bias term
+        phi = states.copy()
+        phi[:, 0] = 1.0
+        next_counts = next_states[:, 0]
+        next_phi = next_states.copy()
+        next_phi[:, 0] = 1.0
+        # Best next Q value over each next state's valid actions, 0 for an empty queue
+        next_q = next_phi @ self.W.T
+        next_q[self._action_range >= next_counts[:, None]] = -np.inf
+        future = np.where(next_counts > 0, next_q.max(axis=1), 0.0)
+        one_hot = self._action_range == actions[:, None]
+        q = ((phi @ self.W.T) * one_hot).sum(axis=1)
+        td = np.clip(rewards + self.gamma * future - q, -self.max_td, self.max_td)
+        self.W += (self.alpha / len(td)) * (one_hot.T @ (td[:, None] * phi))
+        self._rows = self.W.tolist()
+
+    def train(self, episodes=500, num_procs=5):
+        for ep in range(episodes):
+            procs = generate_processes(num_procs, seed=ep)
+            # Reseeded per episode like MLSchedulerAgent.train, so training is reproducible
+            self.random.seed(ep)
+            self.rng = np.random.default_rng(ep)
+            _ = run_simulation_ml(procs, scheduler_ml, self)
+            self.epsilon = max(self.min_epsilon, self.epsilon * self.epsilon_decay)
+        print("Training completed.")
+
+    def freeze(self):
+        """
+        Returns a LinearGreedyPolicy with a copy of the current weights, for scheduler_ml_greedy.
+        """
+        return LinearGreedyPolicy(self)
+
+
+class LinearGreedyPolicy:
+    """
+    Frozen greedy policy of a LinearQAgent: picks the valid action with the highest Q value,
+    without exploration or learning.
+    """
+    def __init__(self, agent):
+        self.W = agent.W.copy()
+        self._rows = self.W.tolist()
+        self._get_state = agent.get_state
+
+    def choose(self, ready_queue, current_time):
+        return _linear_argmax(self._rows, self._get_state(ready_queue, current_time))
 
 # -------------------------------
 # ML-Based Scheduler Process using SimPy
 # -------------------------------
-def scheduler_ml(env, ready_queue, completed, total, agent):
+def scheduler_ml(env, ready_queue, completed, total, agent, arrival_signal=None, tracer=NULL_TRACE):
     while len(completed) < total:
-        if not ready_queue:
-            yield env.timeout(1)
+        if not ready_queue and not ready_queue.try_steal():
+            # Nothing to learn from while idle, so sleep until the next arrival
+            yield wait_for_arrival(env, arrival_signal)
             continue
 
         state = agent.get_state(ready_queue, env.now)
@@ -83,25 +435,19 @@ def scheduler_ml(env, ready_queue, completed, total, agent):
             continue
 
         # map to the k-th shortest remaining job
-        sorted_procs = sorted(ready_queue, key=lambda p: p.remaining)
-        proc = sorted_procs[action]
+        proc = ready_queue.select(action)
         ready_queue.remove(proc)
 
         start = env.now
         if proc.start is None:
             proc.start = start
             proc.response = proc.start - proc.arrival
-        proc.timeline.append((start, 0))
-
-        if proc.start is None:
-            proc.start = env.now
-            proc.response = proc.start - proc.arrival
+        proc.record_run(start, 1)
+        if tracer.level >= TRACE_DEBUG:
+            tracer.record(start, proc, DECISION, action)
 
         # run one time unit
         yield env.timeout(1)
-
-        seg_start, seg_len = proc.timeline[-1]
-        proc.timeline[-1] = (seg_start, seg_len + 1)
         proc.remaining -= 1
 
         # reward = - waiting queue length per time step
@@ -112,26 +458,83 @@ def scheduler_ml(env, ready_queue, completed, total, agent):
             proc.waiting = proc.turnaround - proc.burst
             reward += 10  # bonus for finishing
             completed.append(proc)
+            if tracer.level >= TRACE_INFO:
+                tracer.record(env.now, proc, COMPLETION)
         else:
-            ready_queue.append(proc)
+            ready_queue.push(proc)
 
         next_state = agent.get_state(ready_queue, env.now)
         agent.learn(state, action, reward, next_state)
 
+
+def scheduler_ml_greedy(env, ready_queue, completed, total, policy, arrival_signal=None, tracer=NULL_TRACE):
+    """
+    Inference-only ML scheduler running a frozen GreedyPolicy (see MLSchedulerAgent.freeze).
+    Makes the same decisions as scheduler_ml with epsilon = 0 and no learning, but skips the
+    exploration roll, rewards, next-state features and Q updates.
+    """
+    while len(completed) < total:
+        if not ready_queue and not ready_queue.try_steal():
+            yield wait_for_arrival(env, arrival_signal)
+            continue
+
+        action = policy.choose(ready_queue, env.now)
+        proc = ready_queue.select(action)
+        ready_queue.remove(proc)
+
+        start = env.now
+        if proc.start is None:
+            proc.start = start
+            proc.response = proc.start - proc.arrival
+        proc.record_run(start, 1)
+        if tracer.level >= TRACE_DEBUG:
+            tracer.record(start, proc, DECISION, action)
+
+        # run one time unit
+        yield env.timeout(1)
+        proc.remaining -= 1
+
+        if proc.remaining == 0:
+            proc.completion = env.now
+            proc.turnaround = proc.completion - proc.arrival
+            proc.waiting = proc.turnaround - proc.burst
+            completed.append(proc)
+            if tracer.level >= TRACE_INFO:
+                tracer.record(env.now, proc, COMPLETION)
+        else:
+            ready_queue.push(proc)
+
 # -------------------------------
 # Simulation Wrapper
 # -------------------------------
-def run_simulation_ml(process_list, scheduler_func, agent):
-    total = len(process_list)
-    env = simpy.Environment()
-    ready_queue = []
-    completed = []
+def run_simulation_ml(process_list, scheduler_func, agent, event_driven=True, tracer=None, completed=None,
+                      env=None, num_cores=1, placement="global", cores=None, total=None):
+    env = env if env is not None else simpy.Environment()
+    # Completed processes go to a list unless a sink such as metrics.StreamingMetrics is passed in
+    completed = completed if completed is not None else []
+    # Tracing is off unless a trace is passed in, e.g. during training
+    tracer = tracer if tracer is not None else NULL_TRACE
+    # Tables are fed through an argsort of their arrival column, see arrivals_in_order
+    arrivals, total = arrivals_in_order(process_list, total)
+
+    if num_cores > 1:
+        # One scheduler per core, all sharing the agent; see multicore.build_cores
+        placement_queue, core_list = build_cores(env, num_cores, placement, MLReadyQueue, event_driven)
+        env.process(arrival_feeder(env, arrivals, placement_queue, None, tracer))
+        for core in core_list:
+            env.process(scheduler_func(env, core, completed, total, agent, core.signal, CoreTracer(tracer, core.index)))
+        if cores is not None:
+            cores.extend(core_list)
+        env.run()
+        return completed
 
-    # Spawn arrival events
-    for p in process_list:
-        env.process(arrival(env, p, ready_queue))
+    ready_queue = MLReadyQueue()
+    # Idle periods are skipped by waking the scheduler on arrivals instead of polling every time unit
+    arrival_signal = ArrivalSignal(env) if event_driven else None
+    # A single feeder releases the processes in arrival order
+    env.process(arrival_feeder(env, arrivals, ready_queue, arrival_signal, tracer))
     # Spawn scheduler
-    env.process(scheduler_func(env, ready_queue, completed, total, agent))
+    env.process(scheduler_func(env, ready_queue, completed, total, agent, arrival_signal, tracer))
     env.run()
     return completed
 
@@ -141,9 +544,120 @@ def run_simulation_ml(process_list, scheduler_func, agent):
 def train_agent(agent, episodes=100, num_procs=5):
     for ep in range(episodes):
         procs = generate_processes(num_procs, seed=ep)
+        agent.random.seed(ep)
         _ = run_simulation_ml(procs, scheduler_ml, agent)
     print("Training completed.")
 
+# -------------------------------
+# Trained Agent Cache
+# -------------------------------
+# Modules whose code determines the outcome of train_agent
+_TRAINING_SOURCES = ("ML.py", "process_generation.py", "ready_queue.py", "simulation_events.py", "multicore.py")
+
+def agent_cache_key(agent, episodes, num_procs):
+    """
+    Returns the cache key of agent trained by train_agent(agent, episodes, num_procs): a hash
+    of the agent's hyperparameters and discretizer, the training workload (num_procs jobs per
+    episode), the seed schedule (episode e uses workload and exploration seed e) and the
+    source of the training code, so any change to the scheduler or rewards misses the cache.
+    """
+    from result_cache import source_digest
+    d = agent.discretizer
+    params = {
+        "code": source_digest(_TRAINING_SOURCES), "trainer": "train_agent",
+        "alpha": agent.alpha, "gamma": agent.gamma, "epsilon": agent.epsilon,
+        "epsilon_decay": agent.epsilon_decay, "min_epsilon": agent.min_epsilon,
+        "max_queue": d.max_queue, "rem_edges": list(d.rem_edges), "wait_edges": list(d.wait_edges),
+        "min_rem_edges": list(d.min_rem_edges),
+        "num_procs": num_procs, "seeds": [0, episodes],
+    }
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def train_agent_cached(agent, episodes=100, num_procs=5, cache_dir=".agent_cache"):
+    """
+    Trains an untrained agent like train_agent, reusing a previously trained policy from
+    cache_dir when one exists for the same hyperparameters, training workload and seed
+    schedule (see agent_cache_key). On a hit the cached Q table, epsilon and exploration RNG
+    state are copied into agent, which then behaves exactly like a freshly trained one, and
+    training is skipped entirely; on a miss the trained agent is added to the cache.
+    Returns the path of the cached agent.
+    """
+    path = os.path.join(cache_dir, f"agent-{agent_cache_key(agent, episodes, num_procs)}.npz")
+    if os.path.exists(path):
+        cached = MLSchedulerAgent.load(path)
+        agent.Q = cached.Q
+        agent.epsilon = cached.epsilon
+        agent.random.setstate(cached.random.getstate())
+        print(f"Loaded trained agent from {path}.")
+        return path
+    train_agent(agent, episodes=episodes, num_procs=num_procs)
+    os.makedirs(cache_dir, exist_ok=True)
+    agent.save(path)
+    return path
+
+# -------------------------------
+# Parallel Training
+# -------------------------------
+def _train_episodes(agent_params, Q, epsilon, seeds, num_procs):
+    """
+    Runs the given training episodes on a private copy of the agent, normally inside a worker
+    process, and returns the change made to the Q table.
+    """
+    agent = MLSchedulerAgent(**agent_params)
+    agent.Q = Q.copy()
+    agent.epsilon = epsilon
+    for seed in seeds:
+        procs = generate_processes(num_procs, seed=seed)
+        agent.random.seed(seed)
+        run_simulation_ml(procs, scheduler_ml, agent)
+        agent.epsilon = max(agent.min_epsilon, agent.epsilon * agent.epsilon_decay)
+    return agent.Q - Q
+
+
+def train_agent_parallel(agent, episodes=100, num_procs=5, workers=None, sync_interval=10,
+                         merge="average", seed=0):
+    """
+    Trains agent with several worker processes running episodes concurrently.
+    Training proceeds in rounds: every worker starts from a snapshot of the master Q table, runs
+    sync_interval episodes and sends back its Q-value deltas, which are merged into the master
+    table either by averaging the workers' tables (merge="average") or by adding up all deltas
+    (merge="delta"). Episode e always uses workload seed seed + e and the workers are handed
+    consecutive blocks of episodes, so a given (workers, sync_interval, seed) is reproducible.
+    Epsilon decays once per episode as in MLSchedulerAgent.train: every episode, whichever
+    worker runs it, uses the epsilon it would have in sequential training, and after each round
+    the master epsilon has decayed once for every episode the round ran.
+    """
+    if merge not in ("average", "delta"):
+        raise ValueError(f"Unknown merge strategy {merge!r}, expected 'average' or 'delta'")
+    workers = workers or os.cpu_count() or 1
+    agent_params = {
+        "alpha": agent.alpha, "gamma": agent.gamma, "epsilon": agent.epsilon,
+        "epsilon_decay": agent.epsilon_decay, "min_epsilon": agent.min_epsilon,
+        "discretizer": agent.discretizer,
+    }
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        episode = 0
+        while episode < episodes:
+            blocks = []
+            for _ in range(workers):
+                block = list(range(seed + episode, seed + min(episode + sync_interval, episodes)))
+                if block:
+                    blocks.append(block)
+                episode += len(block)
+            # A block starting k episodes into the round starts from epsilon decayed k times.
+            futures = []
+            offset = 0
+            for block in blocks:
+                epsilon = max(agent.min_epsilon, agent.epsilon * agent.epsilon_decay ** offset)
+                futures.append(pool.submit(_train_episodes, agent_params, agent.Q, epsilon, block, num_procs))
+                offset += len(block)
+            deltas = [future.result() for future in futures]
+            scale = 1.0 / len(deltas) if merge == "average" else 1.0
+            agent.Q += scale * np.sum(deltas, axis=0)
+            agent.epsilon = max(agent.min_epsilon, agent.epsilon * agent.epsilon_decay ** offset)
+    print("Training completed.")
+
 # -------------------------------
 # Example Usage
 # -------------------------------
@@ -156,7 +670,7 @@ if __name__ == "__main__":
 
     # Test on new set of processes
     sample_processes = generate_processes(100, seed=42)
-    results_ml = run_simulation_ml(sample_processes, scheduler_ml, agent)
+    results_ml = run_simulation_ml(sample_processes, scheduler_ml_greedy, agent.freeze())
 
     print("\n--- ML-Based Scheduler Results ---")
     for p in sorted(results_ml, key=lambda x: x.pid):
@@ -1,74 +1,132 @@
 #!/bin/python3
+"""
+CPU scheduler simulation: runs the scheduling algorithms on a generated workload and compares them.
 
+Importing this module is cheap; simpy, the schedulers, the ML module and matplotlib are only
+imported by the functions that need them. Run it as a script for the full comparison:
+
+    python -m Simulator                                   # 100 jobs, all algorithms, charts
+    python -m Simulator --jobs 1000 --algorithms fcfs srtf rr --quantum 4 --no-show
+    python -m Simulator --jobs 500 --cores 8 --placement work_stealing --no-plots
+    python -m Simulator --sweep --seeds 100 --loads 0.5 0.9 1.2 --sweep-output sweep.csv
+
+The trained ML agent is cached in .agent_cache (see --agent-cache), so repeated runs with the
+same training setup skip training. The results of every run are cached in .result_cache (see
+--result-cache), so rerunning the same comparison with unchanged code skips the simulations.
+"""
 # Import libraries
-import simpy
+import argparse
+import contextlib
 import copy
-import matplotlib.pyplot as plt
+import io
+import os
 import numpy as np
-import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Final
 
-# Imports for ML scheduling
-from ML import MLSchedulerAgent, train_agent, run_simulation_ml, scheduler_ml
-
 # Imports from project
-from process_generation import generate_processes
-from first_come_first_serve import FirstComeFirstServeScheduler
-from round_robin_scheduler import RoundRobinScheduler
-from shortest_remaining_time_first import ShortestRemainingTimeFirstScheduler
-from shortest_job_first import ShortestJobFirstScheduler
-from priority_scheduler import PriorityScheduler
+from process_generation import generate_processes, ProcessTable
+from event_trace import EventTrace, NULL_TRACE, TRACE_OFF, TRACE_INFO, print_trace
 
 # Set number of processes to generate and evaluate scheduling algorithm
 NUMBER_OF_PROCESSES_GENERATED : Final = 100
 
-# Force output to be unbuffered
-sys.stdout.reconfigure(line_buffering=True)
-
 # -------------------------------
 # Simulation Functions
 # -------------------------------
-def run_simulation(process_list, scheduler_class, **scheduler_kwargs):
-    # -------------------------------
-    # Arrival Process
-    # -------------------------------
-    def arrival(env, proc, ready_queue):
-        """Wait until process arrival and then add it to the ready queue."""
-        yield env.timeout(proc.arrival - env.now)
-        ready_queue.append(proc)
-        print(f"Time {env.now}: Process {proc.pid} arrives.")
-
-    total = len(process_list)
-    env = simpy.Environment()
-    ready_queue = []
-    completed = []
-    # Spawn arrival processes for each process.
-    for p in process_list:
-        env.process(arrival(env, p, ready_queue))
+def run_simulation(process_list, scheduler_class, event_driven=True, tracer=None, completed=None, env=None,
+                   num_cores=1, placement="global", cores=None, total=None, **scheduler_kwargs):
+    """
+    Simulates process_list under scheduler_class and returns the completed processes.
+    With event_driven=True the scheduler sleeps until the next arrival instead of polling
+    the ready queue every time unit, so the simulation cost scales with the number of
+    scheduling decisions rather than with simulated time.
+    Events are recorded into tracer (an EventTrace) when given; tracing is off otherwise.
+    Arrivals are released by a single feeder process in arrival order: a ProcessTable is fed
+    through an argsort of its arrival column, an iterable already sorted by arrival time is fed
+    as is when its length is passed as total, and a list is sorted first.
+    Completed processes are collected in completed, a new list by default; pass a
+    metrics.StreamingMetrics to keep only running statistics instead of the processes.
+    The simulation runs in env when given (e.g. an instrumented environment), otherwise in a new one.
+    With num_cores > 1 every core runs its own scheduler instance and placement (see
+    multicore.PLACEMENTS) decides which run queue an arriving process joins; the cores are
+    appended to the cores list when one is passed, for per-core timelines and metrics.
+    """
+    import simpy
+    from simulation_events import ArrivalSignal, arrival_feeder, arrivals_in_order
+    from multicore import build_cores, CoreTracer
+
+    tracer = tracer if tracer is not None else NULL_TRACE
+    env = env if env is not None else simpy.Environment()
+    completed = completed if completed is not None else []
+    # A single feeder releases the processes; the stable order keeps equal arrival times in list order.
+    arrivals, total = arrivals_in_order(process_list, total)
+    if num_cores > 1:
+        placement_queue, core_list = build_cores(env, num_cores, placement, scheduler_class.create_ready_queue,
+                                                 event_driven)
+        # Pushing onto a core wakes it, so the feeder needs no signal of its own.
+        env.process(arrival_feeder(env, arrivals, placement_queue, None, tracer))
+        for core in core_list:
+            scheduler_class(env, core, completed, total, arrival_signal=core.signal,
+                            tracer=CoreTracer(tracer, core.index), **scheduler_kwargs)
+        if cores is not None:
+            cores.extend(core_list)
+        env.run()
+        return completed
+    # Each scheduler declares the ready queue ordering it needs.
+    ready_queue = scheduler_class.create_ready_queue()
+    arrival_signal = ArrivalSignal(env) if event_driven else None
+    env.process(arrival_feeder(env, arrivals, ready_queue, arrival_signal, tracer))
     # Spawn the scheduler process.
-    scheduler_class(env, ready_queue, completed, total, **scheduler_kwargs)
+    scheduler_class(env, ready_queue, completed, total, arrival_signal=arrival_signal, tracer=tracer,
+                    **scheduler_kwargs)
     env.run()
     return completed
 
-# Wrapper functions for each scheduling algorithm.
-def simulate_fcfs(process_list):
-    return run_simulation(copy.deepcopy(process_list), FirstComeFirstServeScheduler)
-
-def simulate_sjf(process_list):
-    return run_simulation(copy.deepcopy(process_list), ShortestJobFirstScheduler)
-
-def simulate_srtf(process_list):
-    return run_simulation(copy.deepcopy(process_list), ShortestRemainingTimeFirstScheduler)
-
-def simulate_priority(process_list):
-    return run_simulation(copy.deepcopy(process_list), PriorityScheduler)
-
-def simulate_rr(process_list, time_quantum):
-    return run_simulation(copy.deepcopy(process_list), RoundRobinScheduler, time_quantum=time_quantum)
+def fresh_copy(process_list):
+    """
+    Returns an independent copy of the workload for one simulation run.
+    A ProcessTable only reallocates its per-run state arrays; a list of Process objects is
+    converted into a ProcessTable instead of being deep-copied, unless the table cannot hold it
+    (fractional times or pids not of the form 'P<number>', see ProcessTable.from_processes).
+    """
+    if isinstance(process_list, ProcessTable):
+        return process_list.fresh_run()
+    try:
+        return ProcessTable.from_processes(process_list)
+    except ValueError:
+        return copy.deepcopy(process_list)
 
-# Wrapper for ML-based scheduler
-def simulate_ml(process_list, agent):
-    return run_simulation_ml(copy.deepcopy(process_list), scheduler_ml, agent)
+# Wrapper functions for each scheduling algorithm.
+def simulate_fcfs(process_list, tracer=None, **cores_kwargs):
+    from first_come_first_serve import FirstComeFirstServeScheduler
+    return run_simulation(fresh_copy(process_list), FirstComeFirstServeScheduler, tracer=tracer, **cores_kwargs)
+
+def simulate_sjf(process_list, tracer=None, **cores_kwargs):
+    from shortest_job_first import ShortestJobFirstScheduler
+    return run_simulation(fresh_copy(process_list), ShortestJobFirstScheduler, tracer=tracer, **cores_kwargs)
+
+def simulate_srtf(process_list, tracer=None, **cores_kwargs):
+    from shortest_remaining_time_first import ShortestRemainingTimeFirstScheduler
+    return run_simulation(fresh_copy(process_list), ShortestRemainingTimeFirstScheduler, tracer=tracer,
+                          **cores_kwargs)
+
+def simulate_priority(process_list, tracer=None, **cores_kwargs):
+    from priority_scheduler import PriorityScheduler
+    return run_simulation(fresh_copy(process_list), PriorityScheduler, tracer=tracer, **cores_kwargs)
+
+def simulate_rr(process_list, time_quantum, tracer=None, **cores_kwargs):
+    from round_robin_scheduler import RoundRobinScheduler
+    return run_simulation(fresh_copy(process_list), RoundRobinScheduler, tracer=tracer, time_quantum=time_quantum,
+                          **cores_kwargs)
+
+# Wrapper for ML-based scheduler; evaluation runs the frozen greedy policy unless learning is requested
+def simulate_ml(process_list, agent, tracer=None, learn=False, **cores_kwargs):
+    from ML import run_simulation_ml, scheduler_ml, scheduler_ml_greedy
+    if learn:
+        return run_simulation_ml(fresh_copy(process_list), scheduler_ml, agent, tracer=tracer, **cores_kwargs)
+    return run_simulation_ml(fresh_copy(process_list), scheduler_ml_greedy, agent.freeze(), tracer=tracer,
+                             **cores_kwargs)
 
 # -------------------------------
 # Utility to Print Results
@@ -90,144 +148,278 @@ def calculate_metrics(processes):
 # -------------------------------
 # Visualization
 # -------------------------------
-def visualize_metrics(results_dict):
-    """Create bar charts for average turnaround time and average wait time."""
-    algorithms = list(results_dict.keys())
-    avg_turnaround_times = [results_dict[alg]['turnaround'] for alg in algorithms]
-    avg_wait_times = [results_dict[alg]['wait'] for alg in algorithms]
-
-    # Create figure with two subplots
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-
-    # Plot average turnaround time
-    ax1.bar(algorithms, avg_turnaround_times)
-    ax1.set_title('Average Turnaround Time')
-    ax1.set_ylabel('Time Units')
-    ax1.tick_params(axis='x', rotation=45)
-
-    # Plot average wait time
-    ax2.bar(algorithms, avg_wait_times)
-    ax2.set_title('Average Wait Time')
-    ax2.set_ylabel('Time Units')
-    ax2.tick_params(axis='x', rotation=45)
-
-    plt.tight_layout()
-    plt.savefig('scheduling_metrics.png')
-    plt.show()
-
-def visualize_gantt(results_dict):
-    """
-    results_dict: { 'FCFS': [proc1,proc2...], 'SJF': [...], ... }
-    each proc.timeline is a list of (start, duration) tuples.
-    """
-    n = len(results_dict)
-    fig, axes = plt.subplots(n, 1, figsize=(12, 2*n), sharex=True)
-    if n == 1: axes = [axes]
-
-    for ax, (alg, procs) in zip(axes, results_dict.items()):
-        # map each PID to a y-row
-        pid_to_row = {p.pid: i for i,p in enumerate(sorted(procs, key=lambda x:int(x.pid[1:])))}
-        for p in procs:
-            row = pid_to_row[p.pid]
-            for (start, length) in p.timeline:
-                ax.broken_barh([(start, length)], (row*10, 9))
-        ax.set_yticks([row*10+4 for row in pid_to_row.values()])
-        ax.set_yticklabels(list(pid_to_row.keys()))
-        ax.set_ylabel(alg)
-    axes[-1].set_xlabel("Time")
-    plt.tight_layout()
-    plt.savefig('gantt_chart.png')
-    plt.show()
+# The charts live in visualization.py, which is only imported (with matplotlib) when a chart is drawn.
+def visualize_metrics(results_dict, **kwargs):
+    import visualization
+    return visualization.visualize_metrics(results_dict, **kwargs)
+
+def visualize_gantt(results_dict, **kwargs):
+    import visualization
+    return visualization.visualize_gantt(results_dict, **kwargs)
 
 # -------------------------------
-# Sample Process List and Simulations
+# Parallel Algorithm Comparison
 # -------------------------------
-print("\n" + "="*50)
-print("Starting CPU Scheduler Simulation")
-print("="*50 + "\n")
-
-# Generate a smaller number of processes for clearer demonstration
-sample_processes = generate_processes(NUMBER_OF_PROCESSES_GENERATED, seed=42)
-
-print("Generated Processes:")
-print("-"*30)
-for p in sample_processes:
-    print(f"Process {p.pid}: Arrival={p.arrival}, Burst={p.burst}, Priority={p.priority}")
-
-print("\n" + "="*50)
-print("Running Simulations")
-print("="*50 + "\n")
-
-# Run simulations for each scheduling algorithm.
-print("Running FCFS...")
-results_fcfs = simulate_fcfs(sample_processes)
-print("\nRunning SJF...")
-results_sjf = simulate_sjf(sample_processes)
-print("\nRunning SRTF...")
-results_srtf = simulate_srtf(sample_processes)
-print("\nRunning Priority...")
-results_prio = simulate_priority(sample_processes)
-print("\nRunning Round Robin...")
-results_rr = simulate_rr(sample_processes, time_quantum=3)
-
-# Initialize and train ML Scheduler Agent
-print("\nRunning ML-based Scheduler Training...")
-agent = MLSchedulerAgent(alpha=0.1, gamma=0.9, epsilon=0.2)
-train_agent(agent, episodes=200, num_procs=len(sample_processes))
-
-# Run ML-based scheduler
-print("\nRunning ML-Based Scheduler...")
-results_ml = simulate_ml(sample_processes, agent)
-
-# Calculate metrics for each algorithm
-metrics = {
-    'FCFS': calculate_metrics(results_fcfs),
-    'SJF': calculate_metrics(results_sjf),
-    'SRTF': calculate_metrics(results_srtf),
-    'Priority': calculate_metrics(results_prio),
-    'Round Robin': calculate_metrics(results_rr),
-    'ML-Based': calculate_metrics(results_ml)
-}
+ALGORITHMS = ('FCFS', 'SJF', 'SRTF', 'Priority', 'Round Robin', 'ML-Based')
 
-# Convert metrics to dictionary format for visualization
-results_dict = {alg: {'turnaround': val[0], 'wait': val[1]} for alg, val in metrics.items()}
+def _comparison_task(algorithm, workload, time_quantum, ml_episodes, ml_agent_kwargs, trace_level,
+                     num_cores=1, placement="global", ml_cache_dir=None):
+    """
+    Runs one algorithm of the comparison, normally inside a worker process.
+    Returns the run's ProcessTable, the completion order as row indices, the captured
+    console output and the recorded trace columns (None when tracing is off), which is all
+    the parent needs to rebuild the completed process list and replay the run's events.
+    The run uses num_cores cores with the given placement (see multicore.PLACEMENTS).
+    The ML agent is taken from (or added to) the trained agent cache in ml_cache_dir when given.
+    """
+    cores_kwargs = {'num_cores': num_cores, 'placement': placement}
+    tracer = EventTrace(level=trace_level) if trace_level > TRACE_OFF else None
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        if algorithm == 'FCFS':
+            completed = simulate_fcfs(workload, tracer=tracer, **cores_kwargs)
+        elif algorithm == 'SJF':
+            completed = simulate_sjf(workload, tracer=tracer, **cores_kwargs)
+        elif algorithm == 'SRTF':
+            completed = simulate_srtf(workload, tracer=tracer, **cores_kwargs)
+        elif algorithm == 'Priority':
+            completed = simulate_priority(workload, tracer=tracer, **cores_kwargs)
+        elif algorithm == 'Round Robin':
+            completed = simulate_rr(workload, time_quantum=time_quantum, tracer=tracer, **cores_kwargs)
+        elif algorithm == 'ML-Based':
+            # Training reseeds per episode, so the trained agent is the same in every worker.
+            from ML import MLSchedulerAgent, train_agent, train_agent_cached
+            agent = MLSchedulerAgent(**ml_agent_kwargs)
+            if ml_cache_dir is not None:
+                train_agent_cached(agent, episodes=ml_episodes, num_procs=len(workload), cache_dir=ml_cache_dir)
+            else:
+                train_agent(agent, episodes=ml_episodes, num_procs=len(workload))
+            completed = simulate_ml(workload, agent, tracer=tracer, **cores_kwargs)
+        else:
+            raise ValueError(f"Unknown algorithm {algorithm!r}, expected one of {ALGORITHMS}")
+    table = completed[0].table if completed else fresh_copy(workload)
+    order = np.array([p.index for p in completed], dtype=np.int64)
+    events = tracer.events() if tracer is not None else None
+    return table, order, log.getvalue(), events
+
+def _run_params(algorithm, time_quantum, ml_episodes, ml_agent_kwargs, trace_level, num_cores, placement):
+    """
+    The parameters a comparison run of algorithm depends on, as part of its result cache key.
+    """
+    params = {'trace_level': trace_level, 'num_cores': num_cores, 'placement': placement}
+    if algorithm == 'Round Robin':
+        params['time_quantum'] = time_quantum
+    elif algorithm == 'ML-Based':
+        params.update(ml_episodes=ml_episodes, ml_agent_kwargs=ml_agent_kwargs)
+    return params
+
+def run_comparison(workload, algorithms=ALGORITHMS, time_quantum=3, ml_episodes=200,
+                   ml_agent_kwargs=None, max_workers=None, parallel=True, echo=True, trace_level=TRACE_OFF,
+                   num_cores=1, placement="global", ml_cache_dir=None, result_cache_dir=None,
+                   result_cache_bytes=None):
+    """
+    Runs each algorithm on its own copy of workload, fanned out over a process pool.
+    Returns {algorithm: completed processes} in the order of algorithms. Every run is
+    independent and deterministic, and the console output and trace events (recorded at
+    trace_level) of each run are printed in algorithm order when echo is set, so the
+    result does not depend on which worker finishes first.
+    Every algorithm runs on num_cores cores with the given placement. With ml_cache_dir the ML
+    agent is trained once and reused from that cache on later runs (see ML.train_agent_cached).
+    With result_cache_dir the outputs of the runs are cached on disk (see result_cache.ResultCache,
+    limited to result_cache_bytes), and runs already in the cache are not simulated again.
+    """
+    workload = fresh_copy(workload)
+    ml_agent_kwargs = ml_agent_kwargs or {'alpha': 0.1, 'gamma': 0.9, 'epsilon': 0.2}
+    args = [(alg, workload, time_quantum, ml_episodes, ml_agent_kwargs, trace_level, num_cores, placement,
+             ml_cache_dir) for alg in algorithms]
+
+    outputs = [None] * len(args)
+    keys = [None] * len(args)
+    cache = None
+    if result_cache_dir is not None:
+        from result_cache import ResultCache, DEFAULT_MAX_BYTES
+        cache = ResultCache(result_cache_dir, result_cache_bytes or DEFAULT_MAX_BYTES)
+        for i, alg in enumerate(algorithms):
+            keys[i] = cache.key(workload, alg, _run_params(alg, time_quantum, ml_episodes, ml_agent_kwargs,
+                                                           trace_level, num_cores, placement))
+            outputs[i] = cache.get(keys[i], workload)
+    missing = [i for i, output in enumerate(outputs) if output is None]
+
+    if parallel and missing:
+        workers = max_workers or min(len(missing), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_comparison_task, *args[i]) for i in missing]
+            for i, future in zip(missing, futures):
+                outputs[i] = future.result()
+    else:
+        for i in missing:
+            outputs[i] = _comparison_task(*args[i])
+    if cache is not None:
+        for i in missing:
+            cache.put(keys[i], *outputs[i])
+
+    results = {}
+    for alg, (table, order, log, events) in zip(algorithms, outputs):
+        if echo:
+            print(f"\nRunning {alg}...")
+            print(log, end="")
+            if events is not None:
+                print_trace(events)
+        results[alg] = [table[i] for i in order]
+    return results
 
-timelines = {
-    'FCFS'          : results_fcfs,
-    'SJF'           : results_sjf,
-    'SRTF'          : results_srtf,
-    'Priority'      : results_prio,
-    'Round Robin'   : results_rr,
-    'ML-Based'      : results_ml,
+# -------------------------------
+# Command Line Interface
+# -------------------------------
+# Command line names of the algorithms
+ALGORITHM_KEYS = {'fcfs': 'FCFS', 'sjf': 'SJF', 'srtf': 'SRTF', 'priority': 'Priority', 'rr': 'Round Robin',
+                  'ml': 'ML-Based'}
+
+# Headings of the detailed results
+ALGORITHM_TITLES = {
+    'FCFS': "First Come First Serve (FCFS)",
+    'SJF': "Shortest Job First (SJF)",
+    'SRTF': "Shortest Remaining Time First (SRTF)",
+    'Priority': "Priority Scheduling",
+    'Round Robin': "Round Robin (Time Quantum = {quantum})",
+    'ML-Based': "ML-Based Scheduler",
 }
 
-visualize_gantt(timelines)
-
-print("\n" + "="*50)
-print("Detailed Results")
-print("="*50 + "\n")
-
-# Print detailed results
-print_results("First Come First Serve (FCFS)", results_fcfs)
-print_results("Shortest Job First (SJF)", results_sjf)
-print_results("Shortest Remaining Time First (SRTF)", results_srtf)
-print_results("Priority Scheduling", results_prio)
-print_results("Round Robin (Time Quantum = 3)", results_rr)
-print_results("ML-Based Scheduler", results_ml)
-
-print("\n" + "="*50)
-print(f"Average Metrics (Num of processes evaluated: {NUMBER_OF_PROCESSES_GENERATED})")
-print("="*50 + "\n")
-# Ensure output format in terminal is perfectly aligned for columns and their respective data
-print(f"{'Algorithm':<15} {'Avg Turnaround':>15} {'Avg Wait':>15}")
-print("-" * 50)
-for alg, (turnaround, wait) in metrics.items():
-    print(f"{alg:<15}\t{turnaround:>8.2f}\t\t{wait:>8.2f}")
-
-print("\n" + "="*50)
-print("Generating Visualization")
-print("="*50 + "\n")
-
-# Visualize the metrics
-visualize_metrics(results_dict)
-print("\nVisualization has been saved as 'scheduling_metrics.png'")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compare CPU scheduling algorithms on a generated workload.")
+    parser.add_argument("--jobs", type=int, default=NUMBER_OF_PROCESSES_GENERATED,
+                        help="number of processes to generate")
+    parser.add_argument("--seed", type=int, default=42, help="workload seed")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHM_KEYS), default=list(ALGORITHM_KEYS),
+                        help="algorithms to compare")
+    parser.add_argument("--quantum", type=int, default=3, help="Round Robin time quantum")
+    parser.add_argument("--ml-episodes", type=int, default=200, help="training episodes of the ML scheduler")
+    parser.add_argument("--agent-cache", default=".agent_cache",
+                        help="directory of cached trained ML agents, reused when the training setup matches")
+    parser.add_argument("--no-agent-cache", action="store_true", help="always retrain the ML agent")
+    parser.add_argument("--result-cache", default=".result_cache",
+                        help="directory of cached simulation results, reused for identical runs")
+    parser.add_argument("--no-result-cache", action="store_true", help="always rerun the simulations")
+    parser.add_argument("--cores", type=int, default=1, help="number of simulated cores")
+    parser.add_argument("--placement", default="global", choices=("global", "least_loaded", "work_stealing"),
+                        help="multi-core placement policy")
+    parser.add_argument("--sequential", action="store_true", help="run the algorithms in this process")
+    parser.add_argument("--gantt", default="gantt_chart.png", help="Gantt chart output path")
+    parser.add_argument("--metrics-chart", default="scheduling_metrics.png", help="metrics chart output path")
+    parser.add_argument("--no-plots", action="store_true", help="skip the charts (matplotlib is not imported)")
+    parser.add_argument("--no-show", action="store_true", help="save the charts without showing them")
+    parser.add_argument("--quiet", action="store_true", help="only print the average metrics")
+    parser.add_argument("--sweep", action="store_true",
+                        help="evaluate over many seeds and loads with confidence intervals instead of one run")
+    parser.add_argument("--seeds", type=int, default=100, help="number of workload seeds of a sweep")
+    parser.add_argument("--loads", type=float, nargs="+", default=None,
+                        help="load factors (mean burst / mean inter-arrival time) of a sweep")
+    parser.add_argument("--sweep-output", default=None, help="write the per-run sweep results to this CSV file")
+    return parser.parse_args(argv)
+
+def run_sweep_main(args, algorithms):
+    """
+    Sweep mode of the command line: runs the algorithms over args.seeds seeds at every load and
+    prints the mean waiting and turnaround times with 95% bootstrap confidence intervals, and
+    each algorithm's paired difference to the first one.
+    """
+    from evaluation import run_sweep, summarize, paired_difference, DEFAULT_LOADS
+    agent = None
+    if 'ML-Based' in algorithms:
+        from ML import MLSchedulerAgent, train_agent, train_agent_cached
+        agent = MLSchedulerAgent(alpha=0.1, gamma=0.9, epsilon=0.2)
+        if args.no_agent_cache:
+            train_agent(agent, episodes=args.ml_episodes, num_procs=args.jobs)
+        else:
+            train_agent_cached(agent, episodes=args.ml_episodes, num_procs=args.jobs, cache_dir=args.agent_cache)
+    loads = tuple(args.loads) if args.loads else DEFAULT_LOADS
+    frame = run_sweep(algorithms, seeds=range(args.seeds), loads=loads, num_jobs=args.jobs,
+                      time_quantum=args.quantum, agent=agent, parallel=not args.sequential)
+    if args.sweep_output:
+        frame.to_csv(args.sweep_output, index=False)
+
+    for metric in ("mean_waiting", "mean_turnaround"):
+        print("\n" + "="*50)
+        print(f"{metric.replace('_', ' ').title()} over {args.seeds} seeds (95% CI)")
+        print("="*50 + "\n")
+        print(summarize(frame, metric).round(2).to_string())
+    if len(algorithms) > 1:
+        print("\n" + "="*50)
+        print(f"Mean Waiting Difference to {algorithms[0]} on the same workloads (95% CI)")
+        print("="*50 + "\n")
+        print(paired_difference(frame, algorithms[0]).round(2).to_string())
+
+def main(argv=None):
+    args = parse_args(argv)
+    algorithms = tuple(ALGORITHM_KEYS[key] for key in args.algorithms)
+    if args.sweep:
+        run_sweep_main(args, algorithms)
+        return
+    verbose = not args.quiet
+
+    if verbose:
+        print("\n" + "="*50)
+        print("Starting CPU Scheduler Simulation")
+        print("="*50 + "\n")
+
+    sample_processes = generate_processes(args.jobs, seed=args.seed)
+
+    if verbose:
+        print("Generated Processes:")
+        print("-"*30)
+        for p in sample_processes:
+            print(f"Process {p.pid}: Arrival={p.arrival}, Burst={p.burst}, Priority={p.priority}")
+
+        print("\n" + "="*50)
+        print("Running Simulations")
+        print("="*50 + "\n")
+
+    # Columnar copy of the workload; each simulation only reallocates its run state.
+    workload = ProcessTable.from_processes(sample_processes)
+
+    # Run every scheduling algorithm (including ML training) in parallel worker processes.
+    results = run_comparison(workload, algorithms=algorithms, time_quantum=args.quantum,
+                             ml_episodes=args.ml_episodes, parallel=not args.sequential, echo=verbose,
+                             trace_level=TRACE_INFO if verbose else TRACE_OFF, num_cores=args.cores,
+                             placement=args.placement,
+                             ml_cache_dir=None if args.no_agent_cache else args.agent_cache,
+                             result_cache_dir=None if args.no_result_cache else args.result_cache)
+
+    # Calculate metrics for each algorithm
+    metrics = {alg: calculate_metrics(completed) for alg, completed in results.items()}
+
+    # Convert metrics to dictionary format for visualization
+    results_dict = {alg: {'turnaround': val[0], 'wait': val[1]} for alg, val in metrics.items()}
+
+    if not args.no_plots:
+        visualize_gantt(results, path=args.gantt, show=not args.no_show)
+
+    if verbose:
+        print("\n" + "="*50)
+        print("Detailed Results")
+        print("="*50 + "\n")
+
+        # Print detailed results
+        for alg, completed in results.items():
+            print_results(ALGORITHM_TITLES[alg].format(quantum=args.quantum), completed)
+
+    print("\n" + "="*50)
+    print(f"Average Metrics (Num of processes evaluated: {args.jobs})")
+    print("="*50 + "\n")
+    # Ensure output format in terminal is perfectly aligned for columns and their respective data
+    print(f"{'Algorithm':<15} {'Avg Turnaround':>15} {'Avg Wait':>15}")
+    print("-" * 50)
+    for alg, (turnaround, wait) in metrics.items():
+        print(f"{alg:<15}\t{turnaround:>8.2f}\t\t{wait:>8.2f}")
+
+    if not args.no_plots:
+        print("\n" + "="*50)
+        print("Generating Visualization")
+        print("="*50 + "\n")
+
+        # Visualize the metrics
+        visualize_metrics(results_dict, path=args.metrics_chart, show=not args.no_show)
+        print(f"\nVisualization has been saved as '{args.metrics_chart}'")
+
+if __name__ == "__main__":
+    main()
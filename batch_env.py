@@ -0,0 +1,207 @@
+import numpy as np
+
+from process_generation import generate_processes
+
+# -------------------------------
+# Batched ML Scheduler Environment
+# -------------------------------
+# scheduler_ml advances one episode one time unit at a time through SimPy. For training on many
+# small workloads, BatchSchedulerEnv steps B independent episodes in lockstep with array
+# operations instead, following scheduler_ml exactly: every step each episode runs the k-th
+# shortest ready job (ties in the order jobs joined the ready queue) for one time unit, jobs
+# arriving during that unit join the queue before the job is put back, and the reward is
+# minus the ready queue length plus a bonus when the job completes.
+
+# Reward bonus for completing a job, as in scheduler_ml
+COMPLETION_BONUS = 10
+
+
+class BatchSchedulerEnv:
+    """
+    B scheduling episodes of N jobs each, held as (B, N) arrays.
+    The job order of every episode is its arrival order; start and completion are reported in
+    the order the jobs were given. An episode is active until all its jobs have completed.
+    """
+    def __init__(self, arrival, burst):
+        """
+        :param arrival: (B, N) arrival times.
+        :param burst: (B, N) burst times, all positive.
+        """
+        arrival = np.asarray(arrival, dtype=np.int64)
+        burst = np.asarray(burst, dtype=np.int64)
+        self._order = np.argsort(arrival, axis=1, kind="stable")
+        self.arrival = np.take_along_axis(arrival, self._order, axis=1)
+        self.burst = np.take_along_axis(burst, self._order, axis=1)
+        self.num_episodes, self.num_jobs = self.arrival.shape
+        self._rows = np.arange(self.num_episodes)
+        # Push sequence numbers stay below this bound, so (remaining, sequence) packs into one key
+        self._seq_bound = self.num_jobs + int(self.burst.sum(axis=1).max(initial=0)) + 1
+        self.reset()
+
+    @classmethod
+    def from_workloads(cls, workloads):
+        """
+        Builds the environment from equally sized lists of processes, one list per episode.
+        """
+        arrival = [[p.arrival for p in procs] for procs in workloads]
+        burst = [[p.burst for p in procs] for procs in workloads]
+        return cls(arrival, burst)
+
+    def reset(self):
+        """
+        Restarts every episode at time 0 and moves idle episodes to their first arrival.
+        """
+        shape = self.arrival.shape
+        self.now = np.zeros(self.num_episodes, dtype=np.int64)
+        self.remaining = self.burst.copy()
+        self.released = np.zeros(shape, dtype=bool)
+        self.seq = np.zeros(shape, dtype=np.int64)
+        self._next_seq = np.zeros(self.num_episodes, dtype=np.int64)
+        self._start = np.full(shape, -1, dtype=np.int64)
+        self._completion = np.full(shape, -1, dtype=np.int64)
+        self._release()
+        self.skip_idle()
+
+    @property
+    def active(self):
+        return (self.remaining > 0).any(axis=1)
+
+    @property
+    def ready(self):
+        return self.released & (self.remaining > 0)
+
+    @property
+    def start(self):
+        return self._unsort(self._start)
+
+    @property
+    def completion(self):
+        return self._unsort(self._completion)
+
+    def _unsort(self, values):
+        result = np.empty_like(values)
+        np.put_along_axis(result, self._order, values, axis=1)
+        return result
+
+    def _release(self):
+        """
+        Adds the jobs that have arrived by now to the ready queues, in arrival order.
+        """
+        new = ~self.released & (self.arrival <= self.now[:, None])
+        self.seq = np.where(new, self._next_seq[:, None] + np.cumsum(new, axis=1) - 1, self.seq)
+        self._next_seq += new.sum(axis=1)
+        self.released |= new
+
+    def skip_idle(self):
+        """
+        Moves every active episode with an empty ready queue to its next arrival, like the
+        scheduler sleeping until the next arrival.
+        """
+        idle = self.active & ~self.ready.any(axis=1)
+        if idle.any():
+            pending = np.where(self.released, np.iinfo(np.int64).max, self.arrival)
+            self.now = np.where(idle, pending.min(axis=1), self.now)
+            self._release()
+
+    def features(self):
+        """
+        Returns the raw state features of scheduler_ml's agent for every episode: queue length,
+        average remaining time, average waiting time and minimum remaining time (0 when empty).
+        """
+        ready = self.ready
+        qlen = ready.sum(axis=1)
+        safe = np.maximum(qlen, 1)
+        avg_rem = np.where(ready, self.remaining, 0).sum(axis=1) / safe
+        avg_wait = (qlen * self.now - np.where(ready, self.arrival, 0).sum(axis=1)) / safe
+        min_rem = np.where(ready, self.remaining, np.iinfo(np.int64).max).min(axis=1)
+        empty = qlen == 0
+        return qlen, np.where(empty, 0, avg_rem), np.where(empty, 0, avg_wait), np.where(empty, 0, min_rem)
+
+    def step(self, actions):
+        """
+        Runs the actions[b]-th shortest ready job of every active episode for one time unit and
+        returns the rewards (0 for inactive episodes). Call skip_idle() before the next step.
+        """
+        active = self.active
+        ready = self.ready
+        key = np.where(ready, self.remaining * self._seq_bound + self.seq, np.iinfo(np.int64).max)
+        ranked = np.argsort(key, axis=1)
+        job = ranked[self._rows, np.where(active, actions, 0)]
+        rows, job = self._rows[active], job[active]
+
+        starting = self._start[rows, job] < 0
+        self._start[rows[starting], job[starting]] = self.now[rows[starting]]
+        self.remaining[rows, job] -= 1
+        self.now[active] += 1
+        self._release()
+        # The reward counts the ready queue with the unit's arrivals but without the running job.
+        finished = self.remaining[rows, job] == 0
+        rewards = np.zeros(self.num_episodes)
+        rewards[rows] = -(self.ready[rows].sum(axis=1) - ~finished)
+
+        self._completion[rows[finished], job[finished]] = self.now[rows[finished]]
+        rewards[rows[finished]] += COMPLETION_BONUS
+        # An unfinished job rejoins the queue behind the new arrivals.
+        back = rows[~finished]
+        self.seq[back, job[~finished]] = self._next_seq[back]
+        self._next_seq[back] += 1
+        return rewards
+
+
+# -------------------------------
+# Batched Q-Learning
+# -------------------------------
+def _greedy_actions(Q, states, num_actions):
+    """
+    Returns the argmax of every state's Q values over its first num_actions actions.
+    """
+    values = Q[states]
+    values = np.where(np.arange(values.shape[1]) < num_actions[:, None], values, -np.inf)
+    return values.argmax(axis=1)
+
+
+def run_batch_episodes(agent, env, rng=None, learn=True):
+    """
+    Runs every episode of env to completion with the tabular agent (an MLSchedulerAgent),
+    choosing epsilon-greedy actions and, with learn, applying the Q-learning update of every
+    episode's transition at each step. The updates of one step are computed from the same Q
+    table and added together, so with a single episode the run matches scheduler_ml exactly.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    discretize = agent.discretizer.batch
+    Q = agent.Q
+    while True:
+        active = env.active
+        if not active.any():
+            break
+        states = discretize(*env.features())
+        num_actions = states[0]
+        actions = _greedy_actions(Q, states, num_actions)
+        if agent.epsilon > 0:
+            explore = rng.random(env.num_episodes) < agent.epsilon
+            random_actions = (rng.random(env.num_episodes) * num_actions).astype(np.int64)
+            actions = np.where(explore, random_actions, actions)
+        rewards = env.step(actions)
+        if learn:
+            next_states = discretize(*env.features())
+            next_actions = _greedy_actions(Q, next_states, next_states[0])
+            future = np.where(next_states[0] > 0, Q[next_states + (next_actions,)], 0.0)
+            index = tuple(s[active] for s in states + (actions,))
+            old = Q[index]
+            np.add.at(Q, index, agent.alpha * (rewards[active] + agent.gamma * future[active] - old))
+        env.skip_idle()
+
+
+def train_agent_batched(agent, episodes=100, num_procs=5, batch_size=256, seed=0, rng=None):
+    """
+    Trains the tabular agent on the episodes of train_agent (episode e uses
+    generate_processes(num_procs, seed=seed + e)), running batch_size episodes in lockstep.
+    Epsilon decays once per episode as in MLSchedulerAgent.train, applied after each batch.
+    """
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    for first in range(0, episodes, batch_size):
+        count = min(batch_size, episodes - first)
+        workloads = [generate_processes(num_procs, seed=seed + e) for e in range(first, first + count)]
+        run_batch_episodes(agent, BatchSchedulerEnv.from_workloads(workloads), rng)
+        agent.epsilon = max(agent.min_epsilon, agent.epsilon * agent.epsilon_decay ** count)
+    print("Training completed.")
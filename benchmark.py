@@ -0,0 +1,197 @@
+#!/bin/python3
+"""
+Throughput benchmark for the schedulers and for ML agent training.
+
+Every case simulates a Poisson workload of a given number of jobs at a given load factor
+(mean burst / mean inter-arrival time) and reports wall time, simulated events per second,
+scheduling decisions per second and peak RSS. Results are written to JSON and compared with a
+committed baseline; cases slower than the baseline by more than the threshold are reported as
+regressions and make the run exit with status 1.
+
+    python benchmark.py --quick                      # small sizes, compare with benchmark_baseline.json
+    python benchmark.py --output results.json        # full suite, 1e2 to 1e6 jobs
+    python benchmark.py --quick --update-baseline    # rewrite the baseline from this machine
+"""
+import argparse
+import json
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import simpy
+
+from process_generation import WorkloadGenerator
+
+BASELINE_PATH = "benchmark_baseline.json"
+
+# Benchmarked cases: name -> (scheduler class name, scheduler kwargs); "ml" trains MLSchedulerAgent,
+# "ml_greedy" runs its frozen greedy policy
+SCHEDULERS = {
+    "fcfs": ("FirstComeFirstServeScheduler", {}),
+    "sjf": ("ShortestJobFirstScheduler", {}),
+    "priority": ("PriorityScheduler", {}),
+    "rr": ("RoundRobinScheduler", {"time_quantum": 3}),
+    "srtf": ("ShortestRemainingTimeFirstScheduler", {}),
+    "ml": (None, {}),
+    "ml_greedy": (None, {"greedy": True}),
+}
+
+JOB_COUNTS = (100, 1_000, 10_000, 100_000, 1_000_000)
+QUICK_JOB_COUNTS = (100, 1_000, 10_000)
+LOAD_FACTORS = (0.5, 0.9, 1.2)
+QUICK_LOAD_FACTORS = (0.9,)
+
+# Mean of the uniform 1..10 burst distribution used by the benchmark workloads
+MEAN_BURST = 5.5
+
+
+class CountingEnvironment(simpy.Environment):
+    """
+    SimPy environment counting the events it processes.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.events = 0
+
+    def step(self) -> None:
+        self.events += 1
+        super().step()
+
+
+def _run_case(name, jobs, load, seed=0, repeat=3):
+    """
+    Runs one benchmark case repeat times and returns its measurements, using the fastest
+    repetition to damp timing noise. Executed in a fresh worker process so that peak RSS
+    belongs to this case alone.
+    """
+    from Simulator import run_simulation
+    from ML import MLSchedulerAgent, run_simulation_ml, scheduler_ml, scheduler_ml_greedy
+    import first_come_first_serve, shortest_job_first, priority_scheduler
+    import round_robin_scheduler, shortest_remaining_time_first
+
+    table = WorkloadGenerator(seed=seed, arrival="poisson", mean_interarrival=MEAN_BURST / load).table(jobs)
+    class_name, kwargs = SCHEDULERS[name]
+    if class_name is not None:
+        modules = (first_come_first_serve, shortest_job_first, priority_scheduler,
+                   round_robin_scheduler, shortest_remaining_time_first)
+        scheduler_class = next(getattr(m, class_name) for m in modules if hasattr(m, class_name))
+    wall_time = float("inf")
+    for _ in range(repeat):
+        workload = table.fresh_run()
+        env = CountingEnvironment()
+        start = time.perf_counter()
+        if class_name is None and kwargs.get("greedy"):
+            # Inference only: one policy lookup per decision
+            run_simulation_ml(workload, scheduler_ml_greedy, MLSchedulerAgent().freeze(), env=env)
+        elif class_name is None:
+            # One training episode: every decision also updates the Q table
+            run_simulation_ml(workload, scheduler_ml, MLSchedulerAgent(), env=env)
+        else:
+            run_simulation(workload, scheduler_class, env=env, **kwargs)
+        wall_time = min(wall_time, time.perf_counter() - start)
+
+    # Every dispatch (every time step for the ML scheduler) logs one run
+    decisions = workload.segments.runs
+    return {
+        "scheduler": name,
+        "jobs": jobs,
+        "load": load,
+        "wall_time": wall_time,
+        "events": env.events,
+        "events_per_sec": env.events / wall_time,
+        "decisions": decisions,
+        "decisions_per_sec": decisions / wall_time,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def case_key(result):
+    return f"{result['scheduler']}/{result['jobs']}/{result['load']:g}"
+
+
+def run_benchmarks(schedulers=tuple(SCHEDULERS), job_counts=QUICK_JOB_COUNTS, load_factors=QUICK_LOAD_FACTORS,
+                   seed=0, repeat=3, echo=True):
+    """
+    Runs every (scheduler, job count, load factor) case, each in its own worker process, and
+    returns the list of results.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        for name in schedulers:
+            for jobs in job_counts:
+                for load in load_factors:
+                    result = pool.submit(_run_case, name, jobs, load, seed, repeat).result()
+                    results.append(result)
+                    if echo:
+                        print(f"{case_key(result):<22} {result['wall_time']:9.3f} s "
+                              f"{result['events_per_sec']:12.0f} events/s "
+                              f"{result['decisions_per_sec']:12.0f} decisions/s "
+                              f"{result['peak_rss_mb']:8.1f} MB")
+    return results
+
+
+def compare(results, baseline, threshold=0.4, min_wall_time=0.05):
+    """
+    Compares results with baseline results and returns a list of regression messages for cases
+    whose wall time grew, or whose event throughput fell, by more than threshold (a fraction).
+    Cases missing from the baseline, or faster than min_wall_time seconds in the baseline (too
+    short to time reliably), are ignored.
+    """
+    reference = {case_key(r): r for r in baseline}
+    regressions = []
+    for result in results:
+        base = reference.get(case_key(result))
+        if base is None or base["wall_time"] < min_wall_time:
+            continue
+        if result["wall_time"] > base["wall_time"] * (1 + threshold):
+            regressions.append(f"{case_key(result)}: wall time {result['wall_time']:.3f} s "
+                               f"vs baseline {base['wall_time']:.3f} s")
+        if result["events_per_sec"] < base["events_per_sec"] * (1 - threshold):
+            regressions.append(f"{case_key(result)}: {result['events_per_sec']:.0f} events/s "
+                               f"vs baseline {base['events_per_sec']:.0f} events/s")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scheduler throughput benchmark")
+    parser.add_argument("--quick", action="store_true", help="only 1e2 to 1e4 jobs at load 0.9")
+    parser.add_argument("--schedulers", nargs="+", choices=tuple(SCHEDULERS), default=tuple(SCHEDULERS))
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per case, the fastest is kept")
+    parser.add_argument("--max-jobs", type=int, default=None, help="skip job counts above this")
+    parser.add_argument("--output", default=None, help="write results to this JSON file")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=0.4, help="allowed slowdown as a fraction")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    job_counts = QUICK_JOB_COUNTS if args.quick else JOB_COUNTS
+    if args.max_jobs is not None:
+        job_counts = tuple(n for n in job_counts if n <= args.max_jobs)
+    load_factors = QUICK_LOAD_FACTORS if args.quick else LOAD_FACTORS
+    results = run_benchmarks(args.schedulers, job_counts, load_factors, repeat=args.repeat)
+
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        return 0
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; nothing to compare against.")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
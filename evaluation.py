@@ -0,0 +1,158 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from process_generation import WorkloadGenerator
+
+# Per-run metrics reported by run_sweep
+SWEEP_METRICS = ("mean_waiting", "mean_turnaround", "mean_response", "p95_waiting", "makespan")
+
+# Load factors (mean burst / mean inter-arrival time) of a default sweep
+DEFAULT_LOADS = (0.5, 0.9, 1.2)
+
+# Algorithms with a closed-form schedule in fast_simulation
+_FAST_POLICIES = {'FCFS': 'fcfs', 'SJF': 'sjf', 'Priority': 'priority'}
+
+# Trained ML agent of a worker process, set once by _init_worker
+_worker_agent = None
+
+
+# -------------------------------
+# Sweep Workloads
+# -------------------------------
+def sweep_workload(seed, load, num_jobs, max_burst=10):
+    """
+    Returns the workload of one sweep cell: num_jobs Poisson arrivals with uniform 1..max_burst
+    bursts, the mean inter-arrival time set so that mean burst / mean inter-arrival = load.
+    Every algorithm sees the same workload for a given (seed, load), and the loads of a seed
+    share their random streams (common random numbers), so differences between algorithms
+    are not masked by differences between workloads.
+    """
+    generator = WorkloadGenerator(seed=seed, arrival="poisson", max_burst=max_burst,
+                                  mean_interarrival=(max_burst + 1) / 2 / load)
+    return generator.table(num_jobs)
+
+
+def _run_metrics(waiting, turnaround, response, completion):
+    return {
+        "mean_waiting": float(np.mean(waiting)),
+        "mean_turnaround": float(np.mean(turnaround)),
+        "mean_response": float(np.mean(response)),
+        "p95_waiting": float(np.percentile(waiting, 95)),
+        "makespan": float(np.max(completion)),
+    }
+
+
+def _init_worker(agent):
+    global _worker_agent
+    _worker_agent = agent
+
+
+def _sweep_task(seed, load, num_jobs, algorithms, time_quantum):
+    """
+    Runs every algorithm on the workload of one (seed, load) cell, normally inside a worker
+    process, and returns one row of metrics per algorithm. Non-preemptive policies use the
+    closed-form engine, which matches their SimPy schedules exactly.
+    """
+    from fast_simulation import fast_simulate
+    from Simulator import simulate_srtf, simulate_rr, simulate_ml
+
+    workload = sweep_workload(seed, load, num_jobs)
+    rows = []
+    for alg in algorithms:
+        if alg in _FAST_POLICIES:
+            result = fast_simulate(workload, _FAST_POLICIES[alg])
+            metrics = _run_metrics(result["waiting"], result["turnaround"], result["response"], result["completion"])
+        else:
+            if alg == 'SRTF':
+                completed = simulate_srtf(workload)
+            elif alg == 'Round Robin':
+                completed = simulate_rr(workload, time_quantum=time_quantum)
+            elif alg == 'ML-Based':
+                completed = simulate_ml(workload, _worker_agent)
+            else:
+                raise ValueError(f"Unknown algorithm {alg!r}")
+            table = completed[0].table
+            metrics = _run_metrics(table.waiting, table.turnaround, table.response, table.completion)
+        rows.append(dict(algorithm=alg, seed=seed, load=load, **metrics))
+    return rows
+
+
+def run_sweep(algorithms, seeds=range(100), loads=DEFAULT_LOADS, num_jobs=100, time_quantum=3, agent=None,
+              max_workers=None, parallel=True):
+    """
+    Runs every algorithm on every (seed, load) workload (see sweep_workload) and returns a
+    DataFrame with one row per run: algorithm, seed, load and the SWEEP_METRICS.
+    The cells are spread over a process pool. 'ML-Based' evaluates the frozen greedy policy of
+    agent, which must be trained already; it is sent to each worker once. num_jobs must be at
+    least 1, since the metrics of a run without jobs are undefined.
+    """
+    algorithms = tuple(algorithms)
+    if num_jobs < 1:
+        raise ValueError(f"A sweep needs at least one job per workload, got num_jobs={num_jobs}")
+    if 'ML-Based' in algorithms and agent is None:
+        raise ValueError("The ML-Based algorithm needs a trained agent")
+    cells = [(seed, load) for load in loads for seed in seeds]
+    args = [(seed, load, num_jobs, algorithms, time_quantum) for seed, load in cells]
+    if parallel:
+        workers = max_workers or min(len(args), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(agent,)) as pool:
+            results = list(pool.map(_sweep_task, *zip(*args), chunksize=max(1, len(args) // (4 * workers))))
+    else:
+        _init_worker(agent)
+        results = [_sweep_task(*a) for a in args]
+    return pd.DataFrame([row for rows in results for row in rows])
+
+
+# -------------------------------
+# Confidence Intervals
+# -------------------------------
+def bootstrap_ci(values, confidence=0.95, resamples=2000, rng=None):
+    """
+    Percentile bootstrap confidence interval of the mean of values, as (low, high).
+    All resamples are drawn and averaged in one array operation.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rng = rng if rng is not None else np.random.default_rng()
+    means = values[rng.integers(0, len(values), (resamples, len(values)))].mean(axis=1)
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(means, [tail, 100 - tail])
+    return float(low), float(high)
+
+
+def summarize(frame, metric="mean_waiting", confidence=0.95, resamples=2000, seed=0):
+    """
+    Aggregates a run_sweep frame per (load, algorithm): the number of seeds, the mean of
+    metric over the seeds and its bootstrap confidence interval.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for (load, alg), group in frame.groupby(["load", "algorithm"], sort=False):
+        values = group[metric].to_numpy()
+        low, high = bootstrap_ci(values, confidence, resamples, rng)
+        rows.append({"load": load, "algorithm": alg, "seeds": len(values), "mean": values.mean(),
+                     "ci_low": low, "ci_high": high})
+    return pd.DataFrame(rows).set_index(["load", "algorithm"])
+
+
+def paired_difference(frame, reference, metric="mean_waiting", confidence=0.95, resamples=2000, seed=0):
+    """
+    Per (load, algorithm), the mean over seeds of metric minus the reference algorithm's value
+    on the same workload, with its bootstrap confidence interval. Pairing by seed removes the
+    workload-to-workload variation both algorithms share, so the interval is usually much
+    narrower than the difference of two independent intervals.
+    """
+    wide = frame.pivot_table(index=["load", "seed"], columns="algorithm", values=metric)
+    rng = np.random.default_rng(seed)
+    rows = []
+    for load, cell in wide.groupby(level="load", sort=False):
+        for alg in cell.columns:
+            if alg == reference:
+                continue
+            diff = (cell[alg] - cell[reference]).to_numpy()
+            low, high = bootstrap_ci(diff, confidence, resamples, rng)
+            rows.append({"load": load, "algorithm": alg, "mean_difference": diff.mean(), "ci_low": low,
+                         "ci_high": high})
+    return pd.DataFrame(rows).set_index(["load", "algorithm"])
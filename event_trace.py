@@ -0,0 +1,176 @@
+import struct
+import sys
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+
+# -------------------------------
+# Verbosity Levels
+# -------------------------------
+TRACE_OFF = 0    # record nothing (default for training and benchmarks)
+TRACE_INFO = 1   # arrivals, dispatches, preemptions and completions
+TRACE_DEBUG = 2  # additionally every per-time-unit decision of the ML scheduler
+
+# -------------------------------
+# Event Types
+# -------------------------------
+ARRIVAL = 0
+DISPATCH = 1
+PREEMPT = 2
+COMPLETION = 3
+DECISION = 4
+
+EVENT_NAMES = {ARRIVAL: "arrival", DISPATCH: "dispatch", PREEMPT: "preempt",
+               COMPLETION: "completion", DECISION: "decision"}
+
+# One record per event; value holds the event detail (run length for dispatches, 0 when it is
+# not known at dispatch time as under preemptive SRTF, remaining time for preemptions, chosen
+# action for decisions).
+TRACE_DTYPE = np.dtype([("time", "f8"), ("pid", "i8"), ("event", "u1"), ("core", "u2"), ("value", "i8")])
+
+_MAGIC = b"SCHTRC01"
+_CHUNK_HEADER = struct.Struct("<Q")
+
+
+class EventTrace:
+    """
+    Level-gated, buffered trace of scheduling events.
+    Records are collected as tuples and converted to columnar NumPy chunks in bulk. Depending on
+    the options they are kept in memory (everything, or only the last ring_size events), written
+    to a compact binary columnar file every buffer_size events, and/or echoed to the console.
+    Call sites check `trace.level >= level` before building a record, so a disabled trace
+    costs a single comparison per event.
+    """
+    def __init__(self, level: int = TRACE_INFO, echo: bool = False, ring_size: Optional[int] = None,
+                 path: Optional[str] = None, buffer_size: int = 65536) -> None:
+        """
+        :param level: Verbosity level, one of TRACE_OFF, TRACE_INFO or TRACE_DEBUG.
+        :param echo: Print every recorded event as a readable line.
+        :param ring_size: Keep only the most recent ring_size events in memory; with a path they
+                          are written to the file when the trace is closed.
+        :param path: Write events to this binary trace file instead of keeping them in memory.
+        :param buffer_size: Number of events buffered before a bulk conversion/write.
+        """
+        self.level = level
+        self.echo = echo
+        self.buffer_size = buffer_size
+        self.path = path
+        self._ring = ring_size is not None
+        self._buffer = deque(maxlen=ring_size) if self._ring else []
+        self._chunks = []
+        self._file = None
+        if path is not None:
+            self._file = open(path, "wb")
+            self._file.write(_MAGIC)
+
+    def record(self, time, proc, event: int, value: int = 0, core: int = 0) -> None:
+        """
+        Records one event for proc at the given simulation time.
+        """
+        pid = int(proc.pid[1:])
+        if self.echo:
+            print(format_event(time, pid, event, value, core))
+        self._buffer.append((time, pid, event, core, value))
+        if not self._ring and len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Converts the buffered events into a columnar chunk and writes it out (file mode)
+        or keeps it in memory.
+        """
+        if self._ring or not self._buffer:
+            return
+        chunk = np.array(self._buffer, dtype=TRACE_DTYPE)
+        self._buffer = []
+        if self._file is not None:
+            self._write_chunk(chunk)
+        else:
+            self._chunks.append(chunk)
+
+    def _write_chunk(self, chunk: np.ndarray) -> None:
+        self._file.write(_CHUNK_HEADER.pack(len(chunk)))
+        for name in TRACE_DTYPE.names:
+            self._file.write(np.ascontiguousarray(chunk[name]).tobytes())
+
+    def close(self) -> None:
+        """
+        Flushes the remaining events and closes the trace file, if any. A ring buffer backed by
+        a file writes the events it holds, the most recent ring_size, at this point.
+        """
+        if self._ring and self._file is not None and self._buffer:
+            self._write_chunk(np.array(list(self._buffer), dtype=TRACE_DTYPE))
+            self._buffer.clear()
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def events(self) -> Dict[str, np.ndarray]:
+        """
+        Returns the events held in memory as a dict of columns, oldest first.
+        """
+        if self.path is not None:
+            self.close()
+            return load_trace(self.path)
+        if self._ring:
+            chunks = [np.array(list(self._buffer), dtype=TRACE_DTYPE)]
+        else:
+            self.flush()
+            chunks = self._chunks
+        records = np.concatenate(chunks) if chunks else np.empty(0, dtype=TRACE_DTYPE)
+        return {name: records[name] for name in TRACE_DTYPE.names}
+
+
+# Shared disabled trace used when no trace is passed in
+NULL_TRACE = EventTrace(level=TRACE_OFF)
+
+
+def load_trace(path: str) -> Dict[str, np.ndarray]:
+    """
+    Reads a binary trace file written by EventTrace into a dict of columns.
+    """
+    columns = {name: [] for name in TRACE_DTYPE.names}
+    with open(path, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a scheduler trace file")
+        while True:
+            header = f.read(_CHUNK_HEADER.size)
+            if not header:
+                break
+            (count,) = _CHUNK_HEADER.unpack(header)
+            for name in TRACE_DTYPE.names:
+                dtype = TRACE_DTYPE[name]
+                columns[name].append(np.frombuffer(f.read(count * dtype.itemsize), dtype=dtype))
+    return {name: np.concatenate(parts) if parts else np.empty(0, dtype=TRACE_DTYPE[name])
+            for name, parts in columns.items()}
+
+
+def format_event(time, pid: int, event: int, value: int = 0, core: int = 0) -> str:
+    """
+    Formats one trace event as a console line.
+    """
+    where = f" on core {core}" if core else ""
+    if event == ARRIVAL:
+        action = "arrives"
+    elif event == DISPATCH:
+        action = f"runs for {value} time units{where}" if value else f"is now running{where}"
+    elif event == PREEMPT:
+        action = f"is preempted with {value} time units remaining{where}"
+    elif event == COMPLETION:
+        action = f"finishes{where}"
+    else:
+        action = f"is picked as action {value}{where}"
+    return f"Time {time:g}: Process P{pid} {action}."
+
+
+def print_trace(events: Dict[str, np.ndarray], file=None) -> None:
+    """
+    Replays recorded events (from EventTrace.events() or load_trace()) as console lines.
+    """
+    file = file or sys.stdout
+    for time, pid, event, core, value in zip(events["time"].tolist(), events["pid"].tolist(),
+                                              events["event"].tolist(), events["core"].tolist(),
+                                              events["value"].tolist()):
+        print(format_event(time, pid, event, value, core), file=file)
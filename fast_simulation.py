@@ -0,0 +1,160 @@
+import heapq
+import numpy as np
+
+from process_generation import ProcessTable
+
+# -------------------------------
+# Closed-form engine for non-preemptive policies
+# -------------------------------
+# FCFS, SJF and non-preemptive Priority never revisit a decision, so their schedules follow
+# from a single pass over the jobs sorted by arrival. These functions reproduce the results of
+# simulate_fcfs / simulate_sjf / simulate_priority exactly without a discrete-event loop.
+
+FAST_POLICIES = ("fcfs", "sjf", "priority")
+# Key ranges up to this size are scheduled with per-key FIFO cursors instead of a heap
+MAX_KEY_BUCKETS = 64
+
+
+def process_arrays(processes):
+    """
+    Returns (arrival, burst, priority) int64 arrays for processes, which may be a ProcessTable,
+    a dict of arrays/sequences with those keys or a list of Process objects.
+    """
+    if isinstance(processes, ProcessTable):
+        return processes.arrival, processes.burst, processes.priority
+    if isinstance(processes, dict):
+        arrival = np.asarray(processes["arrival"], dtype=np.int64)
+        burst = np.asarray(processes["burst"], dtype=np.int64)
+        priority = np.asarray(processes.get("priority", np.zeros(len(arrival))), dtype=np.int64)
+    else:
+        n = len(processes)
+        arrival = np.fromiter((p.arrival for p in processes), dtype=np.int64, count=n)
+        burst = np.fromiter((p.burst for p in processes), dtype=np.int64, count=n)
+        priority = np.fromiter((p.priority for p in processes), dtype=np.int64, count=n)
+    return arrival, burst, priority
+
+
+def _fcfs_completion(arrival, burst):
+    """
+    Completion times for jobs already sorted by arrival.
+    A job completes at C_i + max_{j<=i}(a_j - C_{j-1}) where C is the cumulative burst,
+    i.e. the end of the busy period it joined shifted by the work queued ahead of it.
+    """
+    cumulative = np.cumsum(burst)
+    return cumulative + np.maximum.accumulate(arrival - (cumulative - burst))
+
+
+def _heap_start(arrival, burst, key):
+    """
+    Start times for jobs sorted by arrival under a non-preemptive smallest-key-first policy.
+    Ties are broken by arrival order, matching the scheduler heaps.
+    """
+    n = len(arrival)
+    shift = max(n - 1, 1).bit_length()
+    mask = (1 << shift) - 1
+    # Pack (key, arrival index) into one int so the heap compares plain integers.
+    packed = ((key - key.min()) << shift) + np.arange(n, dtype=np.int64)
+    arrival, burst, packed = arrival.tolist(), burst.tolist(), packed.tolist()
+    start = [0] * n
+    heap = []
+    push, pop = heapq.heappush, heapq.heappop
+    t = 0
+    i = 0
+    for _ in range(n):
+        if not heap and arrival[i] > t:
+            # CPU idle, jump to the next arrival
+            t = arrival[i]
+        while i < n and arrival[i] <= t:
+            push(heap, packed[i])
+            i += 1
+        j = pop(heap) & mask
+        start[j] = t
+        t += burst[j]
+    return np.array(start, dtype=np.int64)
+
+
+def _bucketed_start(arrival, burst, key):
+    """
+    Same schedule as _heap_start for small integer key ranges (priorities, bounded bursts).
+    Jobs sharing a key are served in arrival order, so each key is a FIFO cursor over its
+    jobs and a decision only scans the key heads instead of pushing every job through a heap.
+    """
+    n = len(arrival)
+    key = key - key.min()
+    num_keys = int(key.max()) + 1
+    by_key = np.argsort(key, kind="stable").tolist()
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(key, minlength=num_keys)))).tolist()
+    arrival, burst = arrival.tolist(), burst.tolist()
+    cursor, end = bounds[:-1], bounds[1:]
+    keys = range(num_keys)
+    inf = float("inf")
+    # Arrival time of the next unserved job of each key.
+    heads = [arrival[by_key[cursor[k]]] if cursor[k] < end[k] else inf for k in keys]
+    start = [0] * n
+    t = 0
+    for _ in range(n):
+        for k in keys:
+            if heads[k] <= t:
+                break
+        else:
+            # CPU idle, jump to the next arrival
+            t = min(heads)
+            k = heads.index(t)
+        c = cursor[k]
+        j = by_key[c]
+        c += 1
+        cursor[k] = c
+        heads[k] = arrival[by_key[c]] if c < end[k] else inf
+        start[j] = t
+        t += burst[j]
+    return np.array(start, dtype=np.int64)
+
+
+def _keyed_start(arrival, burst, key):
+    """
+    Start times for jobs sorted by arrival under a non-preemptive smallest-key-first policy.
+    """
+    if int(key.max()) - int(key.min()) < MAX_KEY_BUCKETS:
+        return _bucketed_start(arrival, burst, key)
+    return _heap_start(arrival, burst, key)
+
+
+def fast_simulate(processes, policy):
+    """
+    Computes the schedule of a non-preemptive policy ('fcfs', 'sjf' or 'priority') in closed form.
+    Returns a dict of int64 arrays in the input order: start, completion, waiting, turnaround
+    and response.
+    """
+    if policy not in FAST_POLICIES:
+        raise ValueError(f"Unsupported policy {policy!r}, expected one of {FAST_POLICIES}")
+    arrival, burst, priority = process_arrays(processes)
+    n = len(arrival)
+    if n == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return {name: empty.copy() for name in ("start", "completion", "waiting", "turnaround", "response")}
+
+    # Stable sort keeps equal arrivals in list order, like the SimPy arrival processes.
+    order = np.argsort(arrival, kind="stable")
+    sorted_arrival = arrival[order]
+    sorted_burst = burst[order]
+
+    if policy == "fcfs":
+        sorted_completion = _fcfs_completion(sorted_arrival, sorted_burst)
+        sorted_start = sorted_completion - sorted_burst
+    else:
+        key = sorted_burst if policy == "sjf" else priority[order]
+        sorted_start = _keyed_start(sorted_arrival, sorted_burst, key)
+        sorted_completion = sorted_start + sorted_burst
+
+    start = np.empty(n, dtype=np.int64)
+    completion = np.empty(n, dtype=np.int64)
+    start[order] = sorted_start
+    completion[order] = sorted_completion
+    waiting = start - arrival
+    return {
+        "start": start,
+        "completion": completion,
+        "waiting": waiting,
+        "turnaround": completion - arrival,
+        "response": waiting.copy(),
+    }
@@ -2,27 +2,46 @@
 import simpy
 from typing import List, Optional
 
+from ready_queue import ReadyQueue, FifoReadyQueue
+from event_trace import EventTrace, NULL_TRACE, TRACE_INFO, DISPATCH, COMPLETION
+from simulation_events import ArrivalSignal, wait_for_arrival
+
 class FirstComeFirstServeScheduler:
     """
     First Come First Serve (FCFS) Scheduler.
     This scheduler selects the process that arrives first.
     """
-    def __init__(self, env: simpy.Environment, ready_queue: List, completed: List, total: int,
-                 name: str = "First Come First Serve Scheduler", description: Optional[str] = None) -> None:
+
+    @staticmethod
+    def create_ready_queue() -> ReadyQueue:
+        """
+        Returns the ready queue ordering this scheduler needs.
+        First-in first-out queue, processes are served in arrival order.
+        """
+        return FifoReadyQueue()
+
+    def __init__(self, env: simpy.Environment, ready_queue: ReadyQueue, completed: List, total: int,
+                 name: str = "First Come First Serve Scheduler", description: Optional[str] = None,
+                 arrival_signal: Optional[ArrivalSignal] = None,
+                 tracer: Optional[EventTrace] = None) -> None:
         """
         Initializes the FCFS scheduler.
         
         :param env: The simulation environment.
-        :param ready_queue: List of processes ready to execute.
+        :param ready_queue: Queue of processes ready to execute, see create_ready_queue().
         :param completed: List to store completed processes.
         :param total: Total number of processes.
         :param name: Name of the scheduler (default is "First Come First Serve Scheduler").
         :param description: Optional description of the scheduler.
+        :param arrival_signal: Optional signal used to sleep until the next arrival instead of polling.
+        :param tracer: Optional event trace receiving dispatch and completion events (off by default).
         """
         self.env = env
         self.ready_queue = ready_queue
         self.completed = completed
         self.total = total
+        self.arrival_signal = arrival_signal
+        self.tracer = tracer if tracer is not None else NULL_TRACE
         self.process = env.process(self.schedule_process())
         self.name = name
         self.description = description or "A scheduler using First Come First Serve (FCFS) policy."
@@ -32,22 +51,25 @@ class FirstComeFirstServeScheduler:
         Executes process scheduling logic for First Come First Serve(FCFS) Scheduler.
         """
         while len(self.completed) < self.total:
-            if not self.ready_queue:
-                yield self.env.timeout(1)
+            if not self.ready_queue and not self.ready_queue.try_steal():
+                yield wait_for_arrival(self.env, self.arrival_signal)
                 continue
             
-            proc = self.ready_queue.pop(0)
+            proc = self.ready_queue.pop()
             
             if proc.start is None:
                 proc.start = self.env.now
                 proc.response = proc.start - proc.arrival
-                proc.timeline.append((proc.start, proc.burst))
+                proc.record_run(proc.start, proc.burst)
             
-            print(f"Time {self.env.now}: Process {proc.pid} starts execution for {proc.burst} time units (FCFS)")
+            if self.tracer.level >= TRACE_INFO:
+                self.tracer.record(self.env.now, proc, DISPATCH, proc.burst)
             yield self.env.timeout(proc.burst)
             
             proc.completion = self.env.now
             proc.turnaround = proc.completion - proc.arrival
             proc.waiting = proc.start - proc.arrival
             self.completed.append(proc)
+            if self.tracer.level >= TRACE_INFO:
+                self.tracer.record(self.env.now, proc, COMPLETION)
 
@@ -0,0 +1,270 @@
+import math
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+# Percentiles reported by StreamingMetrics.summary()
+PERCENTILES = (50, 95, 99, 99.9)
+
+# Per-job times tracked by StreamingMetrics
+JOB_METRICS = ("waiting", "response", "turnaround")
+
+
+# -------------------------------
+# Running Mean and Variance
+# -------------------------------
+class RunningStats:
+    """
+    Welford's online algorithm for the count, mean, variance, minimum and maximum of a stream.
+    """
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value) -> None:
+        """
+        Adds one observation.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+# -------------------------------
+# Log-Linear Percentile Histogram
+# -------------------------------
+class LogHistogram:
+    """
+    HDR-style histogram of non-negative time values with bounded relative error.
+    Values below 2 * 2**sub_bucket_bits are counted exactly; larger values share buckets whose
+    width grows with the magnitude, so every bucket is within 2**-sub_bucket_bits of its values
+    (under 1% with the default of 7 bits). The number of buckets grows only with the logarithm
+    of the largest value, so memory is independent of the number of observations.
+    Non-integer values are rounded to the nearest time unit.
+    """
+    def __init__(self, sub_bucket_bits: int = 7) -> None:
+        """
+        :param sub_bucket_bits: Number of bits of precision kept for every value.
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_buckets = 1 << sub_bucket_bits
+        self.counts = []
+        self.total = 0
+
+    def _index(self, value: int) -> int:
+        shift = max(0, value.bit_length() - self.sub_bucket_bits - 1)
+        return self._sub_buckets * shift + (value >> shift)
+
+    def _value(self, index: int) -> float:
+        """Midpoint of the values counted in bucket index."""
+        shift = max(0, index // self._sub_buckets - 1)
+        low = (index - self._sub_buckets * shift) << shift
+        return low + ((1 << shift) - 1) / 2
+
+    def add(self, value, count: int = 1) -> None:
+        """
+        Adds count observations of value.
+        """
+        index = self._index(max(0, int(round(value))))
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += count
+        self.total += count
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Returns the q-th percentile (0 <= q <= 100), or None when the histogram is empty.
+        """
+        if not self.total:
+            return None
+        rank = max(1, math.ceil(q / 100 * self.total))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self._value(index)
+        return self._value(len(self.counts) - 1)
+
+    def merge(self, other: "LogHistogram") -> None:
+        """
+        Adds the observations of another histogram with the same precision.
+        """
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.total += other.total
+
+
+# -------------------------------
+# Streaming Metrics Sink
+# -------------------------------
+class StreamingMetrics:
+    """
+    Online metrics accumulator that stands in for the completed process list.
+    Schedulers call append(proc) on completion as they do with a list, but only running
+    statistics are kept: Welford means and log histograms (for tail percentiles) of the
+    waiting, response and turnaround times, plus throughput and CPU utilization per window of
+    window time units. Completed processes are not retained, and only the most recent
+    max_windows windows are kept individually: older ones are folded into log histograms of
+    the per-window completions and busy time, so memory does not grow with the number of jobs
+    or the length of the run. Busy time reported for an already folded window (by a job that
+    completes more than max_windows windows after it ran) only counts towards the overall
+    utilization.
+    """
+    def __init__(self, window: float = 100, sub_bucket_bits: int = 7, max_windows: int = 1024) -> None:
+        """
+        :param window: Length of the time windows for throughput and utilization.
+        :param sub_bucket_bits: Precision of the percentile histograms.
+        :param max_windows: Number of most recent windows kept individually, see windows().
+        """
+        self.window = window
+        self.max_windows = max_windows
+        self.stats = {name: RunningStats() for name in JOB_METRICS}
+        self.histograms = {name: LogHistogram(sub_bucket_bits) for name in JOB_METRICS}
+        self.first_arrival = math.inf
+        self.last_completion = 0
+        self.busy_time = 0
+        self._completions = {}  # window index -> completed jobs, for the retained windows
+        self._busy = {}         # window index -> busy CPU time, for the retained windows
+        self._folded_below = None  # windows before this index are folded into the histograms
+        self._folded_completions = LogHistogram(sub_bucket_bits)
+        self._folded_busy = LogHistogram(sub_bucket_bits)
+
+    def append(self, proc) -> None:
+        """
+        Records a completed process.
+        """
+        for name in JOB_METRICS:
+            value = getattr(proc, name)
+            self.stats[name].add(value)
+            self.histograms[name].add(value)
+        self.first_arrival = min(self.first_arrival, proc.arrival)
+        self.last_completion = max(self.last_completion, proc.completion)
+        window = int(proc.completion // self.window)
+        if self._folded_below is None or window >= self._folded_below:
+            self._completions[window] = self._completions.get(window, 0) + 1
+        for start, length in proc.timeline:
+            self._add_busy(start, start + length)
+        cutoff = int(self.last_completion // self.window) - self.max_windows + 1
+        if cutoff > self._first_window():
+            self._fold(cutoff)
+
+    def extend(self, processes: Iterable) -> None:
+        for proc in processes:
+            self.append(proc)
+
+    def _add_busy(self, start, end) -> None:
+        self.busy_time += end - start
+        window = int(start // self.window)
+        while start < end:
+            window_end = (window + 1) * self.window
+            if self._folded_below is None or window >= self._folded_below:
+                self._busy[window] = self._busy.get(window, 0) + min(end, window_end) - start
+            start = window_end
+            window += 1
+
+    def _first_window(self) -> int:
+        """Index of the first window that is not folded."""
+        first = int(self.first_arrival // self.window)
+        return first if self._folded_below is None else max(first, self._folded_below)
+
+    def _fold(self, cutoff: int) -> None:
+        """
+        Moves the windows before index cutoff from the retained dicts into the histograms.
+        """
+        first = self._first_window()
+        if cutoff - first <= self.max_windows:
+            indices = range(first, cutoff)
+        else:
+            # After a long idle gap only the few windows that saw activity need a lookup.
+            indices = sorted(i for i in self._completions.keys() | self._busy.keys() if i < cutoff)
+        active = 0
+        for i in indices:
+            if i in self._completions or i in self._busy:
+                self._folded_completions.add(self._completions.pop(i, 0))
+                self._folded_busy.add(self._busy.pop(i, 0))
+                active += 1
+        empty = cutoff - first - active
+        if empty > 0:
+            self._folded_completions.add(0, count=empty)
+            self._folded_busy.add(0, count=empty)
+        self._folded_below = cutoff
+
+    def __len__(self) -> int:
+        return self.stats["turnaround"].count
+
+    def percentile(self, name: str, q: float) -> Optional[float]:
+        """
+        Returns the q-th percentile of one of the waiting, response or turnaround times.
+        """
+        return self.histograms[name].percentile(q)
+
+    def windows(self) -> Dict[str, np.ndarray]:
+        """
+        Returns the start time, throughput (completions per time unit) and CPU utilization of
+        every retained window: those from the first arrival to the last completion, limited to
+        the most recent max_windows.
+        """
+        if not len(self):
+            return {"start": np.empty(0), "throughput": np.empty(0), "utilization": np.empty(0)}
+        first = self._first_window()
+        last = int(self.last_completion // self.window)
+        index = np.arange(first, last + 1)
+        completions = np.array([self._completions.get(i, 0) for i in index], dtype=np.float64)
+        busy = np.array([self._busy.get(i, 0) for i in index], dtype=np.float64)
+        return {"start": index * self.window, "throughput": completions / self.window,
+                "utilization": busy / self.window}
+
+    def window_percentile(self, name: str, q: float) -> Optional[float]:
+        """
+        Returns the q-th percentile over all windows, folded and retained, of the per-window
+        "throughput" or "utilization", with the precision of the histograms.
+        """
+        if name not in ("throughput", "utilization"):
+            raise ValueError(f"Unknown window metric {name!r}, expected 'throughput' or 'utilization'")
+        histogram = LogHistogram(self._folded_busy.sub_bucket_bits)
+        histogram.merge(self._folded_completions if name == "throughput" else self._folded_busy)
+        for value in (self.windows()[name] * self.window).tolist():
+            histogram.add(value)
+        value = histogram.percentile(q)
+        return None if value is None else value / self.window
+
+    def summary(self, percentiles: Iterable[float] = PERCENTILES) -> Dict[str, float]:
+        """
+        Returns a flat dict with the job count, overall throughput and utilization, and the mean,
+        standard deviation, maximum and requested percentiles of every job metric.
+        """
+        count = len(self)
+        span = self.last_completion - self.first_arrival if count else 0
+        result = {
+            "jobs": count,
+            "throughput": count / span if span > 0 else 0.0,
+            "utilization": self.busy_time / span if span > 0 else 0.0,
+        }
+        for name in JOB_METRICS:
+            stats = self.stats[name]
+            result[f"{name}_mean"] = stats.mean
+            result[f"{name}_std"] = stats.std
+            result[f"{name}_max"] = stats.max if count else 0
+            for q in percentiles:
+                result[f"{name}_p{q:g}"] = self.percentile(name, q)
+        return result
@@ -0,0 +1,248 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import simpy
+
+from ready_queue import ReadyQueue
+from event_trace import EventTrace
+from simulation_events import ArrivalSignal
+
+# Placement policies for multi-core simulation
+PLACEMENTS = ("global", "least_loaded", "work_stealing")
+
+
+class Core(ReadyQueue):
+    """
+    One simulated CPU, seen by its scheduler as its ready queue.
+    Every core runs its own instance of the scheduling policy. Depending on the placement the
+    underlying queue is shared by all cores (global) or private to this core (least_loaded,
+    work_stealing). Arrivals wake the core through its arrival signal, and the core logs its own
+    timeline: every process taken by the scheduler runs on this core from that moment until
+    the scheduler puts it back or it completes.
+    With work stealing, a scheduler about to go idle calls try_steal(), which moves the last
+    job of the most loaded other core's queue onto this core. Queries such as bool() and len()
+    never move jobs.
+    Any other attribute (e.g. select() of the ML queue) is forwarded to the underlying queue.
+    """
+    def __init__(self, index: int, queue: ReadyQueue, signal: Optional[ArrivalSignal],
+                 env: simpy.Environment) -> None:
+        """
+        :param index: Core number, starting at 0.
+        :param queue: The ready queue holding the processes this core can run.
+        :param signal: Signal waking the core's scheduler, or None when it polls.
+        :param env: The simulation environment, whose clock timestamps the dispatches.
+        """
+        self.index = index
+        self.queue = queue
+        self.signal = signal
+        self.env = env
+        self.siblings: List["Core"] = []
+        self.steal = False
+        self.current = None
+        self.dispatches: List[Tuple[Any, float]] = []
+        self._ends: List[Optional[float]] = []
+        self._running: Dict[int, int] = {}  # id of a dispatched process -> its dispatch index
+        self.stolen = 0
+
+    def admit(self, proc: Any) -> None:
+        """
+        Adds an arriving process and wakes the core.
+        """
+        self.queue.push(proc)
+        if self.signal is not None:
+            self.signal.notify()
+        if self.steal:
+            self._wake_idle_siblings()
+
+    def push(self, proc: Any) -> None:
+        """
+        Requeues a process from this core's scheduler (a preempted or unfinished process).
+        The scheduler is awake already, so only idle cores that may steal it are woken.
+        """
+        dispatch = self._running.pop(id(proc), None)
+        if dispatch is not None:
+            self._ends[dispatch] = self.env.now
+        self.queue.push(proc)
+        if self.steal:
+            self._wake_idle_siblings()
+
+    def _wake_idle_siblings(self) -> None:
+        for core in self.siblings:
+            if core.signal is not None and core.idle():
+                core.signal.notify()
+
+    def _dispatch(self, proc: Any) -> Any:
+        self.current = proc
+        self._running[id(proc)] = len(self.dispatches)
+        self.dispatches.append((proc, self.env.now))
+        self._ends.append(None)
+        return proc
+
+    def pop(self) -> Any:
+        return self._dispatch(self.queue.pop())
+
+    def peek(self) -> Any:
+        return self.queue.peek()
+
+    def remove(self, proc: Any) -> None:
+        self.queue.remove(proc)
+        self._dispatch(proc)
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.queue)
+
+    def __bool__(self) -> bool:
+        return bool(self.queue)
+
+    def try_steal(self) -> bool:
+        """
+        Moves a job from the most loaded other core onto this idle core, if stealing is on.
+        The victim loses the tail of its queue, the job it would run last: its next dispatch
+        and the order of the rest of its queue stay the same, and the job that would have
+        waited longest gains the most from moving to an idle core.
+        """
+        if self.queue or not self.steal:
+            return False
+        victim = max(self.siblings, key=lambda core: len(core.queue))
+        if not victim.queue:
+            return False
+        self.queue.push(victim.queue.pop_last())
+        self.stolen += 1
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.queue, name)
+
+    def running(self) -> bool:
+        """
+        Whether the last process dispatched on this core is unfinished.
+        """
+        return self.current is not None and self.current.completion is None
+
+    def idle(self) -> bool:
+        return not self.queue and not self.running()
+
+    def load(self) -> int:
+        """
+        Number of processes queued on or running on this core.
+        """
+        return len(self.queue) + self.running()
+
+    def timeline(self) -> List[Tuple[float, float, str]]:
+        """
+        Returns the (start, length, pid) segments executed on this core in dispatch order.
+        A dispatched process that was not put back ran until its completion.
+        """
+        segments = []
+        for (proc, start), end in zip(self.dispatches, self._ends):
+            end = proc.completion if end is None else end
+            if end is not None:
+                segments.append((start, end - start, proc.pid))
+        return segments
+
+
+class GlobalPlacement:
+    """
+    Places every arriving process on the run queue shared by all cores.
+    """
+    def __init__(self, cores: List[Core]) -> None:
+        self.cores = cores
+
+    def push(self, proc: Any) -> None:
+        self.cores[0].admit(proc)
+
+
+class LeastLoadedPlacement:
+    """
+    Places every arriving process on the core with the fewest queued or running processes
+    (the lowest core number on ties).
+    """
+    def __init__(self, cores: List[Core]) -> None:
+        self.cores = cores
+
+    def push(self, proc: Any) -> None:
+        min(self.cores, key=Core.load).admit(proc)
+
+
+class RoundRobinPlacement:
+    """
+    Places arriving processes on the cores in turn; used with work stealing, which evens out
+    the load afterwards.
+    """
+    def __init__(self, cores: List[Core]) -> None:
+        self.cores = cores
+        self._next = 0
+
+    def push(self, proc: Any) -> None:
+        self.cores[self._next].admit(proc)
+        self._next = (self._next + 1) % len(self.cores)
+
+
+class CoreTracer:
+    """
+    Forwards trace records to an EventTrace, tagged with a fixed core number.
+    """
+    def __init__(self, tracer: EventTrace, core: int) -> None:
+        self.tracer = tracer
+        self.level = tracer.level
+        self.core = core
+
+    def record(self, time, proc, event: int, value: int = 0, core: int = 0) -> None:
+        self.tracer.record(time, proc, event, value, self.core)
+
+
+def build_cores(env: simpy.Environment, num_cores: int, placement: str,
+                create_ready_queue: Callable[[], ReadyQueue], event_driven: bool = True):
+    """
+    Creates num_cores cores for the given placement policy.
+    Returns (placement queue, cores): the arrival feeder pushes onto the placement queue, and
+    one scheduler per core uses the core as its ready queue and core.signal as arrival signal.
+
+    :param env: The simulation environment.
+    :param num_cores: Number of cores.
+    :param placement: One of PLACEMENTS.
+    :param create_ready_queue: Factory for the scheduling policy's ready queue.
+    :param event_driven: Wake idle cores with arrival signals instead of polling.
+    """
+    if placement not in PLACEMENTS:
+        raise ValueError(f"Unknown placement {placement!r}, expected one of {PLACEMENTS}")
+    if num_cores < 1:
+        raise ValueError("num_cores must be at least 1")
+    if placement == "global":
+        queue = create_ready_queue()
+        signal = ArrivalSignal(env) if event_driven else None
+        cores = [Core(i, queue, signal, env) for i in range(num_cores)]
+        return GlobalPlacement(cores), cores
+    cores = [Core(i, create_ready_queue(), ArrivalSignal(env) if event_driven else None, env)
+             for i in range(num_cores)]
+    for core in cores:
+        core.siblings = [other for other in cores if other is not core]
+        core.steal = placement == "work_stealing" and num_cores > 1
+    if placement == "least_loaded":
+        return LeastLoadedPlacement(cores), cores
+    return RoundRobinPlacement(cores), cores
+
+
+def core_metrics(cores: List[Core]) -> Dict[str, Any]:
+    """
+    Summarizes a multi-core run: busy time, utilization and dispatch count per core over the
+    span from the first dispatch to the last completion, the number of stolen processes, and
+    the load imbalance (max busy time / mean busy time - 1, 0 when perfectly balanced).
+    """
+    timelines = [core.timeline() for core in cores]
+    busy = np.array([sum(length for _, length, _ in timeline) for timeline in timelines], dtype=np.float64)
+    starts = [start for timeline in timelines for start, _, _ in timeline]
+    ends = [start + length for timeline in timelines for start, length, _ in timeline]
+    span = max(ends) - min(starts) if starts else 0
+    mean_busy = busy.mean() if len(busy) else 0.0
+    return {
+        "busy": busy,
+        "utilization": busy / span if span > 0 else np.zeros(len(cores)),
+        "dispatches": np.array([len(core.dispatches) for core in cores], dtype=np.int64),
+        "stolen": int(sum(core.stolen for core in cores)),
+        "span": span,
+        "imbalance": float(busy.max() / mean_busy - 1) if mean_busy > 0 else 0.0,
+    }
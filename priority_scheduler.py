@@ -2,18 +2,35 @@
 from typing import List, Optional
 import simpy
 
+from ready_queue import ReadyQueue, HeapReadyQueue
+from event_trace import EventTrace, NULL_TRACE, TRACE_INFO, DISPATCH, COMPLETION
+from simulation_events import ArrivalSignal, wait_for_arrival
+
 
 class PriorityScheduler:
     """
     Priority Scheduler (Non-preemptive).
     This scheduler selects the process with the highest priority (lower number = higher priority).
     """
-    def __init__(self, env: simpy.Environment, ready_queue: List, completed: List, total: int,
-                 name: str = "Priority Scheduler", description: Optional[str] = None) -> None:
+
+    @staticmethod
+    def create_ready_queue() -> ReadyQueue:
+        """
+        Returns the ready queue ordering this scheduler needs.
+        Min-heap ordered by priority.
+        """
+        return HeapReadyQueue(key=lambda p: p.priority)
+
+    def __init__(self, env: simpy.Environment, ready_queue: ReadyQueue, completed: List, total: int,
+                 name: str = "Priority Scheduler", description: Optional[str] = None,
+                 arrival_signal: Optional[ArrivalSignal] = None,
+                 tracer: Optional[EventTrace] = None) -> None:
         self.env = env
         self.ready_queue = ready_queue
         self.completed = completed
         self.total = total
+        self.arrival_signal = arrival_signal
+        self.tracer = tracer if tracer is not None else NULL_TRACE
         self.process = env.process(self.schedule_process())
         self.name = name
         self.description = description or "A scheduler using Priority scheduling policy."
@@ -23,18 +40,20 @@ class PriorityScheduler:
         Executes process scheduling logic for Priorit(Non-preemptive) Scheduler.
         """
         while len(self.completed) < self.total:
-            if not self.ready_queue:
-                yield self.env.timeout(1)
+            if not self.ready_queue and not self.ready_queue.try_steal():
+                yield wait_for_arrival(self.env, self.arrival_signal)
                 continue
-            proc = min(self.ready_queue, key=lambda p: p.priority)
-            self.ready_queue.remove(proc)
+            proc = self.ready_queue.pop()
             if proc.start is None:
                 proc.start = self.env.now
                 proc.response = proc.start - proc.arrival
-                proc.timeline.append((proc.start, proc.burst))
-            print(f"Time {self.env.now}: Process {proc.pid} starts execution for {proc.burst} time units (Priority)")
+                proc.record_run(proc.start, proc.burst)
+            if self.tracer.level >= TRACE_INFO:
+                self.tracer.record(self.env.now, proc, DISPATCH, proc.burst)
             yield self.env.timeout(proc.burst)
             proc.completion = self.env.now
             proc.turnaround = proc.completion - proc.arrival
             proc.waiting = proc.start - proc.arrival
             self.completed.append(proc)
+            if self.tracer.level >= TRACE_INFO:
+                self.tracer.record(self.env.now, proc, COMPLETION)
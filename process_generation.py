@@ -1,4 +1,7 @@
 import random
+from array import array
+
+import numpy as np
 
 # -------------------------------
 # Process Class Definition
@@ -17,6 +20,17 @@ class Process:
         self.turnaround = 0       # Turnaround time (completion - arrival)
         self.timeline: list[tuple[float, float]] = []
 
+    def record_run(self, start, length):
+        """Logs that the process ran for length time units from start, see SegmentLog.append."""
+        if length <= 0:
+            return
+        if self.timeline:
+            seg_start, seg_len = self.timeline[-1]
+            if seg_start + seg_len == start:
+                self.timeline[-1] = (seg_start, seg_len + length)
+                return
+        self.timeline.append((start, length))
+
     def __repr__(self):
         return f"{self.pid}(arrival={self.arrival}, burst={self.burst}, priority={self.priority})"
 
@@ -40,3 +54,326 @@ def generate_processes(n, max_arrival=4, max_burst=10, max_priority=3, seed=None
 
         processes.append(Process(f"P{i + 1}", arrival=arrival_time, burst=burst_time, priority=priority))
     return processes
+
+
+# -------------------------------
+# Columnar Process Storage
+# -------------------------------
+class SegmentLog:
+    """
+    Append-only log of the execution segments of one run, shared by all rows of a ProcessTable.
+    Segments are kept in growable int64 columns (row index, start, length) instead of one list
+    of tuples per process, and each segment links to the previous segment of its row so a
+    single row's timeline is read without scanning the log.
+    A run that starts where its row's last segment ends extends that segment in place, so a
+    process that keeps the CPU over several dispatches (e.g. every time unit of the ML
+    scheduler) occupies a single segment.
+    """
+    def __init__(self, num_rows):
+        self.rows = array("q")
+        self.starts = array("q")
+        self.lengths = array("q")
+        self._prev = array("q")                # previous segment of the same row, -1 for none
+        self._last = array("q", [-1]) * num_rows  # last segment of every row, -1 for none
+        self.runs = 0                           # number of appended runs, merged or not
+
+    @classmethod
+    def from_columns(cls, num_rows, rows, starts, lengths):
+        """Rebuilds a log from the columns returned by columns()."""
+        log = cls(num_rows)
+        rows = np.asarray(rows, dtype=np.int64)
+        log.rows.frombytes(rows.tobytes())
+        log.starts.frombytes(np.asarray(starts, dtype=np.int64).tobytes())
+        log.lengths.frombytes(np.asarray(lengths, dtype=np.int64).tobytes())
+        # Segments of a row keep their log order, so sorting by row links each to its predecessor.
+        order = np.argsort(rows, kind="stable")
+        same_row = np.zeros(len(rows), dtype=bool)
+        same_row[1:] = rows[order][1:] == rows[order][:-1]
+        prev = np.full(len(rows), -1, dtype=np.int64)
+        prev[order[same_row]] = order[np.flatnonzero(same_row) - 1]
+        log._prev.frombytes(prev.tobytes())
+        last = np.full(num_rows, -1, dtype=np.int64)
+        last[rows[order]] = order
+        log._last = array("q", last.tobytes())
+        log.runs = len(rows)
+        return log
+
+    def append(self, row, start, length):
+        """Logs that row ran for length time units from start; zero-length runs add no segment."""
+        self.runs += 1
+        if length <= 0:
+            return
+        last = self._last[row]
+        if last >= 0 and self.starts[last] + self.lengths[last] == start:
+            self.lengths[last] += length
+            return
+        self._last[row] = len(self.rows)
+        self._prev.append(last)
+        self.rows.append(row)
+        self.starts.append(start)
+        self.lengths.append(length)
+
+    def timeline(self, row):
+        """Returns the (start, length) segments of row in time order."""
+        segments = []
+        i = self._last[row]
+        while i >= 0:
+            segments.append((self.starts[i], self.lengths[i]))
+            i = self._prev[i]
+        segments.reverse()
+        return segments
+
+    def columns(self):
+        """Returns (rows, starts, lengths) as int64 arrays in log order."""
+        return (np.array(self.rows, dtype=np.int64), np.array(self.starts, dtype=np.int64),
+                np.array(self.lengths, dtype=np.int64))
+
+    def __len__(self):
+        return len(self.rows)
+
+
+def _column_property(column, optional=False, doc=None):
+    """Property reading/writing one column of the owning ProcessTable; -1 stands for None when optional."""
+    def getter(self):
+        value = int(getattr(self.table, column)[self.index])
+        if optional and value < 0:
+            return None
+        return value
+
+    def setter(self, value):
+        getattr(self.table, column)[self.index] = -1 if value is None else value
+
+    return property(getter, setter, doc=doc)
+
+
+class ProcessRow:
+    """Lightweight view of one row of a ProcessTable, usable wherever a Process is expected."""
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def pid(self):
+        return f"P{self.table.pid[self.index]}"
+
+    arrival = _column_property("arrival", doc="Arrival time")
+    burst = _column_property("burst", doc="Total burst time")
+    priority = _column_property("priority", doc="Priority (lower number = higher priority)")
+    remaining = _column_property("remaining", doc="Remaining time (for preemptive algorithms)")
+    start = _column_property("start", optional=True, doc="Time when process first gets CPU")
+    completion = _column_property("completion", optional=True, doc="Time when process finishes")
+    response = _column_property("response", optional=True, doc="Response time (start - arrival)")
+    waiting = _column_property("waiting", doc="Total waiting time")
+    turnaround = _column_property("turnaround", doc="Turnaround time (completion - arrival)")
+
+    @property
+    def timeline(self) -> list[tuple[float, float]]:
+        """The (start, length) segments this process ran, read from the table's SegmentLog."""
+        return self.table.segments.timeline(self.index)
+
+    def record_run(self, start, length):
+        self.table.segments.append(self.index, start, length)
+
+    def __repr__(self):
+        return f"{self.pid}(arrival={self.arrival}, burst={self.burst}, priority={self.priority})"
+
+
+class ProcessTable:
+    """
+    Struct-of-arrays storage for a workload.
+    The workload columns (pid, arrival, burst, priority) are shared between runs, while the
+    per-run scheduling state lives in a few arrays that fresh_run() reallocates, so every
+    algorithm gets a clean copy without deep-copying per-process objects.
+    Iterating yields ProcessRow views that scheduler code uses like Process objects.
+    """
+    def __init__(self, arrival, burst, priority=None, pid=None):
+        self.arrival = np.asarray(arrival, dtype=np.int64)
+        self.burst = np.asarray(burst, dtype=np.int64)
+        n = len(self.arrival)
+        self.priority = np.zeros(n, dtype=np.int64) if priority is None else np.asarray(priority, dtype=np.int64)
+        self.pid = np.arange(1, n + 1, dtype=np.int64) if pid is None else np.asarray(pid, dtype=np.int64)
+        self.reset()
+
+    @classmethod
+    def from_processes(cls, processes):
+        """
+        Builds a table from a list of Process objects with pids of the form 'P<number>'.
+        Raises ValueError when a pid has another form or a time or priority is not a whole
+        number, since the int64 columns could not represent the process faithfully.
+        """
+        pids = []
+        for p in processes:
+            number = p.pid[1:] if isinstance(p.pid, str) and p.pid[:1] == "P" else ""
+            if not number.isdigit() or p.pid != f"P{int(number)}":
+                raise ValueError(f"Process id {p.pid!r} is not of the form 'P<number>'")
+            pids.append(int(number))
+        columns = {"pid": np.array(pids, dtype=np.int64)}
+        for name in ("arrival", "burst", "priority"):
+            values = np.array([getattr(p, name) for p in processes])
+            if values.dtype.kind == "f":
+                bad = np.flatnonzero(~np.isfinite(values) | (values != np.floor(values)))
+            elif values.dtype.kind in "iub" or not len(values):
+                bad = ()
+            else:
+                raise ValueError(f"Process {name} values must be numbers, got {values.dtype}")
+            if len(bad):
+                proc = processes[bad[0]]
+                raise ValueError(f"Process {proc.pid} has a non-integral {name} {getattr(proc, name)!r}")
+            columns[name] = values.astype(np.int64)
+        return cls(**columns)
+
+    def reset(self):
+        """Reallocates the per-run scheduling state."""
+        n = len(self.arrival)
+        self.remaining = self.burst.copy()
+        self.start = np.full(n, -1, dtype=np.int64)
+        self.completion = np.full(n, -1, dtype=np.int64)
+        self.response = np.full(n, -1, dtype=np.int64)
+        self.waiting = np.zeros(n, dtype=np.int64)
+        self.turnaround = np.zeros(n, dtype=np.int64)
+        self.segments = SegmentLog(n)
+        self._rows = None
+
+    def fresh_run(self):
+        """Returns a table sharing this workload's columns with its own, freshly reset run state."""
+        return ProcessTable(self.arrival, self.burst, self.priority, self.pid)
+
+    @property
+    def rows(self):
+        """One ProcessRow per process, created once so rows keep their identity during a run."""
+        if self._rows is None:
+            self._rows = [ProcessRow(self, i) for i in range(len(self.arrival))]
+        return self._rows
+
+    def __getstate__(self):
+        # Rows are cheap to rebuild, so only the columns travel between processes.
+        state = self.__dict__.copy()
+        state["_rows"] = None
+        return state
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+
+# -------------------------------
+# Streaming Workload Generator
+# -------------------------------
+ARRIVAL_DISTRIBUTIONS = ("uniform", "poisson", "bursty")
+BURST_DISTRIBUTIONS = ("uniform", "pareto", "lognormal")
+
+
+class WorkloadGenerator:
+    """
+    Vectorized workload generator with its own numpy.random.Generator, so generators in
+    different worker processes (or threads) never share random state.
+    Workloads are produced in ProcessTable batches or lazily one Process at a time; arrival
+    times and pids continue across batches, so an unbounded stream can be consumed piecewise.
+    Every column draws from its own child stream of the seed, so the workload for a given seed
+    does not depend on the batch size used to consume it.
+    Times are whole time units like the rest of the simulator.
+
+    Arrival distributions:
+      uniform - inter-arrival times uniform in [1, max_arrival] (same shape as generate_processes)
+      poisson - Poisson process with mean inter-arrival time mean_interarrival
+      bursty  - two-state Markov-modulated Poisson process alternating between busy phases
+                (mean gap burst_interarrival) and quiet phases (mean gap mean_interarrival),
+                switching state with probability switch_prob after each arrival
+    Burst distributions:
+      uniform   - uniform in [1, max_burst]
+      pareto    - heavy-tailed Pareto with shape pareto_shape and minimum pareto_scale
+      lognormal - lognormal with parameters lognormal_mu and lognormal_sigma
+    Heavy-tailed bursts are rounded up to whole time units and capped at burst_cap when given.
+    """
+    def __init__(self, seed=None, arrival="uniform", burst="uniform", max_arrival=4, max_burst=10,
+                 max_priority=3, mean_interarrival=2.5, burst_interarrival=0.25, switch_prob=0.05,
+                 pareto_shape=1.5, pareto_scale=1.0, lognormal_mu=1.0, lognormal_sigma=1.0, burst_cap=None):
+        if arrival not in ARRIVAL_DISTRIBUTIONS:
+            raise ValueError(f"Unknown arrival distribution {arrival!r}, expected one of {ARRIVAL_DISTRIBUTIONS}")
+        if burst not in BURST_DISTRIBUTIONS:
+            raise ValueError(f"Unknown burst distribution {burst!r}, expected one of {BURST_DISTRIBUTIONS}")
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self._gap_rng, self._phase_rng, self._burst_rng, self._priority_rng = (
+            np.random.default_rng(child) for child in self.seed_sequence.spawn(4))
+        self.arrival = arrival
+        self.burst = burst
+        self.max_arrival = max_arrival
+        self.max_burst = max_burst
+        self.max_priority = max_priority
+        self.mean_interarrival = mean_interarrival
+        self.burst_interarrival = burst_interarrival
+        self.switch_prob = switch_prob
+        self.pareto_shape = pareto_shape
+        self.pareto_scale = pareto_scale
+        self.lognormal_mu = lognormal_mu
+        self.lognormal_sigma = lognormal_sigma
+        self.burst_cap = burst_cap
+        # Stream position carried across batches
+        self._clock = 0.0
+        self._next_pid = 1
+        self._busy_phase = False
+
+    def _arrivals(self, n):
+        if self.arrival == "uniform":
+            gaps = self._gap_rng.integers(1, self.max_arrival, size=n, endpoint=True).astype(np.float64)
+        elif self.arrival == "poisson":
+            gaps = self._gap_rng.exponential(self.mean_interarrival, size=n)
+        else:
+            switches = self._phase_rng.random(n) < self.switch_prob
+            busy = (np.cumsum(switches) % 2 == 1) ^ self._busy_phase
+            if n:
+                self._busy_phase = bool(busy[-1])
+            means = np.where(busy, self.burst_interarrival, self.mean_interarrival)
+            gaps = self._gap_rng.exponential(means)
+        times = self._clock + np.cumsum(gaps)
+        if n:
+            self._clock = float(times[-1])
+        # Continuous arrival instants fall into whole time units; several jobs may share one.
+        return np.floor(times).astype(np.int64)
+
+    def _bursts(self, n):
+        if self.burst == "uniform":
+            return self._burst_rng.integers(1, self.max_burst, size=n, endpoint=True)
+        if self.burst == "pareto":
+            bursts = (self._burst_rng.pareto(self.pareto_shape, size=n) + 1.0) * self.pareto_scale
+        else:
+            bursts = self._burst_rng.lognormal(self.lognormal_mu, self.lognormal_sigma, size=n)
+        bursts = np.maximum(np.ceil(bursts), 1)
+        if self.burst_cap is not None:
+            bursts = np.minimum(bursts, self.burst_cap)
+        return bursts.astype(np.int64)
+
+    def next_batch(self, n):
+        """Returns the next n processes of the stream as a ProcessTable."""
+        arrival = self._arrivals(n)
+        burst = self._bursts(n)
+        priority = self._priority_rng.integers(1, self.max_priority, size=n, endpoint=True)
+        pid = np.arange(self._next_pid, self._next_pid + n, dtype=np.int64)
+        self._next_pid += n
+        return ProcessTable(arrival, burst, priority, pid)
+
+    def batches(self, n=None, batch_size=65536):
+        """Yields ProcessTable batches totalling n processes, or forever when n is None."""
+        produced = 0
+        while n is None or produced < n:
+            size = batch_size if n is None else min(batch_size, n - produced)
+            produced += size
+            yield self.next_batch(size)
+
+    def table(self, n):
+        """Returns n processes as a single ProcessTable."""
+        return self.next_batch(n)
+
+    def processes(self, n=None, batch_size=4096):
+        """Lazily yields Process objects, n of them or forever when n is None."""
+        for batch in self.batches(n, batch_size):
+            for pid, arrival, burst, priority in zip(batch.pid.tolist(), batch.arrival.tolist(),
+                                                     batch.burst.tolist(), batch.priority.tolist()):
+                yield Process(f"P{pid}", arrival=arrival, burst=burst, priority=priority)
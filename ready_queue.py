@@ -0,0 +1,367 @@
+import abc
+import heapq
+import itertools
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List
+
+
+class ReadyQueue(abc.ABC):
+    """
+    Base class for the ready queue shared between the arrival process and a scheduler.
+    Subclasses decide the order in which processes are handed out by pop() and must implement
+    push(), pop(), peek(), remove(), __len__() and __iter__().
+    """
+    @abc.abstractmethod
+    def push(self, proc: Any) -> None:
+        """
+        Adds a process to the ready queue.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def pop(self) -> Any:
+        """
+        Removes and returns the next process to run.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def peek(self) -> Any:
+        """
+        Returns the next process to run without removing it.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove(self, proc: Any) -> None:
+        """
+        Removes an arbitrary process from the ready queue.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """
+        Returns the number of queued processes.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over the queued processes, not necessarily in pop() order.
+        """
+        raise NotImplementedError
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def pop_last(self) -> Any:
+        """
+        Removes and returns the process that would run last.
+        This default drains the queue with pop() and pushes the others back in the same order,
+        which keeps their relative order; subclasses override it with a cheaper version.
+        """
+        procs = [self.pop() for _ in range(len(self))]
+        for proc in procs[:-1]:
+            self.push(proc)
+        return procs[-1]
+
+    def try_steal(self) -> bool:
+        """
+        Called by a scheduler whose ready queue is empty, just before it goes idle. A queue that
+        can take work from elsewhere (a work-stealing core) moves a process into itself and
+        returns True; a plain ready queue has nothing to steal.
+        """
+        return False
+
+
+class FifoReadyQueue(ReadyQueue):
+    """
+    First-in first-out ready queue backed by a deque, O(1) push and pop.
+    """
+    def __init__(self) -> None:
+        self._items = deque()
+
+    def push(self, proc: Any) -> None:
+        self._items.append(proc)
+
+    def pop(self) -> Any:
+        return self._items.popleft()
+
+    def pop_last(self) -> Any:
+        return self._items.pop()
+
+    def peek(self) -> Any:
+        return self._items[0]
+
+    def remove(self, proc: Any) -> None:
+        self._items.remove(proc)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+
+class HeapReadyQueue(ReadyQueue):
+    """
+    Binary-heap ready queue handing out the process with the smallest key, O(log n) push and pop.
+    Ties are broken by insertion order, so pop() returns the same process as
+    min(queue, key=key) on a list the processes were appended to in the same order.
+    """
+    def __init__(self, key: Callable[[Any], Any]) -> None:
+        """
+        :param key: Function returning the ordering key of a process. It must not change
+                    while the process is queued.
+        """
+        self.key = key
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()
+
+    def push(self, proc: Any) -> None:
+        heapq.heappush(self._heap, (self.key(proc), next(self._counter), proc))
+
+    def pop(self) -> Any:
+        return heapq.heappop(self._heap)[2]
+
+    def pop_last(self) -> Any:
+        # The largest (key, counter) entry is a leaf; O(n) to find, rare enough for stealing.
+        i = max(range(len(self._heap)), key=self._heap.__getitem__)
+        entry = self._heap[i]
+        last = self._heap.pop()
+        if i < len(self._heap):
+            self._heap[i] = last
+            heapq.heapify(self._heap)
+        return entry[2]
+
+    def peek(self) -> Any:
+        return self._heap[0][2]
+
+    def remove(self, proc: Any) -> None:
+        for i, entry in enumerate(self._heap):
+            if entry[2] is proc:
+                last = self._heap.pop()
+                if i < len(self._heap):
+                    self._heap[i] = last
+                    heapq.heapify(self._heap)
+                return
+        raise ValueError(f"{proc!r} is not in the ready queue")
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (entry[2] for entry in self._heap)
+
+
+class IndexedHeapReadyQueue(ReadyQueue):
+    """
+    Binary-heap ready queue that tracks the position of every process, so membership tests
+    are O(1) and remove() and update() (decrease/increase-key) are O(log n).
+    Ties are broken by insertion order like HeapReadyQueue.
+    """
+    def __init__(self, key: Callable[[Any], Any]) -> None:
+        """
+        :param key: Function returning the ordering key of a process. Call update() after
+                    the key of a queued process changes.
+        """
+        self.key = key
+        self._heap: List[list] = []
+        self._position: Dict[int, int] = {}
+        self._counter = itertools.count()
+
+    def push(self, proc: Any) -> None:
+        if id(proc) in self._position:
+            raise ValueError(f"{proc!r} is already in the ready queue")
+        self._heap.append([self.key(proc), next(self._counter), proc])
+        self._position[id(proc)] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def pop(self) -> Any:
+        proc = self._heap[0][2]
+        self._delete(0)
+        return proc
+
+    def pop_last(self) -> Any:
+        i = max(range(len(self._heap)), key=self._heap.__getitem__)
+        proc = self._heap[i][2]
+        self._delete(i)
+        return proc
+
+    def peek(self) -> Any:
+        return self._heap[0][2]
+
+    def remove(self, proc: Any) -> None:
+        if id(proc) not in self._position:
+            raise ValueError(f"{proc!r} is not in the ready queue")
+        self._delete(self._position[id(proc)])
+
+    def update(self, proc: Any) -> None:
+        """
+        Restores the heap order after the key of a queued process has changed.
+        """
+        i = self._position[id(proc)]
+        self._heap[i][0] = self.key(proc)
+        self._sift_up(i)
+        self._sift_down(self._position[id(proc)])
+
+    def __contains__(self, proc: Any) -> bool:
+        return id(proc) in self._position
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (entry[2] for entry in self._heap)
+
+    def _delete(self, i: int) -> None:
+        entry = self._heap[i]
+        del self._position[id(entry[2])]
+        last = self._heap.pop()
+        if i < len(self._heap):
+            self._heap[i] = last
+            self._position[id(last[2])] = i
+            self._sift_up(i)
+            self._sift_down(self._position[id(last[2])])
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._position[id(heap[i][2])] = i
+        self._position[id(heap[j][2])] = j
+
+    def _sift_up(self, i: int) -> None:
+        heap = self._heap
+        while i > 0:
+            parent = (i - 1) // 2
+            if heap[i] < heap[parent]:
+                self._swap(i, parent)
+                i = parent
+            else:
+                break
+
+    def _sift_down(self, i: int) -> None:
+        heap = self._heap
+        n = len(heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and heap[child] < heap[smallest]:
+                    smallest = child
+            if smallest == i:
+                break
+            self._swap(i, smallest)
+            i = smallest
+
+
+class OrderStatisticReadyQueue(ReadyQueue):
+    """
+    Ready queue ordered by a small non-negative integer key (e.g. remaining time) that can
+    select the k-th smallest process, not just the minimum.
+    A Fenwick tree over the key values counts the queued processes per key, so locating the
+    key group of the k-th process, push() and remove() are O(log K) for K key values.
+    Each key group keeps its processes in insertion order, so select(k) returns the same process
+    as sorted(queue, key=key)[k] on a list the processes were appended to in the same order.
+    Within its group the process is reached by walking from the nearer end, so select(),
+    pop() and pop_last() cost O(log K + min(j, g - j)) for the j-th of g processes sharing
+    a key: O(log K) when keys are mostly distinct or the first or last process of a group is
+    taken, but up to O(n) when many processes share one key.
+    """
+    def __init__(self, key: Callable[[Any], int], max_key: int = 16) -> None:
+        """
+        :param key: Function returning the integer key of a process. It must not change while
+                    the process is queued; call update() after changing it.
+        :param max_key: Initial key capacity, the tree grows when a larger key is pushed.
+        """
+        self.key = key
+        self._capacity = 1
+        while self._capacity <= max_key:
+            self._capacity *= 2
+        self._tree = [0] * (self._capacity + 1)
+        self._groups: Dict[int, Dict[int, Any]] = {}
+        self._key_of: Dict[int, int] = {}
+
+    def push(self, proc: Any) -> None:
+        k = self.key(proc)
+        if k >= self._capacity:
+            self._grow(k)
+        self._groups.setdefault(k, {})[id(proc)] = proc
+        self._key_of[id(proc)] = k
+        self._add(k, 1)
+
+    def pop(self) -> Any:
+        proc = self.select(0)
+        self.remove(proc)
+        return proc
+
+    def pop_last(self) -> Any:
+        proc = self.select(len(self) - 1)
+        self.remove(proc)
+        return proc
+
+    def peek(self) -> Any:
+        return self.select(0)
+
+    def select(self, k: int) -> Any:
+        """
+        Returns the k-th (0-based) process in key order without removing it.
+        """
+        if not 0 <= k < len(self._key_of):
+            raise IndexError("ready queue index out of range")
+        # Descend the Fenwick tree to the largest key whose prefix count is <= k.
+        tree = self._tree
+        position = 0
+        step = self._capacity
+        while step:
+            nxt = position + step
+            if nxt <= self._capacity and tree[nxt] <= k:
+                position = nxt
+                k -= tree[nxt]
+            step //= 2
+        group = self._groups[position]
+        if 2 * k < len(group):
+            return next(itertools.islice(group.values(), k, None))
+        return next(itertools.islice(reversed(group.values()), len(group) - 1 - k, None))
+
+    def remove(self, proc: Any) -> None:
+        k = self._key_of.pop(id(proc), None)
+        if k is None:
+            raise ValueError(f"{proc!r} is not in the ready queue")
+        group = self._groups[k]
+        del group[id(proc)]
+        if not group:
+            del self._groups[k]
+        self._add(k, -1)
+
+    def update(self, proc: Any) -> None:
+        """
+        Moves a queued process to its new key group (e.g. after decrementing its remaining
+        time). Within the new group it ranks after the processes already there.
+        """
+        self.remove(proc)
+        self.push(proc)
+
+    def __contains__(self, proc: Any) -> bool:
+        return id(proc) in self._key_of
+
+    def __len__(self) -> int:
+        return len(self._key_of)
+
+    def __iter__(self) -> Iterator[Any]:
+        for k in sorted(self._groups):
+            yield from self._groups[k].values()
+
+    def _add(self, k: int, delta: int) -> None:
+        i = k + 1
+        while i <= self._capacity:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _grow(self, k: int) -> None:
+        while self._capacity <= k:
+            self._capacity *= 2
+        self._tree = [0] * (self._capacity + 1)
+        for group_key, group in self._groups.items():
+            self._add(group_key, len(group))
@@ -0,0 +1,147 @@
+import glob
+import hashlib
+import json
+import os
+import zipfile
+import zlib
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from process_generation import ProcessTable, SegmentLog
+
+# Default size limit of a result cache directory
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+_code_version = None
+
+
+def source_digest(names) -> str:
+    """
+    Hash of the given source files of the simulator (file names relative to this module's
+    directory), for cache keys that must change whenever that code changes.
+    """
+    digest = hashlib.sha256()
+    for name in sorted(names):
+        digest.update(name.encode())
+        with open(os.path.join(_HERE, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def code_version() -> str:
+    """
+    Hash of the simulator's source files (every module next to this one except the tests), so
+    cached results are invalidated by any change to the code that produced them.
+    """
+    global _code_version
+    if _code_version is None:
+        names = [os.path.basename(path) for path in glob.glob(os.path.join(_HERE, "*.py"))]
+        _code_version = source_digest(name for name in names if not name.startswith("test_"))
+    return _code_version
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of simulation results.
+    An entry is keyed by a hash of the workload columns, the scheduler, its parameters and the
+    code version, and stores the per-job result columns, the completion order, the columns of
+    the run's SegmentLog, the run's console output and its trace events in one
+    uncompressed .npz file. Reading an entry refreshes its modification time, and writing one
+    evicts the least recently used entries until the directory fits in max_bytes.
+    """
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, workload: ProcessTable, scheduler: str, params: Dict[str, Any]) -> str:
+        """
+        Returns the cache key of running scheduler with params on workload.
+        """
+        digest = hashlib.sha256(code_version().encode())
+        for column in (workload.arrival, workload.burst, workload.priority, workload.pid):
+            digest.update(np.ascontiguousarray(column, dtype=np.int64).tobytes())
+        digest.update(json.dumps({"scheduler": scheduler, "params": params}, sort_keys=True, default=repr).encode())
+        return digest.hexdigest()[:32]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def get(self, key: str, workload: ProcessTable):
+        """
+        Returns (table, order, log, events) for a cached run of workload, or None on a miss:
+        a fresh run of workload with the cached results filled in, the completion order as row
+        indices, the captured console output, and the trace events (None if not traced).
+        """
+        path = self._path(key)
+        # A missing, truncated or corrupt entry, or one evicted by another process while it is
+        # being read, is a miss and gets recomputed.
+        try:
+            with np.load(path) as data:
+                table = workload.fresh_run()
+                for column in ("remaining", "start", "completion", "response", "waiting", "turnaround"):
+                    getattr(table, column)[:] = data[column]
+                table.segments = SegmentLog.from_columns(len(table), data["segment_rows"], data["segment_starts"],
+                                                         data["segment_lengths"])
+                order = data["order"]
+                log = str(data["log"])
+                events = None
+                if "events" in data:
+                    records = data["events"]
+                    events = {name: records[name] for name in records.dtype.names}
+            os.utime(path)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile, zlib.error):
+            return None
+        return table, order, log, events
+
+    def put(self, key: str, table: ProcessTable, order, log: str = "",
+            events: Optional[Dict[str, np.ndarray]] = None) -> None:
+        """
+        Stores the results of a run, then evicts least recently used entries over the size limit.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        rows, starts, lengths = table.segments.columns()
+        arrays = {column: getattr(table, column) for column in
+                  ("remaining", "start", "completion", "response", "waiting", "turnaround")}
+        arrays.update(order=np.asarray(order, dtype=np.int64), log=np.array(log), segment_rows=rows,
+                      segment_starts=starts, segment_lengths=lengths)
+        if events is not None:
+            records = np.empty(len(next(iter(events.values()))),
+                               dtype=[(name, column.dtype) for name, column in events.items()])
+            for name, column in events.items():
+                records[name] = column
+            arrays["events"] = records
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Deletes the least recently used entries until the cache fits in max_bytes.
+        """
+        entries = []
+        for path in glob.glob(os.path.join(self.cache_dir, "*.npz")):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        for path in glob.glob(os.path.join(self.cache_dir, "*.npz")):
+            os.remove(path)
+
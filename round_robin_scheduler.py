@@ -2,28 +2,47 @@
 import simpy
 from typing import List, Optional
 
+from ready_queue import ReadyQueue, FifoReadyQueue
+from event_trace import EventTrace, NULL_TRACE, TRACE_INFO, DISPATCH, COMPLETION
+from simulation_events import ArrivalSignal, wait_for_arrival
+
 class RoundRobinScheduler:
     """
     Round Robin (RR) Scheduler.
     This scheduler assigns a fixed time quantum to each process in a cyclic order.
     """
-    def __init__(self, env: simpy.Environment, ready_queue: List, completed: List, total: int, time_quantum: int,
-                 name: str = "Round Robin Scheduler", description: Optional[str] = None) -> None:
+
+    @staticmethod
+    def create_ready_queue() -> ReadyQueue:
+        """
+        Returns the ready queue ordering this scheduler needs.
+        First-in first-out queue, preempted processes rejoin at the back.
+        """
+        return FifoReadyQueue()
+
+    def __init__(self, env: simpy.Environment, ready_queue: ReadyQueue, completed: List, total: int, time_quantum: int,
+                 name: str = "Round Robin Scheduler", description: Optional[str] = None,
+                 arrival_signal: Optional[ArrivalSignal] = None,
+                 tracer: Optional[EventTrace] = None) -> None:
         """
         Initializes the Round Robin scheduler.
         
         :param env: The simulation environment.
-        :param ready_queue: List of processes ready to execute.
+        :param ready_queue: Queue of processes ready to execute, see create_ready_queue().
         :param completed: List to store completed processes.
         :param total: Total number of processes.
         :param time_quantum: Time slice for each process.
         :param name: Name of the scheduler (default is "Round Robin Scheduler").
         :param description: Optional description of the scheduler.
+        :param arrival_signal: Optional signal used to sleep until the next arrival instead of polling.
+        :param tracer: Optional event trace receiving dispatch and completion events (off by default).
         """
         self.env = env
         self.ready_queue = ready_queue
         self.completed = completed
         self.total = total
+        self.arrival_signal = arrival_signal
+        self.tracer = tracer if tracer is not None else NULL_TRACE
         self.time_quantum = time_quantum
         self.process = env.process(self.schedule_process())
         self.name = name
@@ -34,11 +53,11 @@ class RoundRobinScheduler:
         Executes process scheduling logic for Round Robin(RR) Scheduler.
         """
         while len(self.completed) < self.total:
-            if not self.ready_queue:
-                yield self.env.timeout(1)
+            if not self.ready_queue and not self.ready_queue.try_steal():
+                yield wait_for_arrival(self.env, self.arrival_signal)
                 continue
             
-            proc = self.ready_queue.pop(0)
+            proc = self.ready_queue.pop()
             
             if proc.start is None:
                 proc.start = self.env.now
@@ -46,9 +65,10 @@ class RoundRobinScheduler:
 
             start = self.env.now
             exec_time = min(self.time_quantum, proc.remaining)
-            proc.timeline.append((start, exec_time))
+            proc.record_run(start, exec_time)
 
-            print(f"Time {self.env.now}: Process {proc.pid} runs for {exec_time} time units (RR)")
+            if self.tracer.level >= TRACE_INFO:
+                self.tracer.record(self.env.now, proc, DISPATCH, exec_time)
             yield self.env.timeout(exec_time)
             proc.remaining -= exec_time
             
@@ -56,10 +76,11 @@ class RoundRobinScheduler:
                 proc.completion = self.env.now
                 proc.turnaround = proc.completion - proc.arrival
                 proc.waiting = proc.turnaround - proc.burst
-                print(f"Time {self.env.now}: Process {proc.pid} finishes (RR)")
                 self.completed.append(proc)
+                if self.tracer.level >= TRACE_INFO:
+                    self.tracer.record(self.env.now, proc, COMPLETION)
             else:
                 # Re-queue the process if it's not finished.
-                self.ready_queue.append(proc)
+                self.ready_queue.push(proc)
 
 
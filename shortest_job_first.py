@@ -3,28 +3,47 @@
 import simpy
 from typing import List, Optional
 
+from ready_queue import ReadyQueue, HeapReadyQueue
+from event_trace import EventTrace, NULL_TRACE, TRACE_INFO, DISPATCH, COMPLETION
+from simulation_events import ArrivalSignal, wait_for_arrival
+
 
 class ShortestJobFirstScheduler:
     """
     Shortest Job First (SJF) Scheduler (Non-preemptive).
     This scheduler selects the process with the smallest burst time.
     """
-    def __init__(self, env: simpy.Environment, ready_queue: List, completed: List, total: int,
-                 name: str = "Shortest Job First Scheduler", description: Optional[str] = None) -> None:
+
+    @staticmethod
+    def create_ready_queue() -> ReadyQueue:
+        """
+        Returns the ready queue ordering this scheduler needs.
+        Min-heap ordered by burst time.
+        """
+        return HeapReadyQueue(key=lambda p: p.burst)
+
+    def __init__(self, env: simpy.Environment, ready_queue: ReadyQueue, completed: List, total: int,
+                 name: str = "Shortest Job First Scheduler", description: Optional[str] = None,
+                 arrival_signal: Optional[ArrivalSignal] = None,
+                 tracer: Optional[EventTrace] = None) -> None:
         """
         Initializes the SJF scheduler.
         
         :param env: The simulation environment.
-        :param ready_queue: List of processes ready to execute.
+        :param ready_queue: Queue of processes ready to execute, see create_ready_queue().
         :param completed: List to store completed processes.
         :param total: Total number of processes.
         :param name: Name of the scheduler (default is "Shortest Job First Scheduler").
         :param description: Optional description of the scheduler.
+        :param arrival_signal: Optional signal used to sleep until the next arrival instead of polling.
+        :param tracer: Optional event trace receiving dispatch and completion events (off by default).
         """
         self.env = env
         self.ready_queue = ready_queue
         self.completed = completed
         self.total = total
+        self.arrival_signal = arrival_signal
+        self.tracer = tracer if tracer is not None else NULL_TRACE
         self.process = env.process(self.schedule_process())
         self.name = name
         self.description = description or "A scheduler using Shortest Job First (SJF) policy."
@@ -34,23 +53,25 @@ class ShortestJobFirstScheduler:
         Executes process scheduling logic for Shortest Job First(SJF) Scheduler.
         """
         while len(self.completed) < self.total:
-            if not self.ready_queue:
-                yield self.env.timeout(1)
+            if not self.ready_queue and not self.ready_queue.try_steal():
+                yield wait_for_arrival(self.env, self.arrival_signal)
                 continue
             
-            proc = min(self.ready_queue, key=lambda p: p.burst)
-            self.ready_queue.remove(proc)
+            proc = self.ready_queue.pop()
             
             if proc.start is None:
                 proc.start = self.env.now
                 proc.response = proc.start - proc.arrival
-                proc.timeline.append((proc.start, proc.burst))
+                proc.record_run(proc.start, proc.burst)
             
-            print(f"Time {self.env.now}: Process {proc.pid} starts execution for {proc.burst} time units (SJF)")
+            if self.tracer.level >= TRACE_INFO:
+                self.tracer.record(self.env.now, proc, DISPATCH, proc.burst)
             yield self.env.timeout(proc.burst)
             
             proc.completion = self.env.now
             proc.turnaround = proc.completion - proc.arrival
             proc.waiting = proc.start - proc.arrival
             self.completed.append(proc)
+            if self.tracer.level >= TRACE_INFO:
+                self.tracer.record(self.env.now, proc, COMPLETION)
 
@@ -4,21 +4,38 @@ from __future__ import annotations
 from typing import List, Optional
 import simpy
 
+from ready_queue import ReadyQueue, HeapReadyQueue
+from event_trace import EventTrace, NULL_TRACE, TRACE_INFO, DISPATCH, PREEMPT, COMPLETION
+from simulation_events import ArrivalSignal, wait_for_arrival
+
 # SRTF (Preemptive SJF) Scheduler
 class ShortestRemainingTimeFirstScheduler:
     """ Class for Shortest Remaining Time First (SRTF) Scheduler. 
     This scheduler selects the process with the smallest remaining execution time and
       preempts the currently running process if necessary. """
 
-    def __init__(self, env:simpy.Environment, ready_queue: List, completed: List, total: int, 
-                 name: str="SRTF Scheduler", description: Optional[str] = None) -> None:
+
+    @staticmethod
+    def create_ready_queue() -> ReadyQueue:
+        """
+        Returns the ready queue ordering this scheduler needs.
+        Min-heap ordered by remaining time, queued processes do not run so their key is fixed.
+        """
+        return HeapReadyQueue(key=lambda p: p.remaining)
+
+    def __init__(self, env:simpy.Environment, ready_queue: ReadyQueue, completed: List, total: int, 
+                 name: str="SRTF Scheduler", description: Optional[str] = None,
+                 arrival_signal: Optional[ArrivalSignal] = None,
+                 tracer: Optional[EventTrace] = None) -> None:
         """
         Initializes the Shortest Run Time First (SRTF) scheduler.
         
         :param env: The simulation environment.
-        :param ready_queue: List of processes ready to execute.
+        :param ready_queue: Queue of processes ready to execute, see create_ready_queue().
         :param completed: List to store completed processes.
         :param total: Total number of processes.
+        :param arrival_signal: Optional signal used to run until the next arrival instead of re-evaluating every time unit.
+        :param tracer: Optional event trace receiving dispatch and completion events (off by default).
         """
         self.name = name
         self.description = description or " This is Shortest Run Time First Scheduler(SRTF). "
@@ -26,7 +43,10 @@ class ShortestRemainingTimeFirstScheduler:
         self.ready_queue = ready_queue
         self.completed = completed
         self.total = total
+        self.arrival_signal = arrival_signal
+        self.tracer = tracer if tracer is not None else NULL_TRACE
         self.current_proc = None
+        self.dispatch_time = None  # Time the current process was dispatched, its run is logged when it stops
         self.process = env.process(self.schedule_process())
 
 
@@ -34,43 +54,47 @@ class ShortestRemainingTimeFirstScheduler:
          """ Executes class logic for Shortest Run Time First SRTF Scheduler. """
 
          while len(self.completed) < self.total:
-            if not self.ready_queue and self.current_proc is None:
-                yield self.env.timeout(1)
+            if not self.ready_queue and self.current_proc is None and not self.ready_queue.try_steal():
+                yield wait_for_arrival(self.env, self.arrival_signal)
                 continue
-            # Combine current running process (if any) with ready_queue candidates.
-            candidates = self.ready_queue.copy()
-            if self.current_proc:
-                candidates.append(self.current_proc)
-
-            proc = min(candidates, key=lambda p: p.remaining)
-            if proc != self.current_proc:
+            # Switch to the shortest ready process if it does not take longer than the running one
+            # (ties go to the ready process), putting the preempted process back in the ready queue.
+            if self.current_proc is None or (
+                    self.ready_queue and self.ready_queue.peek().remaining <= self.current_proc.remaining):
+                proc = self.ready_queue.pop()
                 if self.current_proc is not None:
-                    self.ready_queue.append(self.current_proc)
+                    self.current_proc.record_run(self.dispatch_time, self.env.now - self.dispatch_time)
+                    self.ready_queue.push(self.current_proc)
+                    if self.tracer.level >= TRACE_INFO:
+                        self.tracer.record(self.env.now, self.current_proc, PREEMPT, self.current_proc.remaining)
 
-                start = self.env.now
+                self.dispatch_time = self.env.now
                 self.current_proc = proc
-                self.current_proc.timeline.append((start, 0))
-
-                if self.current_proc in self.ready_queue:
-                    self.ready_queue.remove(self.current_proc)
 
                 if self.current_proc.start is None:
                     self.current_proc.start = self.env.now
                     self.current_proc.response = self.current_proc.start - self.current_proc.arrival
-                    print(f"Time {self.env.now}: Process {self.current_proc.pid} is now running (Shortest Run Time First)..")
+                if self.tracer.level >= TRACE_INFO:
+                    # The run ends at the next preemption, unknown here, so no run length is recorded.
+                    self.tracer.record(self.env.now, self.current_proc, DISPATCH)
 
-            # Run for one time unit.
-            yield self.env.timeout(1)
-            seg_start, seg_len = self.current_proc.timeline[-1]
-            self.current_proc.timeline[-1] = (seg_start, seg_len + 1)
-            self.current_proc.remaining -= 1
+            # Run for one time unit, or until completion/the next arrival when an arrival signal
+            # is available, since a preemption can only happen when a new process arrives.
+            run_start = self.env.now
+            if self.arrival_signal is None:
+                yield self.env.timeout(1)
+            else:
+                yield self.env.timeout(self.current_proc.remaining) | self.arrival_signal.wait()
+            self.current_proc.remaining -= self.env.now - run_start
 
             # Check if process finished.
             if self.current_proc.remaining == 0:
+                self.current_proc.record_run(self.dispatch_time, self.env.now - self.dispatch_time)
                 self.current_proc.completion = self.env.now
                 self.current_proc.turnaround = self.current_proc.completion - self.current_proc.arrival
                 self.current_proc.waiting = self.current_proc.turnaround - self.current_proc.burst
-                print(f"Time {self.env.now}: Process {self.current_proc.pid} finished (Shortest Run Time First)..")
                 self.completed.append(self.current_proc)
+                if self.tracer.level >= TRACE_INFO:
+                    self.tracer.record(self.env.now, self.current_proc, COMPLETION)
                 self.current_proc = None
 
@@ -0,0 +1,118 @@
+import simpy
+from simpy.events import URGENT
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from event_trace import NULL_TRACE, TRACE_INFO, ARRIVAL, EventTrace
+from process_generation import ProcessTable, ProcessRow
+
+
+class ArrivalSignal:
+    """
+    Wake-up signal shared between the arrival process and a scheduler.
+    Instead of polling the ready queue every time unit, an idle scheduler waits on
+    this signal and is resumed at the exact simulation time a process arrives.
+    """
+    def __init__(self, env: simpy.Environment) -> None:
+        """
+        Initializes the arrival signal.
+
+        :param env: The simulation environment.
+        """
+        self.env = env
+        self._event = env.event()
+
+    def wait(self) -> simpy.Event:
+        """
+        Returns an event that is triggered by the next arrival.
+        """
+        if self._event.triggered:
+            self._event = self.env.event()
+        return self._event
+
+    def notify(self) -> None:
+        """
+        Signals that one or more processes have been added to the ready queue.
+        """
+        if not self._event.triggered:
+            self._event.succeed()
+
+
+def wait_for_arrival(env: simpy.Environment, arrival_signal: Optional[ArrivalSignal]) -> simpy.Event:
+    """
+    Returns the event an idle scheduler should wait on.
+    Sleeps until the next arrival when a signal is available and falls back to
+    polling the ready queue once per time unit otherwise.
+    """
+    if arrival_signal is None:
+        return env.timeout(1)
+    return arrival_signal.wait()
+
+
+class _UrgentTimeout(simpy.Event):
+    """
+    Timeout scheduled with URGENT priority, so it is processed before any ordinary event
+    (scheduler timeouts, arrival signals) due at the same simulation time.
+    """
+    def __init__(self, env: simpy.Environment, delay) -> None:
+        super().__init__(env)
+        self._ok = True
+        self._value = None
+        env.schedule(self, URGENT, delay)
+
+
+def arrival_feeder(env: simpy.Environment, processes: Iterable, ready_queue, arrival_signal: Optional[ArrivalSignal] = None,
+                   tracer: EventTrace = NULL_TRACE):
+    """
+    SimPy process releasing processes into the ready queue at their arrival times.
+    A single feeder walks the processes in arrival order, so only one arrival event is pending
+    at any time regardless of workload size, and processes may come from any iterator, e.g. a
+    workload streamed from disk. Processes sharing a timestamp are released together and the
+    scheduler is notified once. The feeder's wake-ups are urgent so that, as with one arrival
+    process per job, arrivals at time t are in the ready queue before the scheduler runs at t.
+
+    :param env: The simulation environment.
+    :param processes: Processes sorted by arrival time.
+    :param ready_queue: Ready queue the processes are pushed onto.
+    :param arrival_signal: Signal notified after every release, if any.
+    :param tracer: Trace recording the arrivals.
+    """
+    processes = iter(processes)
+    proc = next(processes, None)
+    while proc is not None:
+        if proc.arrival < env.now:
+            raise ValueError(f"Process {proc.pid} arrives at {proc.arrival} but the feeder is at {env.now}; "
+                             "processes must be sorted by arrival time")
+        yield _UrgentTimeout(env, proc.arrival - env.now)
+        now = env.now
+        while proc is not None and proc.arrival == now:
+            ready_queue.push(proc)
+            if tracer.level >= TRACE_INFO:
+                tracer.record(now, proc, ARRIVAL)
+            proc = next(processes, None)
+        if arrival_signal is not None:
+            arrival_signal.notify()
+
+
+def arrivals_in_order(processes, total: Optional[int] = None) -> Tuple[Iterable, int]:
+    """
+    Returns the processes of a workload in arrival order for arrival_feeder, and their number.
+    A ProcessTable is walked through a stable argsort of its arrival column (no sort at all when
+    it is already sorted), creating each row view only when it is released, so a memory-mapped
+    table is never materialized or sorted in Python. Any other iterable is taken to be in arrival
+    order already when total is given; otherwise it is a list, stably sorted by arrival time.
+
+    :param processes: A ProcessTable, an iterable of processes sorted by arrival time, or a list.
+    :param total: Number of processes, required for an already sorted iterable.
+    """
+    if isinstance(processes, ProcessTable):
+        arrival = processes.arrival
+        if len(arrival) < 2 or bool(np.all(arrival[1:] >= arrival[:-1])):
+            order = range(len(arrival))
+        else:
+            order = np.argsort(arrival, kind="stable").tolist()
+        return (ProcessRow(processes, i) for i in order), len(processes)
+    if total is not None:
+        return processes, total
+    return sorted(processes, key=lambda p: p.arrival), len(processes)
@@ -0,0 +1,83 @@
+import numpy as np
+import simpy
+import pytest
+
+from process_generation import WorkloadGenerator
+from first_come_first_serve import FirstComeFirstServeScheduler
+from shortest_job_first import ShortestJobFirstScheduler
+from priority_scheduler import PriorityScheduler
+from round_robin_scheduler import RoundRobinScheduler
+from shortest_remaining_time_first import ShortestRemainingTimeFirstScheduler
+from simulation_events import ArrivalSignal, arrival_feeder, arrivals_in_order
+from Simulator import run_simulation
+
+CASES = [
+    (FirstComeFirstServeScheduler, {}),
+    (ShortestJobFirstScheduler, {}),
+    (PriorityScheduler, {}),
+    (RoundRobinScheduler, {"time_quantum": 3}),
+    (ShortestRemainingTimeFirstScheduler, {}),
+]
+
+
+def simulate(scheduler_class, event_driven, feeder, **kwargs):
+    """Run a bursty workload with many shared arrival times; returns (results, largest event queue)."""
+    processes = WorkloadGenerator(seed=3, arrival="bursty").table(300).fresh_run()
+    env = simpy.Environment()
+    ready_queue = scheduler_class.create_ready_queue()
+    completed = []
+    arrival_signal = ArrivalSignal(env) if event_driven else None
+
+    def arrival(proc):
+        yield env.timeout(proc.arrival - env.now)
+        ready_queue.push(proc)
+        if arrival_signal is not None:
+            arrival_signal.notify()
+
+    if feeder:
+        env.process(arrival_feeder(env, iter(processes), ready_queue, arrival_signal))
+    else:
+        for p in processes:
+            env.process(arrival(p))
+    scheduler_class(env, ready_queue, completed, len(processes), arrival_signal=arrival_signal, **kwargs)
+
+    pending = 0
+    while env.peek() != float("inf"):
+        pending = max(pending, len(env._queue))
+        env.step()
+    results = [(p.pid, p.start, p.completion, p.timeline) for p in completed]
+    return results, pending
+
+
+def test_feeder_matches_one_process_per_job():
+    for scheduler_class, kwargs in CASES:
+        for event_driven in (True, False):
+            expected, per_job_pending = simulate(scheduler_class, event_driven, False, **kwargs)
+            actual, pending = simulate(scheduler_class, event_driven, True, **kwargs)
+            assert actual == expected, scheduler_class.__name__
+            # Only the feeder's next wake-up plus a few scheduler events are ever queued.
+            assert pending < 10 < per_job_pending, scheduler_class.__name__
+
+
+def test_feeder_rejects_unsorted_arrivals():
+    processes = WorkloadGenerator(seed=1).table(3).fresh_run()
+    processes.arrival[:] = [5, 2, 7]
+    env = simpy.Environment()
+    env.process(arrival_feeder(env, processes, FirstComeFirstServeScheduler.create_ready_queue()))
+    with pytest.raises(ValueError):
+        env.run()
+
+
+def test_arrivals_in_order_streams_tables_and_sorted_iterables():
+    table = WorkloadGenerator(seed=1).table(6).fresh_run()
+    table.arrival = np.array([4, 2, 4, 0, 2, 9])
+    arrivals, total = arrivals_in_order(table)
+    assert total == 6
+    assert [row.index for row in arrivals] == [3, 1, 4, 0, 2, 5]
+    assert table._rows is None  # rows are created one at a time by the feeder
+
+    workload = WorkloadGenerator(seed=2).table(50)
+    expected = run_simulation(workload.fresh_run(), RoundRobinScheduler, time_quantum=3)
+    streamed = iter(sorted(workload.fresh_run(), key=lambda p: p.arrival))
+    actual = run_simulation(streamed, RoundRobinScheduler, time_quantum=3, total=len(workload))
+    assert [(p.pid, p.completion) for p in actual] == [(p.pid, p.completion) for p in expected]
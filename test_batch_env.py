@@ -0,0 +1,41 @@
+import numpy as np
+
+from ML import MLSchedulerAgent, run_simulation_ml, scheduler_ml, train_agent
+from process_generation import generate_processes
+from batch_env import BatchSchedulerEnv, run_batch_episodes, train_agent_batched
+
+
+def schedule(completed):
+    return {int(p.pid[1:]) - 1: (p.start, p.completion) for p in completed}
+
+
+def test_single_episodes_match_scheduler_ml_while_learning():
+    simpy_agent = MLSchedulerAgent(epsilon=0.0)
+    batch_agent = MLSchedulerAgent(epsilon=0.0)
+    for seed in range(20):
+        expected = schedule(run_simulation_ml(generate_processes(8, seed=seed), scheduler_ml, simpy_agent))
+        env = BatchSchedulerEnv.from_workloads([generate_processes(8, seed=seed)])
+        run_batch_episodes(batch_agent, env)
+        assert {j: (env.start[0, j], env.completion[0, j]) for j in range(8)} == expected
+        assert np.array_equal(batch_agent.Q, simpy_agent.Q)
+
+
+def test_batched_episodes_match_scheduler_ml_with_a_fixed_policy():
+    trained = MLSchedulerAgent()
+    train_agent(trained, episodes=30, num_procs=20)
+    frozen = MLSchedulerAgent(alpha=0.0, epsilon=0.0)
+    frozen.Q = trained.Q.copy()
+    seeds = range(100, 132)
+    env = BatchSchedulerEnv.from_workloads([generate_processes(20, seed=s) for s in seeds])
+    run_batch_episodes(frozen, env)
+    assert not env.active.any()
+    for b, seed in enumerate(seeds):
+        expected = schedule(run_simulation_ml(generate_processes(20, seed=seed), scheduler_ml, frozen))
+        assert {j: (env.start[b, j], env.completion[b, j]) for j in range(20)} == expected
+
+
+def test_batched_training_updates_agent():
+    agent = MLSchedulerAgent(epsilon=0.5, epsilon_decay=0.99)
+    train_agent_batched(agent, episodes=300, num_procs=5, batch_size=128)
+    assert np.abs(agent.Q).sum() > 0
+    assert np.isclose(agent.epsilon, 0.5 * 0.99 ** 300)
@@ -0,0 +1,19 @@
+from benchmark import _run_case, compare
+
+
+def test_run_case_counts_events_and_decisions():
+    for name in ("fcfs", "srtf", "ml"):
+        result = _run_case(name, 200, 0.9, repeat=1)
+        assert result["events"] > 200
+        assert result["decisions"] >= 200
+        assert result["wall_time"] > 0 and result["peak_rss_mb"] > 0
+
+
+def test_compare_flags_slowdowns_beyond_threshold():
+    baseline = [{"scheduler": "rr", "jobs": 1000, "load": 0.9, "wall_time": 1.0, "events_per_sec": 1000.0},
+                {"scheduler": "rr", "jobs": 100, "load": 0.9, "wall_time": 0.001, "events_per_sec": 1000.0}]
+    within = [dict(baseline[0], wall_time=1.2, events_per_sec=850.0)]
+    slower = [dict(baseline[0], wall_time=1.5, events_per_sec=600.0),
+              dict(baseline[1], wall_time=0.01, events_per_sec=100.0)]
+    assert compare(within, baseline, threshold=0.25) == []
+    assert len(compare(slower, baseline, threshold=0.25)) == 2
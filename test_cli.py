@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+from Simulator import main
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_import_defers_heavy_modules():
+    code = ("import sys, Simulator; "
+            "print(' '.join(m for m in ('simpy', 'matplotlib', 'ML', 'pandas') if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == ""
+
+
+def test_cli_without_plots(capsys):
+    main(["--jobs", "20", "--seed", "3", "--algorithms", "fcfs", "rr", "--quantum", "2", "--sequential",
+          "--quiet", "--no-plots", "--no-result-cache"])
+    output = capsys.readouterr().out
+    assert "Num of processes evaluated: 20" in output
+    assert "FCFS" in output and "Round Robin" in output
+    assert "Generated Processes" not in output
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from ML import MLSchedulerAgent, train_agent
+from Simulator import simulate_sjf, main
+from evaluation import run_sweep, summarize, paired_difference, bootstrap_ci, sweep_workload
+
+
+def test_sweep_rows_and_common_workloads():
+    agent = MLSchedulerAgent()
+    train_agent(agent, episodes=3, num_procs=10)
+    algorithms = ('FCFS', 'SJF', 'Round Robin', 'ML-Based')
+    frame = run_sweep(algorithms, seeds=range(4), loads=(0.5, 1.0), num_jobs=40, agent=agent, parallel=False)
+    assert len(frame) == 4 * 2 * len(algorithms)
+    # Every algorithm runs on the same workload per (seed, load), so the work conserving
+    # policies finish at the same time.
+    makespans = frame[frame.algorithm != 'ML-Based'].groupby(["seed", "load"])["makespan"].nunique()
+    assert (makespans == 1).all()
+    # The closed-form rows match the SimPy schedulers.
+    completed = simulate_sjf(sweep_workload(2, 1.0, 40))
+    row = frame[(frame.algorithm == 'SJF') & (frame.seed == 2) & (frame.load == 1.0)].iloc[0]
+    assert np.isclose(row.mean_waiting, np.mean([p.waiting for p in completed]))
+
+    parallel = run_sweep(algorithms, seeds=range(4), loads=(0.5, 1.0), num_jobs=40, agent=agent, max_workers=2)
+    assert parallel.equals(frame)
+
+    with pytest.raises(ValueError, match="num_jobs"):
+        run_sweep(('SRTF',), seeds=range(2), num_jobs=0, parallel=False)
+
+
+def test_summaries():
+    frame = run_sweep(('FCFS', 'SJF'), seeds=range(30), loads=(0.9,), num_jobs=60, parallel=False)
+    summary = summarize(frame)
+    assert list(summary.index) == [(0.9, 'FCFS'), (0.9, 'SJF')]
+    assert ((summary.ci_low <= summary["mean"]) & (summary["mean"] <= summary.ci_high)).all()
+    assert (summary.seeds == 30).all()
+    difference = paired_difference(frame, 'FCFS').loc[(0.9, 'SJF')]
+    # SJF never waits longer than FCFS on average, and pairing narrows the interval.
+    assert difference.ci_high <= 0
+    assert difference.ci_high - difference.ci_low < summary.loc[(0.9, 'SJF')].ci_high - summary.loc[(0.9, 'SJF')].ci_low
+
+
+def test_bootstrap_ci_covers_mean():
+    values = np.random.default_rng(0).normal(5.0, 1.0, 200)
+    low, high = bootstrap_ci(values, rng=np.random.default_rng(1))
+    assert low < values.mean() < high and high - low < 0.5
+
+
+def test_sweep_cli(tmp_path, capsys):
+    output = tmp_path / "sweep.csv"
+    main(["--sweep", "--seeds", "3", "--loads", "0.8", "--jobs", "20", "--algorithms", "fcfs", "srtf",
+          "--sequential", "--sweep-output", str(output)])
+    assert "Mean Waiting Difference to FCFS" in capsys.readouterr().out
+    assert len(output.read_text().splitlines()) == 1 + 3 * 2
@@ -0,0 +1,50 @@
+import simpy
+
+from process_generation import generate_processes
+from first_come_first_serve import FirstComeFirstServeScheduler
+from shortest_job_first import ShortestJobFirstScheduler
+from priority_scheduler import PriorityScheduler
+from round_robin_scheduler import RoundRobinScheduler
+from shortest_remaining_time_first import ShortestRemainingTimeFirstScheduler
+from simulation_events import ArrivalSignal
+
+
+def simulate(scheduler_class, event_driven, **kwargs):
+    """Run a sparse workload and return (results per pid, number of processed events)."""
+    processes = generate_processes(30, max_arrival=40, max_burst=10, seed=7)
+    env = simpy.Environment()
+    ready_queue = scheduler_class.create_ready_queue()
+    completed = []
+    arrival_signal = ArrivalSignal(env) if event_driven else None
+
+    def arrival(proc):
+        yield env.timeout(proc.arrival - env.now)
+        ready_queue.push(proc)
+        if arrival_signal is not None:
+            arrival_signal.notify()
+
+    for p in processes:
+        env.process(arrival(p))
+    scheduler_class(env, ready_queue, completed, len(processes), arrival_signal=arrival_signal, **kwargs)
+
+    events = 0
+    while env.peek() != float("inf"):
+        env.step()
+        events += 1
+    results = {p.pid: (p.start, p.completion, p.waiting, p.turnaround, p.timeline) for p in completed}
+    return results, events
+
+
+def test_event_driven_matches_polling():
+    cases = [
+        (FirstComeFirstServeScheduler, {}),
+        (ShortestJobFirstScheduler, {}),
+        (PriorityScheduler, {}),
+        (RoundRobinScheduler, {"time_quantum": 3}),
+        (ShortestRemainingTimeFirstScheduler, {}),
+    ]
+    for scheduler_class, kwargs in cases:
+        polled, polled_events = simulate(scheduler_class, False, **kwargs)
+        evented, evented_events = simulate(scheduler_class, True, **kwargs)
+        assert evented == polled, scheduler_class.__name__
+        assert evented_events < polled_events, scheduler_class.__name__
@@ -0,0 +1,57 @@
+import numpy as np
+
+from event_trace import EventTrace, TRACE_OFF, ARRIVAL, DISPATCH, COMPLETION, load_trace, format_event
+from process_generation import generate_processes
+from Simulator import simulate_rr, simulate_srtf
+
+
+def test_trace_records_every_dispatch_and_completion():
+    processes = generate_processes(20, seed=3)
+    tracer = EventTrace(buffer_size=16)
+    completed = simulate_rr(processes, time_quantum=3, tracer=tracer)
+    events = tracer.events()
+    assert np.count_nonzero(events["event"] == ARRIVAL) == len(processes)
+    assert np.count_nonzero(events["event"] == COMPLETION) == len(processes)
+    dispatched = events["value"][events["event"] == DISPATCH].sum()
+    assert dispatched == sum(p.burst for p in completed)
+    assert np.all(np.diff(events["time"]) >= 0)
+
+
+def test_srtf_dispatches_do_not_claim_a_run_length():
+    tracer = EventTrace()
+    simulate_srtf(generate_processes(30, seed=4), tracer=tracer)
+    events = tracer.events()
+    assert not events["value"][events["event"] == DISPATCH].any()
+    assert format_event(4, 7, DISPATCH) == "Time 4: Process P7 is now running."
+    assert format_event(4, 7, DISPATCH, 3, core=1) == "Time 4: Process P7 runs for 3 time units on core 1."
+
+
+def test_ring_buffer_and_file_round_trip(tmp_path):
+    processes = generate_processes(20, seed=3)
+    full = EventTrace()
+    simulate_rr(processes, time_quantum=3, tracer=full)
+    ring = EventTrace(ring_size=10)
+    simulate_rr(processes, time_quantum=3, tracer=ring)
+    path = tmp_path / "rr.trace"
+    on_disk = EventTrace(path=str(path), buffer_size=7)
+    simulate_rr(processes, time_quantum=3, tracer=on_disk)
+    on_disk.close()
+    ring_path = tmp_path / "ring.trace"
+    ring_on_disk = EventTrace(ring_size=10, path=str(ring_path))
+    simulate_rr(processes, time_quantum=3, tracer=ring_on_disk)
+    ring_on_disk.close()
+
+    expected = full.events()
+    tail = ring.events()
+    loaded = load_trace(str(path))
+    loaded_tail = load_trace(str(ring_path))
+    for name in expected:
+        assert np.array_equal(tail[name], expected[name][-10:])
+        assert np.array_equal(loaded[name], expected[name])
+        assert np.array_equal(loaded_tail[name], expected[name][-10:])
+
+
+def test_disabled_trace_records_nothing():
+    tracer = EventTrace(level=TRACE_OFF)
+    simulate_rr(generate_processes(5, seed=1), time_quantum=2, tracer=tracer)
+    assert len(tracer.events()["time"]) == 0
@@ -0,0 +1,50 @@
+import copy
+import simpy
+
+from process_generation import Process, generate_processes
+from first_come_first_serve import FirstComeFirstServeScheduler
+from shortest_job_first import ShortestJobFirstScheduler
+from priority_scheduler import PriorityScheduler
+from simulation_events import ArrivalSignal
+from fast_simulation import fast_simulate
+
+
+def simpy_results(processes, scheduler_class):
+    processes = copy.deepcopy(processes)
+    env = simpy.Environment()
+    ready_queue = scheduler_class.create_ready_queue()
+    completed = []
+    arrival_signal = ArrivalSignal(env)
+
+    def arrival(proc):
+        yield env.timeout(proc.arrival - env.now)
+        ready_queue.push(proc)
+        arrival_signal.notify()
+
+    for p in processes:
+        env.process(arrival(p))
+    scheduler_class(env, ready_queue, completed, len(processes), arrival_signal=arrival_signal)
+    env.run()
+    return [(p.start, p.completion, p.waiting, p.turnaround) for p in processes]
+
+
+def test_fast_simulate_matches_simpy():
+    workloads = [
+        generate_processes(200, seed=1),
+        generate_processes(200, max_arrival=20, seed=2),
+        # Equal arrival times and keys exercise the tie-breaking order.
+        [Process(f"P{i + 1}", arrival=a, burst=b, priority=pr)
+         for i, (a, b, pr) in enumerate([(3, 4, 2), (3, 2, 2), (3, 2, 1), (9, 1, 3), (9, 6, 1), (30, 2, 2)])],
+    ]
+    cases = [
+        ("fcfs", FirstComeFirstServeScheduler),
+        ("sjf", ShortestJobFirstScheduler),
+        ("priority", PriorityScheduler),
+    ]
+    for processes in workloads:
+        for policy, scheduler_class in cases:
+            fast = fast_simulate(processes, policy)
+            expected = simpy_results(processes, scheduler_class)
+            actual = list(zip(fast["start"].tolist(), fast["completion"].tolist(),
+                              fast["waiting"].tolist(), fast["turnaround"].tolist()))
+            assert actual == expected, policy
@@ -0,0 +1,60 @@
+import numpy as np
+
+from metrics import LogHistogram, StreamingMetrics
+from process_generation import WorkloadGenerator
+from round_robin_scheduler import RoundRobinScheduler
+from Simulator import run_simulation, calculate_metrics
+
+
+def test_histogram_percentiles_within_relative_error():
+    values = WorkloadGenerator(seed=4, burst="pareto", pareto_scale=20).table(20000).burst
+    histogram = LogHistogram(sub_bucket_bits=7)
+    for value in values.tolist():
+        histogram.add(value)
+    for q in (1, 50, 95, 99, 99.9, 100):
+        exact = np.percentile(values, q, method="inverted_cdf")
+        assert abs(histogram.percentile(q) - exact) <= exact / 128
+
+
+def test_streaming_metrics_match_completed_list():
+    workload = WorkloadGenerator(seed=9, arrival="poisson").table(2000)
+    completed = run_simulation(workload.fresh_run(), RoundRobinScheduler, time_quantum=3)
+    metrics = run_simulation(workload.fresh_run(), RoundRobinScheduler, time_quantum=3,
+                             completed=StreamingMetrics(window=50))
+
+    assert len(metrics) == len(completed)
+    avg_turnaround, avg_wait = calculate_metrics(completed)
+    summary = metrics.summary()
+    assert np.isclose(summary["turnaround_mean"], avg_turnaround)
+    assert np.isclose(summary["waiting_mean"], avg_wait)
+    assert np.isclose(summary["waiting_std"], np.std([p.waiting for p in completed], ddof=1))
+    assert summary["turnaround_max"] == max(p.turnaround for p in completed)
+
+    windows = metrics.windows()
+    assert windows["throughput"].sum() * 50 == len(completed)
+    assert np.isclose(windows["utilization"].sum() * 50, workload.burst.sum())
+    assert windows["utilization"].max() <= 1
+
+
+def test_window_memory_is_bounded():
+    def run(workload, max_windows):
+        return run_simulation(workload.fresh_run(), RoundRobinScheduler, time_quantum=3,
+                              completed=StreamingMetrics(window=20, max_windows=max_windows))
+
+    overloaded = WorkloadGenerator(seed=9, arrival="poisson").table(3000)
+    full, bounded = run(overloaded, 10**6), run(overloaded, 16)
+    assert len(bounded._completions) <= 16 and len(bounded._busy) <= 16
+    assert bounded.summary() == full.summary()
+    for name in ("start", "throughput", "utilization"):
+        assert np.array_equal(bounded.windows()[name], full.windows()[name][-16:])
+
+    # Every job completes within 16 windows of running here, so folding loses no busy time, and
+    # the small per-window counts are held exactly, so the percentiles over all windows match.
+    light = WorkloadGenerator(seed=9, arrival="poisson", mean_interarrival=8).table(3000)
+    full, bounded = run(light, 10**6), run(light, 16)
+    for name in ("throughput", "utilization"):
+        values = full.windows()[name]
+        for q in (5, 50, 95, 100):
+            expected = np.percentile(values, q, method="inverted_cdf")
+            assert np.isclose(bounded.window_percentile(name, q), expected)
+            assert np.isclose(full.window_percentile(name, q), expected)
@@ -0,0 +1,142 @@
+import random
+
+import numpy as np
+
+from ML import MLReadyQueue, MLSchedulerAgent, StateDiscretizer, train_agent_cached, agent_cache_key
+from ML import train_agent, run_simulation_ml, scheduler_ml, scheduler_ml_greedy
+from ML import ExperienceReplay, LinearQAgent
+from process_generation import generate_processes, ProcessTable
+from Simulator import simulate_ml
+
+
+def test_ready_queue_matches_recomputed_features_and_order():
+    rng = random.Random(4)
+    queue = MLReadyQueue()
+    reference = []
+    for proc in generate_processes(300, seed=9):
+        if reference and rng.random() < 0.45:
+            victim = rng.choice(reference)
+            reference.remove(victim)
+            queue.remove(victim)
+        else:
+            proc.remaining = rng.randint(1, proc.burst)
+            reference.append(proc)
+            queue.push(proc)
+        assert list(queue) == sorted(reference, key=lambda p: p.remaining)
+        if reference:
+            assert queue.sum_remaining == sum(p.remaining for p in reference)
+            assert queue.sum_arrival == sum(p.arrival for p in reference)
+            assert queue.min_remaining() == min(p.remaining for p in reference)
+            k = rng.randrange(len(reference))
+            assert queue.select(k) is sorted(reference, key=lambda p: p.remaining)[k]
+
+
+def test_agent_save_and_load(tmp_path):
+    agent = MLSchedulerAgent(alpha=0.3, gamma=0.8, discretizer=StateDiscretizer(max_queue=4, rem_edges=(3, 6)))
+    agent.Q[:] = np.random.default_rng(1).random(agent.Q.shape)
+    path = str(tmp_path / "agent.npz")
+    agent.save(path)
+    for mmap_mode in (None, "r", "c"):
+        loaded = MLSchedulerAgent.load(path, mmap_mode=mmap_mode)
+        assert np.array_equal(loaded.Q, agent.Q)
+        assert (loaded.alpha, loaded.gamma) == (0.3, 0.8)
+        assert loaded.discretizer.rem_edges == (3, 6) and loaded.num_actions == 4
+    # Copy-on-write maps can be trained further without touching the file.
+    loaded.Q[0, 0, 0, 0, 0] = -1
+    assert MLSchedulerAgent.load(path).Q[0, 0, 0, 0, 0] == agent.Q[0, 0, 0, 0, 0]
+
+
+def test_cached_training_is_reused(tmp_path, capsys):
+    cache_dir = str(tmp_path)
+    first = MLSchedulerAgent()
+    path = train_agent_cached(first, episodes=3, num_procs=5, cache_dir=cache_dir)
+    assert "Training completed." in capsys.readouterr().out
+
+    second = MLSchedulerAgent()
+    assert train_agent_cached(second, episodes=3, num_procs=5, cache_dir=cache_dir) == path
+    assert "Loaded trained agent" in capsys.readouterr().out
+    assert np.array_equal(second.Q, first.Q)
+    # The loaded agent continues the trained agent's exploration stream, so even an evaluation
+    # that keeps exploring does not depend on whether the cache was warm.
+    workload = generate_processes(60, seed=7)
+    cold, warm = (simulate_ml(workload, agent, learn=True) for agent in (first, second))
+    assert [(p.pid, p.completion) for p in cold] == [(p.pid, p.completion) for p in warm]
+
+    # Any change to the hyperparameters or the training setup gets its own entry.
+    keys = {agent_cache_key(MLSchedulerAgent(), 3, 5), agent_cache_key(MLSchedulerAgent(alpha=0.2), 3, 5),
+            agent_cache_key(MLSchedulerAgent(), 4, 5), agent_cache_key(MLSchedulerAgent(), 3, 6)}
+    assert len(keys) == 4
+
+
+def test_greedy_policy_matches_choose_action():
+    agent = MLSchedulerAgent(epsilon=0.0)
+    agent.Q[:] = np.random.default_rng(2).random(agent.Q.shape)
+    policy = agent.freeze()
+    for state in np.ndindex(*agent.discretizer.shape):
+        expected = agent.choose_action(state, state[0])
+        assert policy.actions[state] == (-1 if expected is None else expected)
+
+
+def test_greedy_inference_matches_frozen_training_path():
+    agent = MLSchedulerAgent()
+    train_agent(agent, episodes=10, num_procs=20)
+    workload = ProcessTable.from_processes(generate_processes(200, seed=12))
+    greedy = run_simulation_ml(workload.fresh_run(), scheduler_ml_greedy, agent.freeze())
+    # Without exploration and with a zero learning rate, scheduler_ml makes the same decisions.
+    frozen = MLSchedulerAgent(alpha=0.0, epsilon=0.0)
+    frozen.Q = agent.Q.copy()
+    learning = run_simulation_ml(workload.fresh_run(), scheduler_ml, frozen)
+    assert ([(p.pid, p.completion, p.timeline) for p in greedy] ==
+            [(p.pid, p.completion, p.timeline) for p in learning])
+    assert np.array_equal(frozen.Q, agent.Q)
+
+
+def test_experience_replay_wraps_around():
+    replay = ExperienceReplay(capacity=4, state_size=2)
+    for i in range(6):
+        replay.add((i, i), i, -i, (i + 1, i + 1))
+    assert replay.size == 4
+    assert sorted(replay.actions) == [2, 3, 4, 5]
+    states, actions, rewards, next_states = replay.sample(np.random.default_rng(0), 16)
+    assert (states[:, 0] == actions).all() and (rewards == -actions).all() and (next_states[:, 0] == actions + 1).all()
+
+
+def test_linear_agent_update_reduces_td_error():
+    agent = LinearQAgent(alpha=0.5, gamma=0.0, seed=1)
+    rng = np.random.default_rng(3)
+    states = np.column_stack([np.full(64, 4.0), rng.random((64, 4))])
+    actions = rng.integers(0, 4, 64)
+    rewards = 2.0 * states[:, 2] - actions
+
+    def error():
+        return np.abs(rewards - (agent.W[actions] * np.column_stack([np.ones(64), states[:, 1:]])).sum(axis=1)).mean()
+
+    before = error()
+    for _ in range(300):
+        agent.update(states, actions, rewards, states)
+    assert error() < 0.2 * before
+
+
+def test_linear_agent_training_is_reproducible():
+    weights = []
+    for seed in (None, None, 7):
+        agent = LinearQAgent(seed=seed)
+        agent.train(episodes=10, num_procs=30)
+        weights.append(agent.W)
+    assert np.abs(weights[0]).sum() > 0
+    assert np.array_equal(weights[0], weights[1]) and np.array_equal(weights[0], weights[2])
+
+
+def test_linear_agent_trains_through_scheduler_ml():
+    agent = LinearQAgent(seed=0)
+    agent.train(episodes=20, num_procs=30)
+    assert agent.replay.size > agent.batch_size and np.abs(agent.W).sum() > 0
+    workload = ProcessTable.from_processes(generate_processes(100, seed=5))
+    completed = run_simulation_ml(workload.fresh_run(), scheduler_ml_greedy, agent.freeze())
+    assert len(completed) == 100
+    # The frozen policy picks what the agent picks without exploration.
+    agent.epsilon = 0.0
+    queue = MLReadyQueue()
+    for proc in generate_processes(12, seed=8):
+        queue.push(proc)
+    assert agent.freeze().choose(queue, 50) == agent.choose_action(agent.get_state(queue, 50), len(queue))
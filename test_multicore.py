@@ -0,0 +1,101 @@
+import pytest
+import simpy
+
+from process_generation import generate_processes
+from first_come_first_serve import FirstComeFirstServeScheduler
+from round_robin_scheduler import RoundRobinScheduler
+from shortest_remaining_time_first import ShortestRemainingTimeFirstScheduler
+from Simulator import run_simulation, fresh_copy, run_comparison
+from ML import MLSchedulerAgent, run_simulation_ml, scheduler_ml
+from multicore import PLACEMENTS, core_metrics, build_cores
+from ready_queue import FifoReadyQueue
+
+
+def results(completed):
+    return sorted((p.pid, p.start, p.completion, p.timeline) for p in completed)
+
+
+def test_one_core_matches_single_cpu_simulation():
+    workload = generate_processes(60, seed=3)
+    single = run_simulation(fresh_copy(workload), ShortestRemainingTimeFirstScheduler)
+    for placement in PLACEMENTS:
+        one_core = run_simulation(fresh_copy(workload), ShortestRemainingTimeFirstScheduler, num_cores=1,
+                                  placement=placement)
+        assert results(one_core) == results(single)
+
+
+@pytest.mark.parametrize("placement", PLACEMENTS)
+@pytest.mark.parametrize("scheduler_class, kwargs", [
+    (FirstComeFirstServeScheduler, {}),
+    (ShortestRemainingTimeFirstScheduler, {}),
+    (RoundRobinScheduler, {'time_quantum': 2}),
+])
+def test_cores_run_every_process_without_overlap(placement, scheduler_class, kwargs):
+    workload = generate_processes(120, seed=5)
+    cores = []
+    completed = run_simulation(fresh_copy(workload), scheduler_class, num_cores=4, placement=placement,
+                               cores=cores, **kwargs)
+    assert len(completed) == len(workload)
+    assert len(cores) == 4
+    # Every time unit of work ran on exactly one core, and no core ran two processes at once.
+    assert sum(length for core in cores for _, length, _ in core.timeline()) == sum(p.burst for p in workload)
+    for core in cores:
+        timeline = core.timeline()
+        assert all(a[0] + a[1] <= b[0] for a, b in zip(timeline, timeline[1:]))
+    for proc in completed:
+        timeline = sorted(proc.timeline)
+        assert all(a[0] + a[1] <= b[0] for a, b in zip(timeline, timeline[1:]))
+
+
+def test_more_cores_finish_sooner():
+    workload = generate_processes(200, seed=8)
+    makespan = {}
+    for num_cores in (1, 2, 8):
+        completed = run_simulation(fresh_copy(workload), FirstComeFirstServeScheduler, num_cores=num_cores)
+        makespan[num_cores] = max(p.completion for p in completed)
+    assert makespan[1] > makespan[2] > makespan[8]
+
+
+def test_work_stealing_balances_round_robin_placement():
+    workload = generate_processes(200, seed=9)
+    cores = []
+    run_simulation(fresh_copy(workload), FirstComeFirstServeScheduler, num_cores=4, placement="work_stealing",
+                   cores=cores)
+    metrics = core_metrics(cores)
+    assert metrics['stolen'] > 0
+    assert metrics['imbalance'] < 0.1
+    assert ((0 < metrics['utilization']) & (metrics['utilization'] <= 1)).all()
+
+
+def test_stealing_is_explicit_and_takes_the_tail():
+    cores = build_cores(simpy.Environment(), 2, "work_stealing", FifoReadyQueue)[1]
+    jobs = generate_processes(3, seed=1)
+    for job in jobs:
+        cores[1].push(job)
+    # Queries never move jobs.
+    assert not cores[0] and len(cores[0]) == 0 and len(cores[1]) == 3
+    assert cores[0].try_steal() and cores[0].stolen == 1
+    assert list(cores[0]) == [jobs[2]] and list(cores[1]) == jobs[:2]
+    # A core with work of its own does not steal.
+    assert not cores[0].try_steal()
+
+
+def test_ml_scheduler_runs_on_multiple_cores():
+    workload = generate_processes(50, seed=4)
+    cores = []
+    completed = run_simulation_ml(fresh_copy(workload), scheduler_ml, MLSchedulerAgent(epsilon=0.0), num_cores=3,
+                                  placement="least_loaded", cores=cores)
+    assert len(completed) == len(workload)
+    assert sum(len(core.dispatches) for core in cores) == sum(p.burst for p in workload)
+
+
+def test_comparison_on_multiple_cores():
+    workload = generate_processes(30, seed=2)
+    results = run_comparison(workload, algorithms=('SJF', 'Round Robin'), parallel=False, echo=False,
+                             num_cores=2, placement="work_stealing")
+    assert all(len(completed) == len(workload) for completed in results.values())
+
+
+def test_unknown_placement():
+    with pytest.raises(ValueError):
+        run_simulation(generate_processes(5, seed=1), FirstComeFirstServeScheduler, num_cores=2, placement="random")
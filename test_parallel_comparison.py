@@ -0,0 +1,16 @@
+from process_generation import generate_processes
+from Simulator import run_comparison, calculate_metrics
+
+
+def summary(results):
+    return {alg: [(p.pid, p.start, p.completion, p.waiting, p.turnaround, p.timeline) for p in procs]
+            for alg, procs in results.items()}
+
+
+def test_parallel_comparison_matches_sequential():
+    workload = generate_processes(40, seed=11)
+    parallel = run_comparison(workload, ml_episodes=3, max_workers=3, echo=False)
+    sequential = run_comparison(workload, ml_episodes=3, parallel=False, echo=False)
+    assert list(parallel) == list(sequential)
+    assert summary(parallel) == summary(sequential)
+    assert calculate_metrics(parallel['SRTF']) == calculate_metrics(sequential['SRTF'])
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from ML import MLSchedulerAgent, train_agent_parallel
+
+
+def test_single_worker_matches_sequential_training():
+    sequential = MLSchedulerAgent(alpha=0.1, gamma=0.9, epsilon=0.2)
+    sequential.train(episodes=12, num_procs=5)
+    parallel = MLSchedulerAgent(alpha=0.1, gamma=0.9, epsilon=0.2)
+    train_agent_parallel(parallel, episodes=12, num_procs=5, workers=1, sync_interval=12, merge="delta")
+    assert np.allclose(parallel.Q, sequential.Q)
+    assert parallel.epsilon == pytest.approx(sequential.epsilon)
+
+
+def test_parallel_training_is_reproducible():
+    tables = []
+    for _ in range(2):
+        agent = MLSchedulerAgent(alpha=0.1, gamma=0.9, epsilon=0.2)
+        train_agent_parallel(agent, episodes=10, num_procs=5, workers=2, sync_interval=3)
+        tables.append(agent.Q)
+    assert np.array_equal(tables[0], tables[1])
+
+
+def test_epsilon_decays_once_per_episode_with_several_workers():
+    sequential = MLSchedulerAgent(alpha=0.1, gamma=0.9, epsilon=0.2, epsilon_decay=0.9)
+    sequential.train(episodes=10, num_procs=5)
+    parallel = MLSchedulerAgent(alpha=0.1, gamma=0.9, epsilon=0.2, epsilon_decay=0.9)
+    train_agent_parallel(parallel, episodes=10, num_procs=5, workers=4, sync_interval=2)
+    assert parallel.epsilon == pytest.approx(sequential.epsilon)
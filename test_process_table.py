@@ -0,0 +1,79 @@
+import copy
+
+import pytest
+import simpy
+
+from process_generation import Process, ProcessTable, SegmentLog, generate_processes
+from round_robin_scheduler import RoundRobinScheduler
+from shortest_remaining_time_first import ShortestRemainingTimeFirstScheduler
+from simulation_events import ArrivalSignal
+from Simulator import simulate_rr
+
+
+def run(processes, scheduler_class, **kwargs):
+    env = simpy.Environment()
+    ready_queue = scheduler_class.create_ready_queue()
+    completed = []
+    arrival_signal = ArrivalSignal(env)
+
+    def arrival(proc):
+        yield env.timeout(proc.arrival - env.now)
+        ready_queue.push(proc)
+        arrival_signal.notify()
+
+    for p in processes:
+        env.process(arrival(p))
+    scheduler_class(env, ready_queue, completed, len(processes), arrival_signal=arrival_signal, **kwargs)
+    env.run()
+    return [(p.pid, p.start, p.completion, p.waiting, p.turnaround, p.response, p.timeline) for p in completed]
+
+
+def test_rows_behave_like_processes():
+    processes = generate_processes(50, seed=5)
+    table = ProcessTable.from_processes(processes)
+    for scheduler_class, kwargs in ((ShortestRemainingTimeFirstScheduler, {}), (RoundRobinScheduler, {"time_quantum": 2})):
+        expected = run(copy.deepcopy(processes), scheduler_class, **kwargs)
+        assert run(table.fresh_run(), scheduler_class, **kwargs) == expected
+
+
+def test_from_processes_rejects_what_the_columns_cannot_hold():
+    for processes in ([Process("P1", 0.5, 3)], [Process("P1", 0, 2.5)], [Process("P1", 0, 2, priority=float("inf"))],
+                      [Process("job-1", 0, 2)], [Process("P01", 0, 2)]):
+        with pytest.raises(ValueError):
+            ProcessTable.from_processes(processes)
+    table = ProcessTable.from_processes([Process("P7", 2.0, 3), Process("P3", 0, 1.0)])
+    assert table.pid.tolist() == [7, 3] and table.arrival.tolist() == [2, 0] and table.burst.tolist() == [3, 1]
+
+    # The simulator keeps such workloads as Process objects instead of truncating them.
+    processes = [Process("job-1", 0, 2.5), Process("job-2", 0.5, 1)]
+    completed = simulate_rr(processes, time_quantum=1)
+    assert sorted((p.pid, p.completion) for p in completed) == [("job-1", 3.5), ("job-2", 2.0)]
+    assert processes[0].completion is None
+
+
+def test_fresh_run_shares_workload_but_not_state():
+    table = ProcessTable.from_processes(generate_processes(5, seed=1))
+    first = table.fresh_run()
+    first[0].remaining = 0
+    first[0].start = 3
+    first[0].record_run(3, 1)
+    second = table.fresh_run()
+    assert second.arrival is table.arrival
+    assert second[0].remaining == second[0].burst
+    assert second[0].start is None
+    assert second[0].timeline == []
+
+
+def test_segment_log_merges_contiguous_runs():
+    table = ProcessTable.from_processes(generate_processes(3, seed=2))
+    for row, start, length in ((0, 0, 2), (1, 2, 1), (0, 3, 1), (0, 4, 1), (2, 5, 0), (1, 5, 2), (1, 7, 1)):
+        table[row].record_run(start, length)
+    assert [table[i].timeline for i in range(3)] == [[(0, 2), (3, 2)], [(2, 1), (5, 3)], []]
+    assert len(table.segments) == 4 and table.segments.runs == 7
+
+    restored = SegmentLog.from_columns(3, *table.segments.columns())
+    assert [restored.timeline(i) for i in range(3)] == [table[i].timeline for i in range(3)]
+    restored.append(0, 5, 1)
+    assert restored.timeline(0) == [(0, 2), (3, 3)]
+    empty = SegmentLog.from_columns(3, *SegmentLog(3).columns())
+    assert len(empty) == 0 and empty.timeline(1) == []
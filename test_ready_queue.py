@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from ready_queue import ReadyQueue, FifoReadyQueue, HeapReadyQueue, IndexedHeapReadyQueue, OrderStatisticReadyQueue
+
+
+class Job:
+    def __init__(self, pid, remaining):
+        self.pid = pid
+        self.remaining = remaining
+
+
+def test_fifo_order():
+    queue = FifoReadyQueue()
+    jobs = [Job(i, 0) for i in range(5)]
+    for job in jobs:
+        queue.push(job)
+    assert [queue.pop() for _ in range(len(jobs))] == jobs
+    assert not queue
+
+
+def test_heaps_match_list_min():
+    rng = random.Random(3)
+    for queue_class in (HeapReadyQueue, IndexedHeapReadyQueue):
+        queue = queue_class(key=lambda p: p.remaining)
+        reference = []
+        for step in range(500):
+            if reference and rng.random() < 0.4:
+                expected = min(reference, key=lambda p: p.remaining)
+                reference.remove(expected)
+                assert queue.pop() is expected
+            else:
+                job = Job(step, rng.randint(1, 5))
+                reference.append(job)
+                queue.push(job)
+            assert len(queue) == len(reference)
+
+
+def test_indexed_heap_remove_and_update():
+    queue = IndexedHeapReadyQueue(key=lambda p: p.remaining)
+    jobs = [Job(i, r) for i, r in enumerate([5, 3, 8, 1, 9])]
+    for job in jobs:
+        queue.push(job)
+    queue.remove(jobs[3])
+    assert jobs[3] not in queue
+    assert queue.peek() is jobs[1]
+    jobs[2].remaining = 0
+    queue.update(jobs[2])
+    assert [queue.pop().pid for _ in range(len(queue))] == [2, 1, 0, 4]
+
+
+def test_pop_last_matches_generic_version():
+    rng = random.Random(7)
+    factories = (FifoReadyQueue, lambda: HeapReadyQueue(key=lambda p: p.remaining),
+                 lambda: IndexedHeapReadyQueue(key=lambda p: p.remaining),
+                 lambda: OrderStatisticReadyQueue(key=lambda p: p.remaining))
+    for factory in factories:
+        fast, generic = factory(), factory()
+        for step in range(200):
+            job = Job(step, rng.randint(1, 5))
+            fast.push(job)
+            generic.push(job)
+            if rng.random() < 0.3:
+                assert fast.pop_last() is ReadyQueue.pop_last(generic)
+        assert [fast.pop() for _ in range(len(fast))] == [generic.pop() for _ in range(len(generic))]
+
+
+def test_incomplete_ready_queue_cannot_be_instantiated():
+    class PushOnly(ReadyQueue):
+        def push(self, proc):
+            pass
+
+    with pytest.raises(TypeError):
+        ReadyQueue()
+    with pytest.raises(TypeError):
+        PushOnly()
+    FifoReadyQueue()
@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+
+from Simulator import run_comparison
+from event_trace import TRACE_INFO
+from process_generation import ProcessTable, WorkloadGenerator
+from result_cache import ResultCache
+
+
+def schedule(completed):
+    return [(p.pid, p.start, p.completion, p.waiting, p.response, list(p.timeline)) for p in completed]
+
+
+def test_cached_runs_match_fresh_runs(tmp_path, capsys):
+    workload = WorkloadGenerator(seed=5).table(40)
+    algorithms = ('FCFS', 'SRTF', 'Round Robin')
+    kwargs = dict(algorithms=algorithms, time_quantum=2, parallel=False, trace_level=TRACE_INFO, num_cores=2)
+    fresh = run_comparison(workload, **kwargs)
+    fresh_output = capsys.readouterr().out
+
+    first = run_comparison(workload, result_cache_dir=str(tmp_path), **kwargs)
+    capsys.readouterr()
+    assert len(os.listdir(tmp_path)) == len(algorithms)
+    cached = run_comparison(workload, result_cache_dir=str(tmp_path), **kwargs)
+    assert capsys.readouterr().out == fresh_output
+    for alg in algorithms:
+        assert schedule(first[alg]) == schedule(fresh[alg]) == schedule(cached[alg])
+
+
+def test_key_covers_workload_and_parameters(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    workload = WorkloadGenerator(seed=1).table(10)
+    other = ProcessTable(workload.arrival, workload.burst + 1, workload.priority, workload.pid)
+    keys = {cache.key(workload, 'Round Robin', {'time_quantum': 2}),
+            cache.key(workload, 'Round Robin', {'time_quantum': 3}),
+            cache.key(workload, 'SRTF', {'time_quantum': 2}),
+            cache.key(other, 'Round Robin', {'time_quantum': 2})}
+    assert len(keys) == 4
+    assert cache.key(workload, 'SRTF', {'a': 1, 'b': 2}) == cache.key(workload, 'SRTF', {'b': 2, 'a': 1})
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    workload = WorkloadGenerator(seed=2).table(200)
+    table = workload.fresh_run()
+    for i in range(len(workload)):
+        table[i].record_run(i, 1)
+    cache = ResultCache(str(tmp_path))
+    cache.put("a", table, np.arange(len(workload)))
+    size = os.path.getsize(tmp_path / "a.npz")
+    cache.max_bytes = 2 * size
+    cache.put("b", table, np.arange(len(workload)))
+    os.utime(tmp_path / "a.npz", ns=(0, 0))
+    os.utime(tmp_path / "b.npz", ns=(1, 1))
+    assert cache.get("a", workload) is not None
+    cache.put("c", table, np.arange(len(workload)))
+    assert sorted(os.listdir(tmp_path)) == ["a.npz", "c.npz"]
+    assert cache.get("b", workload) is None
+
+
+def test_corrupt_or_vanishing_entries_are_misses(tmp_path, monkeypatch):
+    workload = WorkloadGenerator(seed=3).table(20)
+    cache = ResultCache(str(tmp_path))
+    cache.put("a", workload.fresh_run(), np.arange(len(workload)))
+    path = tmp_path / "a.npz"
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+    assert cache.get("a", workload) is None
+    path.write_bytes(b"PK\x03\x04" + bytes(64))
+    assert cache.get("a", workload) is None
+
+    # Evicted by another process between reading the entry and refreshing its time.
+    cache.put("a", workload.fresh_run(), np.arange(len(workload)))
+
+    def evicted(path, *args, **kwargs):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, "utime", evicted)
+    assert cache.get("a", workload) is None
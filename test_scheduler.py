@@ -11,13 +11,13 @@ for p in processes:
 
 print("\nRunning FCFS Simulation:")
 env = simpy.Environment()
-ready_queue = []
+ready_queue = FirstComeFirstServeScheduler.create_ready_queue()
 completed = []
 
 # Arrival process
 def arrival(env, proc, ready_queue):
     yield env.timeout(proc.arrival - env.now)
-    ready_queue.append(proc)
+    ready_queue.push(proc)
     print(f"Time {env.now}: Process {proc.pid} arrives.")
 
 # Spawn arrival processes
@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pytest
+
+from process_generation import ProcessTable
+from round_robin_scheduler import RoundRobinScheduler
+from Simulator import run_simulation
+from trace_replay import load_job_trace
+
+JOBS = [
+    {"arrival": 5, "burst": 3, "priority": 2, "tenant": "a"},
+    {"arrival": 1, "burst": 2.5, "priority": 1, "tenant": "b"},
+    {"arrival": 5, "burst": 1, "tenant": "a"},
+    {"arrival": 0.7, "burst": 4, "priority": 3},
+    {"arrival": 9, "burst": 2, "priority": 1, "tenant": "c"},
+]
+
+
+def write_trace(tmp_path, name, jobs=JOBS):
+    path = tmp_path / name
+    if name.endswith(".jsonl"):
+        path.write_text("".join(json.dumps(job) + "\n" for job in jobs))
+    else:
+        lines = ["arrival,burst,priority,tenant"]
+        lines += [f"{j['arrival']},{j['burst']},{j.get('priority', '')},{j.get('tenant', '')}" for j in jobs]
+        path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("name", ["jobs.jsonl", "jobs.csv"])
+def test_trace_is_sorted_validated_and_cached(tmp_path, name):
+    path = write_trace(tmp_path, name)
+    table = load_job_trace(path, chunk_size=2)
+    assert table.arrival.tolist() == [0, 1, 5, 5, 9]
+    assert table.burst.tolist() == [4, 3, 3, 1, 2]
+    assert table.priority.tolist() == [3, 1, 2, 0, 1]
+    assert table.pid.tolist() == [4, 2, 1, 3, 5]
+    assert [table.tenants[t] for t in table.tenant] == ["", "b", "a", "a", "c"]
+
+    cached = load_job_trace(path)
+    assert isinstance(cached.arrival.base, np.memmap) and not cached.arrival.flags.writeable
+    assert np.array_equal(cached.burst, table.burst)
+
+    reference = ProcessTable(table.arrival, table.burst, table.priority, table.pid)
+    replayed = run_simulation(cached.fresh_run(), RoundRobinScheduler, time_quantum=2)
+    expected = run_simulation(reference, RoundRobinScheduler, time_quantum=2)
+    assert [(p.pid, p.completion) for p in replayed] == [(p.pid, p.completion) for p in expected]
+
+
+def test_cache_is_rebuilt_when_log_changes(tmp_path):
+    path = write_trace(tmp_path, "jobs.jsonl")
+    old = load_job_trace(path)
+    assert len(old) == 5
+    write_trace(tmp_path, "jobs.jsonl", JOBS[:3])
+    assert len(load_job_trace(path)) == 3
+    # Tables loaded from the previous cache keep their columns, the rebuild does not touch them.
+    assert old.arrival.tolist() == [0, 1, 5, 5, 9]
+    assert old.burst.tolist() == [4, 3, 3, 1, 2]
+
+
+def test_invalid_records_are_rejected(tmp_path):
+    path = write_trace(tmp_path, "bad.jsonl", JOBS + [{"arrival": 3, "burst": 0}])
+    with pytest.raises(ValueError, match="Row 6"):
+        load_job_trace(path)
+    path = write_trace(tmp_path, "missing.jsonl", [{"arrival": 3}])
+    with pytest.raises(ValueError, match="burst"):
+        load_job_trace(path)
+    # Malformed, infinite or fractional priorities are errors too, only empty ones default to 0.
+    for name, priority in (("word.csv", "high"), ("word.jsonl", "high"), ("inf.csv", "inf"),
+                           ("fraction.csv", "1.5"), ("fraction.jsonl", 1.5)):
+        path = write_trace(tmp_path, name, JOBS[:2] + [{"arrival": 3, "burst": 1, "priority": priority}])
+        with pytest.raises(ValueError, match="Row 3: priority"):
+            load_job_trace(path)
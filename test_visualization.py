@@ -0,0 +1,40 @@
+import matplotlib.image
+import numpy as np
+
+from process_generation import generate_processes
+from Simulator import fresh_copy, simulate_fcfs, simulate_rr
+from visualization import gantt_segments, gantt_occupancy, visualize_gantt, visualize_metrics
+
+
+def test_occupancy_matches_per_time_unit_count():
+    procs = simulate_rr(generate_processes(50, seed=6), time_quantum=2)
+    rows, starts, lengths, pids = gantt_segments(procs)
+    end = float((starts + lengths).max())
+    # Integer segments on one-unit buckets, one row per band: occupancy is exactly 0 or 1.
+    expected = np.zeros((len(pids), int(end)))
+    for row, start, length in zip(rows, starts, lengths):
+        expected[row, int(start):int(start + length)] = 1
+    exact = gantt_occupancy(rows, starts, lengths, len(pids), end, max_rows=len(pids), max_buckets=int(end))
+    assert np.allclose(exact, expected)
+
+    # Five rows per band and fractional bucket widths keep the total busy time.
+    coarse = gantt_occupancy(rows, starts, lengths, len(pids), end, max_rows=10, max_buckets=7)
+    assert coarse.shape == (10, 7)
+    assert ((coarse >= 0) & (coarse <= 1 + 1e-9)).all()
+    assert np.isclose((coarse * 5 * end / 7).sum(), lengths.sum())
+
+
+def test_gantt_renders_headless(tmp_path):
+    workload = fresh_copy(generate_processes(300, seed=2))
+    results = {'FCFS': simulate_fcfs(workload), 'Round Robin': simulate_rr(workload, time_quantum=3)}
+    serial, parallel = tmp_path / "serial.png", tmp_path / "parallel.png"
+    visualize_gantt(results, path=str(serial), show=False)
+    visualize_gantt(results, path=str(parallel), parallel=True, max_workers=2)
+    assert matplotlib.image.imread(str(serial)).shape[:2] == (400, 1200)
+    assert matplotlib.image.imread(str(parallel)).shape[:2] == (400, 1200)
+
+
+def test_metrics_chart_renders_headless(tmp_path):
+    path = tmp_path / "metrics.png"
+    visualize_metrics({'FCFS': {'turnaround': 3.0, 'wait': 1.0}}, path=str(path), show=False)
+    assert path.exists()
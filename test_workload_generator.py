@@ -0,0 +1,29 @@
+import itertools
+import numpy as np
+
+from process_generation import WorkloadGenerator
+
+
+def test_stream_is_independent_of_batch_size():
+    for arrival in ("uniform", "poisson", "bursty"):
+        whole = WorkloadGenerator(seed=5, arrival=arrival, burst="pareto").table(1000)
+        parts = list(WorkloadGenerator(seed=5, arrival=arrival, burst="pareto").batches(1000, batch_size=300))
+        for column in ("pid", "arrival", "burst", "priority"):
+            assert np.array_equal(getattr(whole, column), np.concatenate([getattr(p, column) for p in parts]))
+
+
+def test_generated_values_are_valid_time_units():
+    for arrival in ("uniform", "poisson", "bursty"):
+        for burst in ("uniform", "pareto", "lognormal"):
+            table = WorkloadGenerator(seed=1, arrival=arrival, burst=burst, burst_cap=50).table(5000)
+            assert np.all(np.diff(table.arrival) >= 0)
+            assert table.burst.min() >= 1 and table.burst.max() <= 50
+            assert table.priority.min() >= 1 and table.priority.max() <= 3
+
+
+def test_lazy_processes_match_batches():
+    lazy = list(itertools.islice(WorkloadGenerator(seed=2).processes(), 10))
+    table = WorkloadGenerator(seed=2).table(10)
+    assert [p.pid for p in lazy] == [f"P{i}" for i in range(1, 11)]
+    assert [p.arrival for p in lazy] == table.arrival.tolist()
+    assert [p.burst for p in lazy] == table.burst.tolist()
@@ -0,0 +1,194 @@
+import json
+import os
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from process_generation import ProcessTable
+
+# Columns of a job-submission log; arrival and burst are required
+TRACE_COLUMNS = ("arrival", "burst", "priority", "tenant")
+_NUMERIC_COLUMNS = ("pid", "arrival", "burst", "priority", "tenant")
+_CACHE_VERSION = 3
+
+
+# -------------------------------
+# Replayed Workload
+# -------------------------------
+class TraceTable(ProcessTable):
+    """
+    ProcessTable replayed from a job log, with the submitting tenant of every job.
+    tenant holds indices into tenants, the tenant names in order of first appearance.
+    Columns loaded from the binary cache are read-only memory maps.
+    """
+    def __init__(self, arrival, burst, priority=None, pid=None, tenant=None, tenants=("",)):
+        super().__init__(arrival, burst, priority, pid)
+        self.tenant = np.zeros(len(self.arrival), dtype=np.int64) if tenant is None else np.asarray(tenant)
+        self.tenants = list(tenants)
+
+    def fresh_run(self):
+        return TraceTable(self.arrival, self.burst, self.priority, self.pid, self.tenant, self.tenants)
+
+
+# -------------------------------
+# Streaming Parser
+# -------------------------------
+def iter_trace_chunks(path: str, chunk_size: int = 65536) -> Iterator[pd.DataFrame]:
+    """
+    Yields the records of a .jsonl or .csv job log as DataFrames of at most chunk_size rows,
+    so the whole log is never held in memory.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        reader = pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+    elif extension == ".csv":
+        reader = pd.read_csv(path, chunksize=chunk_size)
+    else:
+        raise ValueError(f"Unsupported trace format {extension!r}, expected .jsonl or .csv")
+    with reader:
+        yield from reader
+
+
+def _validate_chunk(frame: pd.DataFrame, first_row: int, tenant_codes: Dict[str, int]) -> Dict[str, np.ndarray]:
+    """
+    Validates one chunk and converts it to int64 columns. Arrival times are rounded down and
+    bursts up to whole time units; empty or absent priorities default to 0 and missing tenants
+    to "". Any other value that is not a finite number, or a priority that is not an integer,
+    is rejected with its row number.
+    """
+    for column in ("arrival", "burst"):
+        if column not in frame:
+            raise ValueError(f"Trace is missing the required column {column!r}")
+    columns = {}
+    for column in ("arrival", "burst", "priority"):
+        if column not in frame:
+            columns[column] = np.zeros(len(frame), dtype=np.int64)
+            continue
+        raw = frame[column]
+        values = pd.to_numeric(raw, errors="coerce").to_numpy(dtype=np.float64)
+        if column == "priority":
+            # Only a genuinely empty cell defaults to 0; malformed and infinite values are errors.
+            empty = raw.isna().to_numpy() | raw.astype(str).str.strip().eq("").to_numpy()
+            values = np.where(empty, 0.0, values)
+        bad = np.flatnonzero(~np.isfinite(values))
+        if len(bad):
+            raise ValueError(f"Row {first_row + bad[0]}: {column} is missing or not a finite number")
+        if column == "priority":
+            bad = np.flatnonzero(values != np.floor(values))
+            if len(bad):
+                raise ValueError(f"Row {first_row + bad[0]}: priority must be an integer")
+        columns[column] = values
+    bad = np.flatnonzero(columns["arrival"] < 0)
+    if len(bad):
+        raise ValueError(f"Row {first_row + bad[0]}: negative arrival time")
+    bad = np.flatnonzero(columns["burst"] <= 0)
+    if len(bad):
+        raise ValueError(f"Row {first_row + bad[0]}: burst time must be positive")
+    columns["arrival"] = np.floor(columns["arrival"]).astype(np.int64)
+    columns["burst"] = np.ceil(columns["burst"]).astype(np.int64)
+    columns["priority"] = np.asarray(columns["priority"]).astype(np.int64)
+
+    names = frame["tenant"].fillna("").astype(str) if "tenant" in frame else pd.Series([""] * len(frame))
+    for name in names.unique():
+        tenant_codes.setdefault(name, len(tenant_codes))
+    columns["tenant"] = names.map(tenant_codes).to_numpy(dtype=np.int64)
+    # pid is the 1-based record number in the log
+    columns["pid"] = np.arange(first_row, first_row + len(frame), dtype=np.int64)
+    return columns
+
+
+# -------------------------------
+# Binary Columnar Cache
+# -------------------------------
+def _source_stamp(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {"version": _CACHE_VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def build_trace_cache(path: str, cache_dir: str, chunk_size: int = 65536) -> None:
+    """
+    Parses the log at path chunk by chunk into one .npy file per column in cache_dir, sorted by
+    arrival time (stable, so simultaneous submissions keep their log order). Chunks are appended
+    to raw column files first, so memory use is bounded by the chunk size plus one sort index.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    meta_path = os.path.join(cache_dir, "meta.json")
+    if os.path.exists(meta_path):
+        os.remove(meta_path)  # the cache only counts as complete once meta.json is written
+    raw_paths = {column: os.path.join(cache_dir, f"{column}.raw") for column in _NUMERIC_COLUMNS}
+    raw_files = {column: open(raw_path, "wb") for column, raw_path in raw_paths.items()}
+    tenant_codes = {}
+    count = 0
+    is_sorted = True
+    last_arrival = -1
+    try:
+        for frame in iter_trace_chunks(path, chunk_size):
+            columns = _validate_chunk(frame, count + 1, tenant_codes)
+            arrival = columns["arrival"]
+            if len(arrival):
+                is_sorted = is_sorted and arrival[0] >= last_arrival and bool(np.all(arrival[1:] >= arrival[:-1]))
+                last_arrival = int(arrival[-1])
+            for column, raw_file in raw_files.items():
+                columns[column].tofile(raw_file)
+            count += len(arrival)
+    finally:
+        for raw_file in raw_files.values():
+            raw_file.close()
+
+    order = None
+    if not is_sorted:
+        arrival = np.fromfile(raw_paths["arrival"], dtype=np.int64)
+        order = np.argsort(arrival, kind="stable")
+        del arrival
+    for column, raw_path in raw_paths.items():
+        source = np.memmap(raw_path, dtype=np.int64, mode="r", shape=(count,)) if count else np.empty(0, np.int64)
+        # Written to a temporary file and moved into place, so tables still memory-mapping the
+        # previous cache keep their (unlinked) columns instead of seeing them rewritten.
+        path_npy = os.path.join(cache_dir, f"{column}.npy")
+        tmp_path = f"{path_npy}.{os.getpid()}.tmp"
+        target = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.int64, shape=(count,))
+        for start in range(0, count, chunk_size):
+            stop = min(start + chunk_size, count)
+            target[start:stop] = source[start:stop] if order is None else source[order[start:stop]]
+        target.flush()
+        del source, target
+        os.replace(tmp_path, path_npy)
+        os.remove(raw_path)
+
+    meta = dict(_source_stamp(path), count=count, tenants=list(tenant_codes))
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+
+
+def load_job_trace(path: str, cache_dir: Optional[str] = None, chunk_size: int = 65536) -> TraceTable:
+    """
+    Loads a .jsonl or .csv job-submission log (fields arrival, burst and optionally priority
+    and tenant) as a TraceTable sorted by arrival time.
+    The first load converts the log into a binary columnar cache (by default next to the log,
+    in <path>.cache); later loads memory-map the cached columns, so replays start without
+    parsing and without reading the trace into memory. The cache is rebuilt whenever the log's
+    size or modification time changes.
+    """
+    cache_dir = cache_dir or f"{path}.cache"
+    meta_path = os.path.join(cache_dir, "meta.json")
+    meta = None
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        stamp = _source_stamp(path)
+        if any(meta.get(key) != value for key, value in stamp.items()):
+            meta = None
+    if meta is None:
+        build_trace_cache(path, cache_dir, chunk_size)
+        with open(meta_path) as f:
+            meta = json.load(f)
+
+    columns = {}
+    for column in _NUMERIC_COLUMNS:
+        if meta["count"]:
+            columns[column] = np.load(os.path.join(cache_dir, f"{column}.npy"), mmap_mode="r")
+        else:
+            columns[column] = np.empty(0, dtype=np.int64)
+    return TraceTable(columns["arrival"], columns["burst"], columns["priority"], columns["pid"],
+                      columns["tenant"], meta["tenants"] or [""])
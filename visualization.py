@@ -0,0 +1,221 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PolyCollection
+
+# Resolution of saved figures; the pixel budget of a Gantt panel follows from it
+DPI = 100
+
+# Size of one Gantt panel in inches
+GANTT_PANEL_SIZE = (12, 2)
+
+
+# -------------------------------
+# Backend Selection
+# -------------------------------
+def batch_mode() -> bool:
+    """
+    Whether figures can only be saved, not shown: matplotlib uses a non-interactive backend
+    or, on a POSIX system, there is no display to show them on.
+    """
+    if matplotlib.get_backend().lower() in ("agg", "pdf", "ps", "svg", "cairo", "template"):
+        return True
+    return os.name == "posix" and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def use_batch_backend() -> None:
+    """
+    Switches matplotlib to the non-interactive Agg backend, so plotting never blocks or opens windows.
+    """
+    if matplotlib.get_backend().lower() != "agg":
+        plt.switch_backend("Agg")
+
+
+def _finish(fig, path: str, show: bool) -> None:
+    """
+    Saves fig to path, then shows it unless running in batch mode.
+    """
+    fig.savefig(path, dpi=DPI)
+    if show and not batch_mode():
+        plt.show()
+    plt.close(fig)
+
+
+# -------------------------------
+# Metrics Chart
+# -------------------------------
+def visualize_metrics(results_dict, path: str = 'scheduling_metrics.png', show: bool = True):
+    """Create bar charts for average turnaround time and average wait time."""
+    if not show or batch_mode():
+        use_batch_backend()
+    algorithms = list(results_dict.keys())
+    avg_turnaround_times = [results_dict[alg]['turnaround'] for alg in algorithms]
+    avg_wait_times = [results_dict[alg]['wait'] for alg in algorithms]
+
+    # Create figure with two subplots
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+    # Plot average turnaround time
+    ax1.bar(algorithms, avg_turnaround_times)
+    ax1.set_title('Average Turnaround Time')
+    ax1.set_ylabel('Time Units')
+    ax1.tick_params(axis='x', rotation=45)
+
+    # Plot average wait time
+    ax2.bar(algorithms, avg_wait_times)
+    ax2.set_title('Average Wait Time')
+    ax2.set_ylabel('Time Units')
+    ax2.tick_params(axis='x', rotation=45)
+
+    fig.tight_layout()
+    _finish(fig, path, show)
+
+
+# -------------------------------
+# Gantt Chart
+# -------------------------------
+def gantt_segments(procs) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Flattens the timelines of procs into (rows, starts, lengths, pids): one array entry per
+    executed segment, with processes assigned to rows in PID order. Rows of one ProcessTable
+    are read straight from the columns of its SegmentLog.
+    """
+    ordered = sorted(procs, key=lambda p: int(p.pid[1:]))
+    table = getattr(ordered[0], "table", None) if ordered else None
+    if table is not None and all(getattr(p, "table", None) is table for p in ordered):
+        rank = np.full(len(table), -1, dtype=np.int64)
+        rank[[p.index for p in ordered]] = np.arange(len(ordered))
+        rows, starts, lengths = table.segments.columns()
+        rows = rank[rows]
+        # Keep the given processes, grouped by row; the log is in time order within a row.
+        keep = np.flatnonzero(rows >= 0)
+        keep = keep[np.argsort(rows[keep], kind="stable")]
+        return rows[keep], starts[keep].astype(np.float64), lengths[keep].astype(np.float64), [p.pid for p in ordered]
+    counts = np.array([len(p.timeline) for p in ordered], dtype=np.int64)
+    rows = np.repeat(np.arange(len(ordered), dtype=np.int64), counts)
+    segments = np.array([segment for p in ordered for segment in p.timeline], dtype=np.float64).reshape(-1, 2)
+    return rows, segments[:, 0], segments[:, 1], [p.pid for p in ordered]
+
+
+def gantt_occupancy(rows: np.ndarray, starts: np.ndarray, lengths: np.ndarray, num_rows: int, end: float,
+                    max_rows: int, max_buckets: int) -> np.ndarray:
+    """
+    Downsamples Gantt segments into a (bands, buckets) grid over [0, end): every band groups
+    ceil(num_rows / max_rows) consecutive rows and every bucket covers end / max_buckets time
+    units. Each cell holds the fraction of its rows' time spent executing, in [0, 1].
+    """
+    rows_per_band = -(-num_rows // max_rows)
+    num_bands = -(-num_rows // rows_per_band)
+    width = end / max_buckets
+    bands = rows // rows_per_band
+    ends = starts + lengths
+    first = np.minimum((starts // width).astype(np.int64), max_buckets - 1)
+    last = np.minimum((ends // width).astype(np.int64), max_buckets - 1)
+
+    busy = np.zeros((num_bands, max_buckets + 1), dtype=np.float64)
+    single = first == last
+    np.add.at(busy, (bands[single], first[single]), lengths[single])
+    # Segments spanning several buckets: partial first and last buckets, and full buckets in
+    # between added through a difference array.
+    multi = ~single
+    b, f, l = bands[multi], first[multi], last[multi]
+    np.add.at(busy, (b, f), (f + 1) * width - starts[multi])
+    np.add.at(busy, (b, l), ends[multi] - l * width)
+    full = np.zeros_like(busy)
+    np.add.at(full, (b, f + 1), width)
+    np.add.at(full, (b, l), -width)
+    busy += np.cumsum(full, axis=1)
+
+    band_rows = np.full(num_bands, rows_per_band, dtype=np.float64)
+    band_rows[-1] = num_rows - rows_per_band * (num_bands - 1)
+    return busy[:, :max_buckets] / (width * band_rows[:, None])
+
+
+def _draw_gantt_panel(ax, alg: str, segments, end: float, max_rows: int, max_buckets: int) -> None:
+    """
+    Draws one algorithm's Gantt panel as a single artist: a collection of one rectangle per
+    segment, or an occupancy image when there are more rows or time units than pixels.
+    """
+    rows, starts, lengths, pids = segments
+    num_rows = len(pids)
+    if num_rows > max_rows or end > max_buckets:
+        occupancy = gantt_occupancy(rows, starts, lengths, num_rows, end, max_rows, max_buckets)
+        # Colors scale to the busiest cell, as a band of processes is rarely busy all the time.
+        ax.imshow(occupancy, aspect='auto', interpolation='antialiased', origin='lower', cmap='Blues',
+                  vmin=0, vmax=max(occupancy.max(), 1e-9), extent=(0, end, 0, num_rows))
+        ax.set_ylim(0, num_rows)
+        ax.set_ylabel(f"{alg}\n(process rows)")
+    else:
+        # Rectangle corners for every segment, row r spanning y in [10r, 10r + 9] as before.
+        x0, x1 = starts, starts + lengths
+        y0, y1 = rows * 10.0, rows * 10.0 + 9
+        verts = np.stack([np.column_stack([x0, y0]), np.column_stack([x0, y1]),
+                          np.column_stack([x1, y1]), np.column_stack([x1, y0])], axis=1)
+        ax.add_collection(PolyCollection(verts, facecolors='tab:blue', edgecolors='none'))
+        ax.set_ylim(0, max(num_rows * 10, 1))
+        ax.set_yticks([row * 10 + 4 for row in range(num_rows)])
+        ax.set_yticklabels(pids)
+        ax.set_ylabel(alg)
+    ax.set_xlim(0, end)
+
+
+def _render_gantt_panel(alg: str, segments, end: float, max_rows: int, max_buckets: int,
+                        last: bool) -> np.ndarray:
+    """
+    Renders one Gantt panel off-screen, normally inside a worker process, and returns it as an
+    RGBA pixel array.
+    """
+    use_batch_backend()
+    fig, ax = plt.subplots(figsize=GANTT_PANEL_SIZE, dpi=DPI)
+    _draw_gantt_panel(ax, alg, segments, end, max_rows, max_buckets)
+    if last:
+        ax.set_xlabel("Time")
+    fig.tight_layout()
+    fig.canvas.draw()
+    image = np.asarray(fig.canvas.buffer_rgba()).copy()
+    plt.close(fig)
+    return image
+
+
+def visualize_gantt(results_dict, path: str = 'gantt_chart.png', show: bool = True, parallel: bool = False,
+                    max_workers: Optional[int] = None, max_rows: Optional[int] = None,
+                    max_buckets: Optional[int] = None):
+    """
+    results_dict: { 'FCFS': [proc1,proc2...], 'SJF': [...], ... }
+    each proc has a timeline of (start, duration) segments, see gantt_segments.
+
+    Every panel is drawn as a single collection. When a panel has more processes than
+    max_rows or more time units than max_buckets (by default its height and width in pixels),
+    rows and time are aggregated into an occupancy image instead. With parallel=True the
+    panels are rendered in worker processes and stacked into one image; that figure is only
+    saved, not shown. Nothing is shown in batch mode (show=False or no display), where the
+    non-interactive Agg backend is used.
+    """
+    if not show or parallel or batch_mode():
+        use_batch_backend()
+    max_rows = max_rows or GANTT_PANEL_SIZE[1] * DPI
+    max_buckets = max_buckets or GANTT_PANEL_SIZE[0] * DPI
+    segments = {alg: gantt_segments(procs) for alg, procs in results_dict.items()}
+    # Shared time axis over all panels
+    end = max((float((s[1] + s[2]).max()) for s in segments.values() if len(s[1])), default=1.0)
+
+    n = len(results_dict)
+    if parallel:
+        args = [(alg, segs, end, max_rows, max_buckets, i == n - 1) for i, (alg, segs) in enumerate(segments.items())]
+        workers = max_workers or min(n, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            panels = list(pool.map(_render_gantt_panel, *zip(*args)))
+        plt.imsave(path, np.concatenate(panels, axis=0))
+        return
+
+    fig, axes = plt.subplots(n, 1, figsize=(GANTT_PANEL_SIZE[0], GANTT_PANEL_SIZE[1] * n), sharex=True)
+    if n == 1: axes = [axes]
+    for ax, (alg, segs) in zip(axes, segments.items()):
+        _draw_gantt_panel(ax, alg, segs, end, max_rows, max_buckets)
+    axes[-1].set_xlabel("Time")
+    fig.tight_layout()
+    _finish(fig, path, show)